@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark end-to-end de WindowAutomation contra a calculadora stand-in.
+
+Executa ``run_automation`` contra ``calculator_app.py`` (Tk) sob Xvfb e
+registra fórmulas/segundo e latência por etapa.
+
+Uso:
+    python benchmarks/bench_calculator.py --rounds 5
+
+Requisitos no Linux: xvfb, xdotool e xclip (usado pelo pyperclip).
+"""
+
+import argparse
+import asyncio
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+from typing import Dict, List
+
+from common import EXAMPLES_PATH, print_table, save_report, summarize, virtual_display
+
+CALCULATOR_SCRIPT = EXAMPLES_PATH / "calculator_app.py"
+
+
+class XdotoolWindow:
+    """Janela X11 com a interface mínima de pygetwindow usada pela automação."""
+
+    def __init__(self, window_id: str, title: str):
+        self.window_id = window_id
+        self.title = title
+
+    def activate(self) -> None:
+        """Ativar janela (sem window manager, apenas foca)."""
+        activated = subprocess.run(
+            ["xdotool", "windowactivate", "--sync", self.window_id], capture_output=True
+        )
+        if activated.returncode != 0:
+            subprocess.run(["xdotool", "windowfocus", "--sync", self.window_id], check=True)
+
+    def close(self) -> None:
+        """Fechar janela."""
+        subprocess.run(["xdotool", "windowkill", self.window_id], check=False)
+
+
+def _get_windows_with_title(title: str) -> List[XdotoolWindow]:
+    """Equivalente a ``pygetwindow.getWindowsWithTitle`` via xdotool."""
+    found = subprocess.run(
+        ["xdotool", "search", "--name", title], capture_output=True, text=True
+    )
+    windows = []
+    for window_id in found.stdout.split():
+        name = subprocess.run(
+            ["xdotool", "getwindowname", window_id], capture_output=True, text=True
+        ).stdout.strip()
+        if title in name:
+            windows.append(XdotoolWindow(window_id, name))
+    return windows
+
+
+def install_x11_window_backend() -> None:
+    """Registrar backend xdotool no lugar de pygetwindow (sem suporte a Linux)."""
+    if not shutil.which("xdotool"):
+        raise RuntimeError(
+            "xdotool não encontrado - instale com: sudo apt-get install xdotool"
+        )
+
+    backend = types.ModuleType("pygetwindow")
+    backend.getWindowsWithTitle = _get_windows_with_title
+    backend.Win32Window = XdotoolWindow
+    sys.modules["pygetwindow"] = backend
+
+
+def run_benchmark(rounds: int) -> Dict:
+    """Executar ``run_automation`` repetidamente e coletar métricas."""
+    from calculator_app import evaluate_expression
+    from window_automation import AutomationConfig, WindowAutomation
+
+    step_latencies: List[float] = []
+    round_times: List[float] = []
+    formulas = 0
+    mismatches: List[Dict] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for round_number in range(1, rounds + 1):
+            config = AutomationConfig(
+                output_dir=Path(tmp),
+                app_command=[sys.executable, str(CALCULATOR_SCRIPT)],
+            )
+            automation = WindowAutomation(config)
+
+            start = time.perf_counter()
+            result = asyncio.run(automation.run_automation())
+            round_times.append(time.perf_counter() - start)
+
+            if not result["success"]:
+                raise RuntimeError(f"Rodada {round_number} falhou: {result.get('error')}")
+
+            for step in result["results"]:
+                formulas += 1
+                step_latencies.append(step.get("execution_time", 0.0))
+                expected = evaluate_expression(step.get("formula", ""))
+                if step.get("result") != expected:
+                    mismatches.append(
+                        {
+                            "formula": step.get("formula"),
+                            "got": step.get("result"),
+                            "expected": expected,
+                        }
+                    )
+
+    calc_time = sum(step_latencies)
+    total_time = sum(round_times)
+
+    return {
+        "rounds": rounds,
+        "formulas": formulas,
+        "formulas_per_second": round(formulas / calc_time, 3) if calc_time else 0.0,
+        "end_to_end_formulas_per_second": round(formulas / total_time, 3)
+        if total_time
+        else 0.0,
+        "step_latency": summarize(step_latencies),
+        "round_time": summarize(round_times),
+        "mismatches": mismatches,
+    }
+
+
+def main() -> None:
+    """Ponto de entrada do benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=3, help="Execuções de run_automation")
+    args = parser.parse_args()
+
+    with virtual_display():
+        if sys.platform.startswith("linux"):
+            install_x11_window_backend()
+        report = run_benchmark(args.rounds)
+
+    print_table(
+        "Calculadora stand-in",
+        [
+            {"fórmulas": report["formulas"], "fórmulas/s": report["formulas_per_second"]},
+            {"fórmulas/s (e2e)": report["end_to_end_formulas_per_second"]},
+            {"latência/etapa": report["step_latency"]},
+            {"divergências": len(report["mismatches"])},
+        ],
+    )
+    print(f"\n💾 Relatório: {save_report('calculator', report)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark: extração de resultados em uma chamada vs. loop find_element.
+
+Compara ``WebAutomation._extract_search_results`` (especificação declarativa
+avaliada com um único ``execute_script``) com o loop anterior de
+``find_element``/``.text``/``get_attribute`` em uma página local no formato
+dos resultados do Google.
+
+Uso:
+    python benchmarks/bench_extraction.py --page-results 10 --repeat 20
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from common import (
+    CommandCounter,
+    headless_automation,
+    local_page,
+    print_table,
+    save_report,
+    summarize,
+)
+
+RESULT_TEMPLATE = """
+<div class="g">
+  <div class="yuRUbf">
+    <a href="https://example.com/{i}"><h3 class="LC20lb">Resultado {i}</h3></a>
+  </div>
+  <div class="VwiC3b">Descrição do resultado {i} com algum texto de exemplo.</div>
+</div>
+"""
+
+
+def build_page(count: int) -> str:
+    """Gerar página com ``count`` resultados."""
+    body = "".join(RESULT_TEMPLATE.format(i=i) for i in range(count))
+    return f"<html><body><div id='search'>{body}</div></body></html>"
+
+
+def legacy_extract(driver, limit: int) -> List[Dict]:
+    """Loop original (um round-trip por find_element/.text/get_attribute)."""
+    results = []
+    result_elements = []
+    for selector in ["div.g", "[data-ved] h3..", ".yuRUbf", ".tF2Cxc", "[jscontroller] h3.."]:
+        try:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                result_elements = elements
+                break
+        except Exception:
+            continue
+
+    for i, element in enumerate(result_elements[:limit]):
+        fields = {}
+        for name, selectors, attribute in [
+            ("title", ["h3", ".LC20lb", "[role='heading']", ".DKV0Md"], None),
+            ("link", ["a", ".yuRUbf a", "h3 a", "[href]"], "href"),
+            ("snippet", [".VwiC3b", "[data-sncf]", ".s3v9rd", ".st", "[data-snhf]"], None),
+        ]:
+            value = ""
+            for selector in selectors:
+                try:
+                    elem = element.find_element(By.CSS_SELECTOR, selector)
+                    value = elem.get_attribute(attribute) if attribute else elem.text
+                    if value:
+                        break
+                except NoSuchElementException:
+                    continue
+            fields[name] = value
+        results.append({"position": i + 1, **fields})
+    return results
+
+
+def measure(fn, driver, repeat: int) -> Dict:
+    """Medir latência e round-trips de uma função de extração."""
+    latencies = []
+    with CommandCounter(driver) as counter:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            items = fn()
+            latencies.append(time.perf_counter() - start)
+    return {
+        "items": len(items),
+        "round_trips_per_call": counter.count / repeat,
+        "latency": summarize(latencies),
+    }
+
+
+def main() -> None:
+    """Ponto de entrada do benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--page-results", type=int, default=10, help="Resultados na página (extraídos até 5)"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Repetições por modo")
+    args = parser.parse_args()
+
+    # Sem implicit wait: o benchmark mede round-trips, não esperas por ausência
+    automation = headless_automation(implicit_wait=0)
+    driver = automation.driver
+
+    try:
+        with local_page(build_page(args.page_results)) as url:
+            driver.get(url)
+            report = {
+                "page_results": args.page_results,
+                "repeat": args.repeat,
+                "legacy_loop": measure(lambda: legacy_extract(driver, 5), driver, args.repeat),
+                "single_script": measure(
+                    automation._extract_search_results, driver, args.repeat
+                ),
+            }
+    finally:
+        automation.cleanup()
+
+    legacy, fast = report["legacy_loop"], report["single_script"]
+    report["speedup"] = round(
+        legacy["latency"]["mean"] / max(fast["latency"]["mean"], 1e-9), 1
+    )
+
+    print_table(
+        "Extração de resultados",
+        [
+            {
+                "modo": "loop",
+                **legacy["latency"],
+                "round-trips": legacy["round_trips_per_call"],
+            },
+            {"modo": "script", **fast["latency"], "round-trips": fast["round_trips_per_call"]},
+            {"speedup": f"{report['speedup']}x"},
+        ],
+    )
+    print(f"\n💾 Relatório: {save_report('extraction', report)}")
+
+
+if __name__ == "__main__":
+    main()
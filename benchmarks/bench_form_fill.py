@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: preenchimento de formulário em lote vs. send_keys por campo.
+
+Compara ``form_fill.fill_form`` nos modos ``script`` (uma chamada que aplica
+e verifica todos os campos) e ``keys`` (find_element/clear/send_keys por
+campo) em um formulário local.
+
+Uso:
+    python benchmarks/bench_form_fill.py --fields 10 --checkboxes 5 --repeat 10
+"""
+
+import argparse
+import time
+from typing import Dict
+
+from common import (
+    CommandCounter,
+    headless_automation,
+    local_page,
+    print_table,
+    save_report,
+    summarize,
+)
+
+
+def build_page(fields: int, checkboxes: int) -> str:
+    """Formulário com ``fields`` campos de texto e ``checkboxes`` checkboxes."""
+    inputs = "".join(f"<input name='campo{i}'>" for i in range(fields))
+    boxes = "".join(f"<input type='checkbox' value='opcao{i}'>" for i in range(checkboxes))
+    form = f"<form>{inputs}{boxes}<textarea name='obs'></textarea></form>"
+    return f"<html><body>{form}</body></html>"
+
+
+def build_fields(fields: int, checkboxes: int, value: str) -> Dict[str, object]:
+    """Mapeamento seletor → valor (alternando o estado dos checkboxes)."""
+    mapping: Dict[str, object] = {f"[name='campo{i}']": f"{value} {i}" for i in range(fields)}
+    mapping.update({f"input[value='opcao{i}']": value == "b" for i in range(checkboxes)})
+    mapping["[name='obs']"] = f"Observações {value}"
+    return mapping
+
+
+def measure(driver, mode: str, args: argparse.Namespace) -> Dict:
+    """Medir latência, round-trips e verificação de um modo."""
+    from form_fill import fill_form
+
+    latencies = []
+    incomplete = 0
+    with CommandCounter(driver) as counter:
+        for run in range(args.repeat):
+            # Valores alternados: cada rodada altera todos os campos
+            fields = build_fields(args.fields, args.checkboxes, "ab"[run % 2])
+            start = time.perf_counter()
+            report = fill_form(driver, fields, mode=mode)
+            latencies.append(time.perf_counter() - start)
+            incomplete += bool(report["missing"] or report["mismatched"])
+    return {
+        "round_trips_per_fill": counter.count / args.repeat,
+        "incomplete_fills": incomplete,
+        "latency": summarize(latencies),
+    }
+
+
+def main() -> None:
+    """Ponto de entrada do benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fields", type=int, default=10, help="Campos de texto")
+    parser.add_argument("--checkboxes", type=int, default=5, help="Checkboxes")
+    parser.add_argument("--repeat", type=int, default=10, help="Repetições por modo")
+    args = parser.parse_args()
+
+    automation = headless_automation(implicit_wait=0)
+    driver = automation.driver
+
+    try:
+        with local_page(build_page(args.fields, args.checkboxes)) as url:
+            driver.get(url)
+            report = {
+                "fields": args.fields + 1,
+                "checkboxes": args.checkboxes,
+                "repeat": args.repeat,
+                "keys": measure(driver, "keys", args),
+                "script": measure(driver, "script", args),
+            }
+    finally:
+        automation.cleanup()
+
+    keys, script = report["keys"], report["script"]
+    report["speedup"] = round(
+        keys["latency"]["mean"] / max(script["latency"]["mean"], 1e-9), 1
+    )
+
+    print_table(
+        "Preenchimento de formulário",
+        [
+            {"modo": "keys", **keys["latency"], "round-trips": keys["round_trips_per_fill"]},
+            {
+                "modo": "script",
+                **script["latency"],
+                "round-trips": script["round_trips_per_fill"],
+            },
+            {"speedup": f"{report['speedup']}x"},
+        ],
+    )
+    print(f"\n💾 Relatório: {save_report('form_fill', report)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: envio de formulários via HTTP vs. navegador.
+
+Usa o ``StandInServer`` (formulário no formato do httpbin em ``/forms/post``
+com eco em ``/post``) e compara o throughput de ``automate_form_filling`` pelo
+navegador com o ``HybridFormExecutor`` (sessão keep-alive, sequencial e em
+paralelo).
+
+Uso:
+    python benchmarks/bench_http_forms.py --forms 50 --workers 8
+    python benchmarks/bench_http_forms.py --skip-browser
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+from common import print_table, save_report, summarize
+
+
+def payloads(count: int) -> List[Dict]:
+    """Dados de formulário no formato de automate_form_filling."""
+    return [
+        {
+            "customer_name": f"Cliente {i}",
+            "email": f"cliente{i}@teste.com",
+            "pizza_size": ["small", "medium", "large"][i % 3],
+            "toppings": ["bacon", "cheese"],
+            "comments": f"Pedido {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def run_http(url: str, forms: List[Dict], workers: int) -> Dict:
+    """Throughput do executor HTTP."""
+    from http_forms import HybridFormExecutor
+    from selenium_automation import FORM_FIELD_NAMES
+
+    executor = HybridFormExecutor(workers=workers, pool_size=workers)
+    values = [{FORM_FIELD_NAMES[k]: v for k, v in form.items()} for form in forms]
+    try:
+        executor.discover(url)
+        start = time.perf_counter()
+        results = executor.submit_many(url, values)
+        wall = time.perf_counter() - start
+    finally:
+        executor.close()
+
+    return {
+        "workers": workers,
+        "successful": sum(r["success"] for r in results),
+        "forms_per_second": round(len(forms) / wall, 1),
+        "latency": summarize([r["execution_time"] for r in results if "execution_time" in r]),
+    }
+
+
+def run_browser(url: str, forms: List[Dict]) -> Dict:
+    """Throughput de automate_form_filling pelo navegador."""
+    from common import headless_automation
+
+    automation = headless_automation(implicit_wait=0)
+    automation.FORM_URL = url
+    latencies = []
+    try:
+        start = time.perf_counter()
+        for form in forms:
+            result = automation.automate_form_filling(form)
+            latencies.append(result.get("execution_time", 0.0))
+        wall = time.perf_counter() - start
+    finally:
+        automation.cleanup()
+
+    return {
+        "forms_per_second": round(len(forms) / wall, 2),
+        "latency": summarize(latencies),
+    }
+
+
+def main() -> None:
+    """Ponto de entrada do benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--forms", type=int, default=50, help="Formulários enviados via HTTP")
+    parser.add_argument(
+        "--browser-forms", type=int, default=5, help="Formulários enviados pelo navegador"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Threads HTTP em paralelo")
+    parser.add_argument("--skip-browser", action="store_true", help="Medir apenas HTTP")
+    args = parser.parse_args()
+
+    from stand_in_server import StandInServer
+
+    with StandInServer() as server:
+        url = server.url("/forms/post")
+        report: Dict = {
+            "forms": args.forms,
+            "http_sequential": run_http(url, payloads(args.forms), workers=1),
+            "http_parallel": run_http(url, payloads(args.forms), workers=args.workers),
+        }
+        if not args.skip_browser:
+            report["browser"] = run_browser(url, payloads(args.browser_forms))
+
+    rows = [
+        {"modo": "http (1 thread)", "forms/s": report["http_sequential"]["forms_per_second"]},
+        {
+            "modo": f"http ({args.workers} threads)",
+            "forms/s": report["http_parallel"]["forms_per_second"],
+        },
+    ]
+    if "browser" in report:
+        rows.append({"modo": "navegador", "forms/s": report["browser"]["forms_per_second"]})
+    print_table("Envio de formulários", rows)
+    print(f"\n💾 Relatório: {save_report('http_forms', report)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: suite Selenium completa contra o servidor local (offline).
+
+Executa ``run_automation_suite`` com google.com e httpbin.org substituídos
+pelo ``StandInServer``, com latência injetada, para medir o tempo da suite
+de forma determinística.
+
+Uso:
+    python benchmarks/bench_offline_suite.py --runs 3 --latency 0.05
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+from common import print_table, save_report, summarize
+
+
+def run_suite(urls: Dict[str, str]) -> Dict:
+    """Executar a suite uma vez e coletar tempos por etapa."""
+    from selenium_automation import WebAutomation
+
+    automation = WebAutomation(browser="chrome", headless=True)
+    automation.configure_urls(**urls)
+
+    start = time.perf_counter()
+    result = automation.run_automation_suite()
+    wall = time.perf_counter() - start
+
+    steps = {}
+    for step in result.get("results", []):
+        name = step.get("test_type") or ("search" if "query" in step else "form")
+        steps[name] = step.get("execution_time")
+    return {
+        "wall_time": wall,
+        "successful": result.get("successful_tests", 0),
+        "total": result.get("total_tests", 0),
+        "steps": steps,
+    }
+
+
+def main() -> None:
+    """Ponto de entrada do benchmark."""
+    from stand_in_server import StandInServer
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3, help="Execuções da suite")
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Latência por resposta (s)"
+    )
+    args = parser.parse_args()
+
+    runs: List[Dict] = []
+    with StandInServer(latency=args.latency) as server:
+        for _ in range(args.runs):
+            runs.append(run_suite(server.site_urls()))
+        requests_served = server.requests
+
+    step_names = sorted({name for run in runs for name in run["steps"]})
+    report = {
+        "runs": args.runs,
+        "latency": args.latency,
+        "requests_served": requests_served,
+        "suite": summarize([run["wall_time"] for run in runs]),
+        "steps": {
+            name: summarize([run["steps"][name] for run in runs if run["steps"].get(name)])
+            for name in step_names
+        },
+        "success": [f"{run['successful']}/{run['total']}" for run in runs],
+    }
+
+    print_table(
+        "Suite offline",
+        [{"etapa": "suite", **report["suite"]}]
+        + [{"etapa": name, **stats} for name, stats in report["steps"].items()],
+    )
+    print(f"\n💾 Relatório: {save_report('offline_suite', report)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark de regressão: custo de seletores ausentes com e sem implicit wait.
+
+O loop de fallback anterior chamava ``find_element`` em cada alternativa com
+``implicitly_wait(15)`` ativo: cada seletor ausente custava o implicit wait
+inteiro. ``selector_probe.probe`` sonda todas as alternativas com o implicit
+wait desativado e um prazo único.
+
+Uso:
+    python benchmarks/bench_probing.py --misses 2 --implicit-wait 15
+"""
+
+import argparse
+import time
+from typing import Dict, List, Tuple
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from common import headless_automation, local_page, print_table, save_report
+
+PAGE = """
+<html><body>
+  <form><input name="comments"><input type="submit" value="Enviar"></form>
+</body></html>
+"""
+
+
+def candidates(misses: int) -> List[Tuple[str, str]]:
+    """Alternativas ausentes seguidas da que existe na página."""
+    missing = [(By.CSS_SELECTOR, f".ausente-{i}") for i in range(misses)]
+    return missing + [(By.CSS_SELECTOR, "input[type='submit']")]
+
+
+def legacy_lookup(driver, locators) -> float:
+    """Loop anterior: um find_element por alternativa."""
+    start = time.perf_counter()
+    for locator in locators:
+        try:
+            driver.find_element(*locator)
+            break
+        except NoSuchElementException:
+            continue
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Ponto de entrada do benchmark."""
+    from selector_probe import probe
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--misses", type=int, default=2, help="Alternativas ausentes")
+    parser.add_argument("--implicit-wait", type=float, default=15, help="Implicit wait (s)")
+    args = parser.parse_args()
+
+    automation = headless_automation(implicit_wait=args.implicit_wait)
+    driver = automation.driver
+    locators = candidates(args.misses)
+
+    try:
+        with local_page(PAGE) as url:
+            driver.get(url)
+            legacy = legacy_lookup(driver, locators)
+
+            start = time.perf_counter()
+            found = probe(driver, locators, timeout=automation.probe_timeout)
+            probed = time.perf_counter() - start
+
+            # Nada encontrado: o prazo único limita o pior caso
+            start = time.perf_counter()
+            probe(driver, locators[:-1], timeout=automation.probe_timeout)
+            worst_case = time.perf_counter() - start
+    finally:
+        automation.cleanup()
+
+    report: Dict = {
+        "misses": args.misses,
+        "implicit_wait": args.implicit_wait,
+        "legacy_seconds": round(legacy, 4),
+        "probe_seconds": round(probed, 4),
+        "probe_winner": found.locator[1] if found else None,
+        "probe_all_missing_seconds": round(worst_case, 4),
+        "legacy_miss_cost": round(legacy / max(args.misses, 1), 4),
+        "probe_miss_cost": round(probed / max(args.misses, 1), 4),
+    }
+
+    print_table(
+        "Custo de seletores ausentes",
+        [
+            {"modo": "find_element + implicit wait", "tempo": f"{legacy:.3f}s"},
+            {"modo": "probe", "tempo": f"{probed * 1000:.1f}ms"},
+            {"modo": "probe (nenhum presente)", "tempo": f"{worst_case:.3f}s"},
+        ],
+    )
+    print(f"\n💾 Relatório: {save_report('probing', report)}")
+
+
+if __name__ == "__main__":
+    main()
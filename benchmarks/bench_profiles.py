@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark: perfil de driver "throughput" vs. "default".
+
+Serve localmente uma página com imagens, fontes, CSS e um script "de
+terceiros" lentos e mede, para cada perfil, o tempo até a página estar
+pronta para leitura (``driver.get`` + conteúdo presente) e a memória
+residente do navegador.
+
+Uso:
+    python benchmarks/bench_profiles.py --pages 10 --assets 20 --asset-delay 0.05
+"""
+
+import argparse
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator
+
+from selenium.webdriver.common.by import By
+
+from common import print_table, save_report, summarize
+
+# PNG 1x1 transparente
+PIXEL = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+def build_page(assets: int) -> str:
+    """Página de conteúdo com ``assets`` imagens e recursos auxiliares."""
+    images = "".join(f"<img src='/img/{i}.png'>" for i in range(assets))
+    return (
+        "<html><head>"
+        "<link rel='stylesheet' href='/style.css'>"
+        "<script async src='/www.google-analytics.com/analytics.js'></script>"
+        "</head><body>"
+        "<h1 id='conteudo'>Resultados</h1>"
+        f"<p>Texto a extrair.</p>{images}"
+        "</body></html>"
+    )
+
+
+def make_handler(assets: int, delay: float):
+    """Handler HTTP com atraso nos recursos auxiliares."""
+    page = build_page(assets).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802 - API do http.server
+            if self.path.startswith("/page"):
+                body, content_type = page, "text/html; charset=utf-8"
+            else:
+                time.sleep(delay)
+                if self.path.endswith(".png"):
+                    body, content_type = PIXEL, "image/png"
+                elif self.path.endswith(".css"):
+                    body = (
+                        b"@font-face{font-family:f;src:url(/font.woff2)} body{font-family:f}"
+                    )
+                    content_type = "text/css"
+                elif self.path.endswith(".js"):
+                    body, content_type = b"void 0;", "application/javascript"
+                else:
+                    body, content_type = b"", "font/woff2"
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@contextmanager
+def local_site(assets: int, delay: float) -> Iterator[str]:
+    """Servidor HTTP local em porta livre."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(assets, delay))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def measure(profile: str, base_url: str, pages: int) -> Dict:
+    """Medir tempo até a página estar pronta e RSS do navegador."""
+    from driver_pool import browser_rss_mb
+    from selenium_automation import WebAutomation
+
+    automation = WebAutomation(browser="chrome", headless=True, profile=profile)
+    automation.setup_driver()
+    driver = automation.driver
+
+    latencies = []
+    try:
+        for i in range(pages):
+            start = time.perf_counter()
+            driver.get(f"{base_url}/page{i}")
+            driver.find_element(By.ID, "conteudo")
+            latencies.append(time.perf_counter() - start)
+        rss = browser_rss_mb(driver)
+    finally:
+        automation.cleanup()
+
+    return {"page_ready": summarize(latencies), "browser_rss_mb": round(rss, 1)}
+
+
+def main() -> None:
+    """Ponto de entrada do benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=10, help="Páginas carregadas por perfil")
+    parser.add_argument("--assets", type=int, default=20, help="Imagens por página")
+    parser.add_argument(
+        "--asset-delay", type=float, default=0.05, help="Atraso de cada recurso (s)"
+    )
+    args = parser.parse_args()
+
+    with local_site(args.assets, args.asset_delay) as base_url:
+        report = {
+            "pages": args.pages,
+            "assets": args.assets,
+            "asset_delay": args.asset_delay,
+            "default": measure("default", base_url, args.pages),
+            "throughput": measure("throughput", base_url, args.pages),
+        }
+
+    default, fast = report["default"], report["throughput"]
+    report["speedup"] = round(
+        default["page_ready"]["mean"] / max(fast["page_ready"]["mean"], 1e-9), 1
+    )
+
+    print_table(
+        "Perfis de driver",
+        [
+            {"perfil": "default", **default["page_ready"], "rss": default["browser_rss_mb"]},
+            {"perfil": "throughput", **fast["page_ready"], "rss": fast["browser_rss_mb"]},
+            {"speedup": f"{report['speedup']}x"},
+        ],
+    )
+    print(f"\n💾 Relatório: {save_report('profiles', report)}")
+
+
+if __name__ == "__main__":
+    main()
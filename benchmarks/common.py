@@ -0,0 +1,141 @@
+"""
+Utilitários compartilhados pelos benchmarks.
+
+[OK] Estatísticas de latência (média, p50, p95, máx)
+[OK] Display virtual (Xvfb) para execução headless no Linux
+[OK] Relatórios JSON em output/benchmarks
+[OK] Contagem de comandos WebDriver (round-trips)
+"""
+
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES_PATH = PROJECT_ROOT / "examples" / "python_migrations"
+REPORT_DIR = Path("output") / "benchmarks"
+
+# Mesmo esquema de import usado pelos testes
+if str(EXAMPLES_PATH) not in sys.path:
+    sys.path.insert(0, str(EXAMPLES_PATH))
+
+from metrics import percentile  # noqa: E402 - depende do sys.path acima
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """Resumir amostras de latência (segundos)."""
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+
+    return {
+        "count": len(samples),
+        "mean": round(statistics.fmean(samples), 4),
+        "p50": round(percentile(samples, 50), 4),
+        "p95": round(percentile(samples, 95), 4),
+        "max": round(max(samples), 4),
+    }
+
+
+@contextmanager
+def virtual_display(display: str = ":99", size: str = "1024x768x24") -> Iterator[str]:
+    """
+    Garantir um display X disponível.
+
+    Reutiliza $DISPLAY quando já definido; caso contrário inicia Xvfb
+    (mesma configuração do pipeline de CI) e encerra ao final.
+    """
+    if os.getenv("DISPLAY") or sys.platform == "win32":
+        yield os.getenv("DISPLAY", "")
+        return
+
+    if not shutil.which("Xvfb"):
+        raise RuntimeError("Xvfb não encontrado - instale com: sudo apt-get install xvfb")
+
+    process = subprocess.Popen(
+        ["Xvfb", display, "-screen", "0", size],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    os.environ["DISPLAY"] = display
+    time.sleep(1)
+
+    try:
+        yield display
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+        os.environ.pop("DISPLAY", None)
+
+
+def save_report(name: str, data: Dict) -> Path:
+    """Salvar relatório de benchmark em JSON."""
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = REPORT_DIR / f"{name}_{timestamp}.json"
+
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(
+            {"benchmark": name, "timestamp": datetime.now().isoformat(), **data},
+            f,
+            indent=2,
+            ensure_ascii=False,
+        )
+
+    return filename
+
+
+def print_table(title: str, rows: List[Dict[str, object]]) -> None:
+    """Imprimir tabela simples com os resultados."""
+    print(f"\n📊 {title}")
+    print("-" * 60)
+    for row in rows:
+        print("  " + " | ".join(f"{key}: {value}" for key, value in row.items()))
+
+
+def headless_automation(implicit_wait: float = 15):
+    """Criar WebAutomation headless com driver configurado como na suite."""
+    from selenium_automation import WebAutomation
+
+    automation = WebAutomation(browser="chrome", headless=True)
+    automation.setup_driver()
+    automation.driver.implicitly_wait(implicit_wait)
+    return automation
+
+
+@contextmanager
+def local_page(html: str) -> Iterator[str]:
+    """Gravar HTML em arquivo temporário e retornar sua URL file://."""
+    with tempfile.TemporaryDirectory() as tmp:
+        page = Path(tmp) / "page.html"
+        page.write_text(html, encoding="utf-8")
+        yield page.as_uri()
+
+
+class CommandCounter:
+    """Contar comandos enviados ao WebDriver (cada um é um round-trip HTTP)."""
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.count = 0
+        self._original = driver.execute
+
+    def _execute(self, *args: Any, **kwargs: Any) -> Any:
+        self.count += 1
+        return self._original(*args, **kwargs)
+
+    def __enter__(self) -> "CommandCounter":
+        self.count = 0
+        self.driver.execute = self._execute
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.driver.execute = self._original
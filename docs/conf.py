@@ -10,6 +10,8 @@ import os
 import sys
 
 sys.path.insert(0, os.path.abspath(".."))
+# Exemplos importam os módulos vizinhos pelo nome (sem pacote)
+sys.path.insert(0, os.path.abspath("../examples/python_migrations"))
 
 project = "Autoit-Python - Migração AutoIt para Python"
 copyright = "2025, Tiago Gonçalves"
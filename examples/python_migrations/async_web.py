@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Fachada assíncrona sobre ``selenium_automation.WebAutomation``.
+
+Permite intercalar trabalho web e desktop (``WindowAutomation``) no mesmo
+event loop sem bloqueá-lo:
+[OK] ``await web.search(...)`` / ``await web.fill_form(...)``
+[OK] Uma thread dedicada por driver (o WebDriver nunca troca de thread)
+[OK] Concorrência limitada ao número de drivers
+[OK] Medição do atraso do event loop (loop lag) e da espera por driver
+
+Exemplo:
+    async with AsyncWebAutomation(drivers=2) as web:
+        desktop = WindowAutomation(config)
+        results = await asyncio.gather(
+            web.search("python selenium"),
+            web.fill_form({"customer_name": "Ana"}),
+            desktop.run_automation(),
+        )
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from metrics import LatencyRecorder
+from selenium_automation import WebAutomation
+
+
+class LoopLagMonitor:
+    """Medir o atraso do event loop com um temporizador periódico."""
+
+    def __init__(self, interval: float = 0.05):
+        """
+        Inicializar monitor.
+
+        Args:
+            interval: Período do temporizador (s)
+        """
+        self.interval = interval
+        self.lag = LatencyRecorder()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag.record(max(0.0, loop.time() - start - self.interval))
+
+    def start(self) -> None:
+        """Iniciar medição no loop atual."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Encerrar medição."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class _DriverWorker:
+    """WebAutomation com thread exclusiva: todas as chamadas ao driver partem dela."""
+
+    def __init__(self, index: int, automation: WebAutomation):
+        self.index = index
+        self.automation = automation
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"web-{index}")
+
+    def _ensure_driver(self) -> None:
+        if self.automation.driver is None:
+            if self.automation.pool:
+                self.automation.attach_driver(self.automation.pool.acquire())
+            else:
+                self.automation.setup_driver()
+
+    def call(self, method: str, args: tuple) -> Any:
+        """Executar método da automação (na thread do worker)."""
+        self._ensure_driver()
+        return getattr(self.automation, method)(*args)
+
+    def close(self) -> None:
+        """Liberar driver (na thread do worker)."""
+        self.automation.cleanup()
+        self.automation.driver = None
+
+
+class AsyncWebAutomation:
+    """API assíncrona com N drivers, cada um em sua própria thread."""
+
+    def __init__(
+        self,
+        drivers: int = 2,
+        automation_factory: Optional[Callable[[], WebAutomation]] = None,
+        prewarm: bool = False,
+        lag_interval: float = 0.05,
+        **automation_kwargs,
+    ):
+        """
+        Inicializar fachada.
+
+        Args:
+            drivers: Número de drivers (limite de operações web simultâneas)
+            automation_factory: Cria cada WebAutomation (padrão: ``automation_kwargs``)
+            prewarm: Iniciar todos os drivers em ``start``
+            lag_interval: Período da medição de atraso do event loop
+            automation_kwargs: Argumentos de WebAutomation (browser, headless, pool...)
+        """
+        automation_kwargs.setdefault("headless", True)
+        self.drivers = drivers
+        self.factory = automation_factory or (lambda: WebAutomation(**automation_kwargs))
+        self.prewarm = prewarm
+        self.lag_monitor = LoopLagMonitor(lag_interval)
+        self.queue_wait = LatencyRecorder()
+        self.call_latency = LatencyRecorder()
+        self._workers: List[_DriverWorker] = []
+        self._idle: Optional[asyncio.Queue] = None
+
+    async def start(self) -> "AsyncWebAutomation":
+        """Criar workers (e drivers, se ``prewarm``) e iniciar a medição de lag."""
+        if self._idle is not None:
+            return self
+        self._idle = asyncio.Queue()
+        self._workers = [_DriverWorker(i, self.factory()) for i in range(self.drivers)]
+        for worker in self._workers:
+            self._idle.put_nowait(worker)
+        self.lag_monitor.start()
+
+        if self.prewarm:
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(worker.executor, worker._ensure_driver)
+                    for worker in self._workers
+                )
+            )
+        logger.info(f"Fachada assíncrona pronta com {self.drivers} drivers")
+        return self
+
+    async def __aenter__(self) -> "AsyncWebAutomation":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def call(self, method: str, *args) -> Any:
+        """
+        Executar um método de WebAutomation no primeiro driver livre.
+
+        Args:
+            method: Nome do método (ex.: ``search_google``)
+            args: Argumentos do método
+
+        Returns:
+            Resultado do método
+        """
+        await self.start()
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        worker = await self._idle.get()
+        self.queue_wait.record(loop.time() - start)
+        try:
+            started = time.perf_counter()
+            result = await loop.run_in_executor(worker.executor, worker.call, method, args)
+            self.call_latency.record(time.perf_counter() - started)
+            return result
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def search(self, query: str) -> Dict:
+        """Pesquisar no Google."""
+        return await self.call("search_google", query)
+
+    async def fill_form(self, form_data: Dict) -> Dict:
+        """Preencher o formulário do httpbin."""
+        return await self.call("automate_form_filling", form_data)
+
+    async def simple_form(self) -> Dict:
+        """Executar o teste do formulário simples."""
+        return await self.call("test_simple_form")
+
+    def metrics(self) -> Dict:
+        """Lag do event loop, espera por driver e duração das chamadas."""
+        return {
+            "drivers": self.drivers,
+            "loop_lag": self.lag_monitor.lag.summary(),
+            "queue_wait": self.queue_wait.summary(),
+            "call_latency": self.call_latency.summary(),
+        }
+
+    async def close(self) -> None:
+        """Aguardar chamadas em curso, fechar drivers e encerrar threads."""
+        if self._idle is None:
+            return
+        loop = asyncio.get_running_loop()
+        # Todos os workers de volta à fila = nenhuma chamada em andamento
+        workers = [await self._idle.get() for _ in self._workers]
+        for worker in workers:
+            try:
+                await loop.run_in_executor(worker.executor, worker.close)
+            except Exception as e:
+                logger.warning(f"Erro ao fechar driver {worker.index}: {e}")
+            worker.executor.shutdown(wait=True)
+
+        await self.lag_monitor.stop()
+        self._idle = None
+        self._workers = []
+        logger.info(f"Fachada assíncrona encerrada: {self.metrics()['loop_lag']}")
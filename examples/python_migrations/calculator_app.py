@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Calculadora Stand-in (Tk) - Alvo determinístico para benchmarks
+
+Substitui a Calculadora do Windows em ambientes Linux/Xvfb:
+[OK] Janela intitulada "Calculadora"
+[OK] Mesmas teclas usadas por WindowAutomation (dígitos, operadores, Enter, Esc)
+[OK] Ctrl+C copia o resultado para a área de transferência
+[OK] Avaliação exata (sem eval) com resultados reprodutíveis
+"""
+
+import ast
+import operator
+import sys
+from fractions import Fraction
+from typing import Callable, Dict, Type
+
+WINDOW_TITLE = "Calculadora"
+DIVISION_BY_ZERO_MESSAGE = "Não é possível dividir por zero"
+INVALID_INPUT_MESSAGE = "Entrada inválida"
+
+_OPERATORS: Dict[Type[ast.AST], Callable[[Fraction, Fraction], Fraction]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+_ALLOWED_CHARS = set("0123456789+-*/.")
+
+
+def _evaluate_node(node: ast.AST) -> Fraction:
+    """Avaliar nó da árvore sintática usando apenas aritmética básica."""
+    if isinstance(node, ast.Expression):
+        return _evaluate_node(node.body)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return Fraction(str(node.value))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = _evaluate_node(node.operand)
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        return _OPERATORS[type(node.op)](_evaluate_node(node.left), _evaluate_node(node.right))
+    raise ValueError(f"Expressão não suportada: {ast.dump(node)}")
+
+
+def format_result(value: Fraction, max_decimals: int = 10) -> str:
+    """
+    Formatar resultado como a calculadora exibe.
+
+    Inteiros aparecem sem casas decimais; frações são arredondadas e
+    têm zeros à direita removidos.
+    """
+    if value.denominator == 1:
+        return str(value.numerator)
+
+    text = f"{float(value):.{max_decimals}f}".rstrip("0").rstrip(".")
+    return "0" if text in ("", "-0") else text
+
+
+def evaluate_expression(expression: str) -> str:
+    """
+    Avaliar expressão digitada na calculadora.
+
+    Args:
+        expression: Expressão com dígitos e operadores (+ - * /)
+
+    Returns:
+        Resultado formatado ou mensagem de erro exibida no visor
+    """
+    cleaned = expression.strip().rstrip("=")
+    if not cleaned or not set(cleaned) <= _ALLOWED_CHARS:
+        return INVALID_INPUT_MESSAGE
+
+    try:
+        tree = ast.parse(cleaned, mode="eval")
+        return format_result(_evaluate_node(tree))
+    except ZeroDivisionError:
+        return DIVISION_BY_ZERO_MESSAGE
+    except (SyntaxError, ValueError):
+        return INVALID_INPUT_MESSAGE
+
+
+class CalculatorApp:
+    """Janela Tk que imita o fluxo de teclado da Calculadora do Windows."""
+
+    def __init__(self, title: str = WINDOW_TITLE):
+        import tkinter as tk
+
+        self.root = tk.Tk()
+        self.root.title(title)
+        self.root.geometry("320x120")
+        self.expression = ""
+        self.display_value = "0"
+        self._evaluated = False
+
+        self.display = tk.Label(
+            self.root, text=self.display_value, anchor="e", font=("Courier", 20), padx=10
+        )
+        self.display.pack(fill="both", expand=True)
+
+        self.root.bind_all("<Key>", self._on_key)
+        self.root.bind_all("<Control-c>", self._copy_result)
+        self.root.bind_all("<Control-a>", lambda event: "break")
+
+    def _refresh(self, value: str) -> None:
+        """Atualizar visor."""
+        self.display_value = value
+        self.display.config(text=value)
+
+    def press(self, key: str) -> None:
+        """Processar uma tecla (usado pelos bindings e por testes)."""
+        if key in ("Return", "KP_Enter", "="):
+            self._refresh(evaluate_expression(self.expression))
+            self.expression = ""
+            self._evaluated = True
+        elif key == "Escape":
+            self.expression = ""
+            self._evaluated = False
+            self._refresh("0")
+        elif key == "BackSpace":
+            self.expression = self.expression[:-1]
+            self._refresh(self.expression or "0")
+        elif len(key) == 1 and key in _ALLOWED_CHARS:
+            last_is_number = self.display_value.lstrip("-")[:1].isdigit()
+            if self._evaluated and key in "+-*/" and last_is_number:
+                # Continuar cálculo a partir do último resultado
+                self.expression = self.display_value
+            self._evaluated = False
+            self.expression += key
+            self._refresh(self.expression)
+
+    def _on_key(self, event) -> None:
+        """Converter evento Tk em tecla da calculadora."""
+        if event.state & 0x4:  # Ctrl pressionado: tratado pelos atalhos
+            return
+        key = event.char if event.char and event.char in _ALLOWED_CHARS else event.keysym
+        self.press(key)
+
+    def _copy_result(self, event=None) -> str:
+        """Copiar valor do visor para a área de transferência."""
+        self.root.clipboard_clear()
+        self.root.clipboard_append(self.display_value)
+        self.root.update()
+        return "break"
+
+    def run(self) -> None:
+        """Iniciar loop de eventos."""
+        self.root.mainloop()
+
+
+def main() -> None:
+    """Abrir calculadora stand-in."""
+    title = sys.argv[1] if len(sys.argv) > 1 else WINDOW_TITLE
+    CalculatorApp(title).run()
+
+
+if __name__ == "__main__":
+    main()
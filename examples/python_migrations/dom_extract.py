@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Extração declarativa de dados do DOM em uma única chamada.
+
+Envia ao navegador uma especificação campo → lista de seletores e a avalia
+com um único ``execute_script``:
+[OK] Uma ida ao WebDriver em vez de centenas de find_element/.text
+[OK] Seletores inválidos ou ausentes não geram exceções
+[OK] Resultado estruturado retornado como JSON
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+EXTRACTION_SCRIPT = """
+var spec = arguments[0];
+
+function queryAll(root, selector) {
+  try { return root.querySelectorAll(selector); } catch (e) { return []; }
+}
+
+function readField(container, fieldSpec) {
+  var value = "", source = null;
+  for (var i = 0; i < fieldSpec.selectors.length; i++) {
+    var nodes = queryAll(container, fieldSpec.selectors[i]);
+    if (!nodes.length) { continue; }
+    var node = nodes[0];
+    var raw = fieldSpec.attribute === "text"
+      ? node.innerText
+      : (node[fieldSpec.attribute] !== undefined ? node[fieldSpec.attribute]
+                                                 : node.getAttribute(fieldSpec.attribute));
+    raw = raw === null || raw === undefined ? "" : String(raw).trim();
+    if (!raw) { continue; }
+    value = raw;
+    source = fieldSpec.selectors[i];
+    if (!fieldSpec.startswith || raw.indexOf(fieldSpec.startswith) === 0) { break; }
+  }
+  return [value, source];
+}
+
+var containers = [], matched = null;
+for (var c = 0; c < spec.containers.length; c++) {
+  containers = queryAll(document, spec.containers[c]);
+  if (containers.length) { matched = spec.containers[c]; break; }
+}
+
+var items = [], sources = {};
+var limit = spec.limit === null ? containers.length : Math.min(spec.limit, containers.length);
+for (var k = 0; k < limit; k++) {
+  var item = {index: k};
+  for (var name in spec.fields) {
+    var read = readField(containers[k], spec.fields[name]);
+    item[name] = read[0];
+    if (read[1] && !sources[name]) { sources[name] = read[1]; }
+  }
+  items.push(item);
+}
+
+return JSON.stringify(
+  {container: matched, total: containers.length, items: items, field_selectors: sources}
+);
+"""
+
+
+@dataclass
+class FieldSpec:
+    """Seletores alternativos para um campo e como ler seu valor."""
+
+    selectors: List[str]
+    attribute: str = "text"
+    # Continua tentando seletores até o valor começar com este prefixo
+    startswith: Optional[str] = None
+
+
+@dataclass
+class ExtractionSpec:
+    """Especificação declarativa de extração."""
+
+    containers: List[str]
+    fields: Dict[str, FieldSpec] = field(default_factory=dict)
+    limit: Optional[int] = None
+
+
+def extract(driver: WebDriver, spec: ExtractionSpec) -> Dict:
+    """
+    Avaliar especificação no navegador com uma única chamada.
+
+    Args:
+        driver: WebDriver na página alvo
+        spec: Especificação de containers e campos
+
+    Returns:
+        Dicionário com ``container`` (seletor vencedor), ``total``, ``items``
+        e ``field_selectors`` (seletor que forneceu cada campo)
+    """
+    payload = driver.execute_script(EXTRACTION_SCRIPT, asdict(spec))
+    if not payload:
+        return {"container": None, "total": 0, "items": [], "field_selectors": {}}
+    return json.loads(payload)
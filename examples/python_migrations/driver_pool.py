@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Pool de sessões WebDriver reutilizáveis.
+
+Evita o custo de iniciar um navegador a cada execução:
+[OK] Sessões headless pré-aquecidas
+[OK] Reset de estado entre jobs (cookies, storage de cada origem visitada, abas)
+[OK] Health check antes de emprestar
+[OK] Reciclagem após N usos ou crescimento de memória
+[OK] Métricas de latência de aquisição e ocupação
+
+Exemplo:
+    pool = DriverPool(WebAutomation(headless=True).create_driver, PoolConfig(size=2))
+    automation = WebAutomation(headless=True, pool=pool)
+    automation.run_automation_suite()
+    pool.close()
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterator, Optional, Set
+
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from metrics import LatencyRecorder
+from web_urls import origin_of
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil está em requirements.txt
+    psutil = None
+
+
+RESET_STORAGE_SCRIPT = """
+try { window.localStorage && window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage && window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+def visited_origins(driver: WebDriver) -> Set[str]:
+    """Origens visitadas na aba atual: histórico de navegação (CDP) ou URL corrente."""
+    try:
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        urls = [entry["url"] for entry in history.get("entries", [])]
+    except Exception:
+        urls = [driver.current_url]
+    return {origin for origin in map(origin_of, urls) if origin}
+
+
+@dataclass
+class PoolConfig:
+    """Configuração do pool de drivers."""
+
+    size: int = 2
+    max_uses: int = 50
+    max_rss_growth_mb: Optional[float] = 300.0
+    acquire_timeout: float = 60.0
+    prewarm: bool = True
+
+
+@dataclass
+class PooledDriver:
+    """Driver gerenciado pelo pool."""
+
+    driver: WebDriver
+    created_at: float
+    baseline_rss_mb: float = 0.0
+    uses: int = 0
+
+
+def browser_rss_mb(driver: WebDriver) -> float:
+    """Memória residente (MB) do driver e dos processos do navegador."""
+    if psutil is None:
+        return 0.0
+
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except Exception:
+        return 0.0
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / (1024 * 1024)
+
+
+class DriverPool:
+    """Pool thread-safe de sessões WebDriver aquecidas."""
+
+    def __init__(self, factory: Callable[[], WebDriver], config: Optional[PoolConfig] = None):
+        """
+        Inicializar pool.
+
+        Args:
+            factory: Função que cria um novo WebDriver configurado
+            config: Configuração do pool
+        """
+        self.factory = factory
+        self.config = config or PoolConfig()
+        self._idle: Deque[PooledDriver] = deque()
+        self._leased: Dict[int, PooledDriver] = {}
+        self._total = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self.acquire_latency = LatencyRecorder()
+        self.stats = {
+            "created": 0,
+            "recycled": 0,
+            "health_failures": 0,
+            "reset_failures": 0,
+            "peak_in_use": 0,
+        }
+
+        if self.config.prewarm:
+            self.prewarm()
+
+    def prewarm(self) -> None:
+        """Criar sessões até atingir o tamanho configurado."""
+        while True:
+            with self._condition:
+                if self._closed or self._total >= self.config.size:
+                    return
+                self._total += 1
+            try:
+                pooled = self._create()
+            except Exception:
+                with self._condition:
+                    self._total -= 1
+                raise
+            with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+
+    def _create(self) -> PooledDriver:
+        """Criar nova sessão."""
+        start = time.perf_counter()
+        driver = self.factory()
+        pooled = PooledDriver(
+            driver=driver, created_at=time.time(), baseline_rss_mb=browser_rss_mb(driver)
+        )
+        with self._condition:
+            self.stats["created"] += 1
+        logger.info(f"Sessão WebDriver criada em {time.perf_counter() - start:.2f}s")
+        return pooled
+
+    def _destroy(self, pooled: PooledDriver, reason: str) -> None:
+        """Encerrar sessão e liberar vaga no pool."""
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"Erro ao encerrar sessão: {e}")
+
+        with self._condition:
+            self._total -= 1
+            self._condition.notify()
+        logger.info(f"Sessão descartada ({reason}) após {pooled.uses} usos")
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """Verificar se a sessão responde."""
+        try:
+            return pooled.driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """Limpar estado deixado pelo job anterior."""
+        driver = pooled.driver
+        try:
+            origins: Set[str] = set()
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                origins |= visited_origins(driver)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            origins |= visited_origins(driver)
+
+            driver.execute_script(RESET_STORAGE_SCRIPT)
+            try:
+                # Storage de todas as origens visitadas pelo job, não só a atual
+                for origin in sorted(origins):
+                    driver.execute_cdp_cmd(
+                        "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+                    )
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                # Sem CDP (ex.: Firefox): apenas a origem atual e os cookies
+                driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            with self._condition:
+                self.stats["reset_failures"] += 1
+            logger.warning(f"Falha ao resetar sessão: {e}")
+            return False
+
+    def _recycle_reason(self, pooled: PooledDriver) -> Optional[str]:
+        """Motivo para reciclar a sessão (ou None)."""
+        if pooled.uses >= self.config.max_uses:
+            return f"limite de {self.config.max_uses} usos"
+
+        if self.config.max_rss_growth_mb is not None and pooled.baseline_rss_mb:
+            growth = browser_rss_mb(pooled.driver) - pooled.baseline_rss_mb
+            if growth > self.config.max_rss_growth_mb:
+                return f"crescimento de memória de {growth:.0f} MB"
+
+        return None
+
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """
+        Emprestar um driver saudável.
+
+        Args:
+            timeout: Tempo máximo de espera por uma sessão livre
+
+        Returns:
+            WebDriver pronto para uso
+        """
+        timeout = self.config.acquire_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        while True:
+            pooled: Optional[PooledDriver] = None
+            create = False
+
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Pool de drivers encerrado")
+                    if self._idle:
+                        pooled = self._idle.popleft()
+                        break
+                    if self._total < self.config.size:
+                        self._total += 1
+                        create = True
+                        break
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        raise TimeoutError(f"Nenhum driver livre em {timeout}s")
+                    self._condition.wait(remaining)
+
+            if create:
+                try:
+                    pooled = self._create()
+                except Exception:
+                    with self._condition:
+                        self._total -= 1
+                        self._condition.notify()
+                    raise
+            elif not self._is_healthy(pooled):
+                with self._condition:
+                    self.stats["health_failures"] += 1
+                self._destroy(pooled, "health check falhou")
+                continue
+
+            with self._condition:
+                self._leased[id(pooled.driver)] = pooled
+                self.stats["peak_in_use"] = max(self.stats["peak_in_use"], len(self._leased))
+
+            self.acquire_latency.record(time.perf_counter() - start)
+            return pooled.driver
+
+    def release(self, driver: WebDriver) -> None:
+        """Devolver driver ao pool (resetando ou reciclando a sessão)."""
+        with self._condition:
+            pooled = self._leased.pop(id(driver), None)
+        if pooled is None:
+            logger.warning("Driver devolvido não pertence ao pool")
+            return
+
+        pooled.uses += 1
+        reason = "pool encerrado" if self._closed else self._recycle_reason(pooled)
+        if reason is None and not self._reset(pooled):
+            reason = "reset falhou"
+
+        if reason:
+            if not self._closed:
+                with self._condition:
+                    self.stats["recycled"] += 1
+            self._destroy(pooled, reason)
+            return
+
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[WebDriver]:
+        """Emprestar driver dentro de um bloco ``with``."""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def metrics(self) -> Dict:
+        """Métricas de ocupação e latência de aquisição."""
+        with self._condition:
+            in_use = len(self._leased)
+            idle = len(self._idle)
+            total = self._total
+
+        return {
+            "size": self.config.size,
+            "sessions": total,
+            "idle": idle,
+            "in_use": in_use,
+            "occupancy": round(in_use / self.config.size, 3) if self.config.size else 0.0,
+            "acquire_latency": self.acquire_latency.summary(),
+            **self.stats,
+        }
+
+    def close(self) -> None:
+        """Encerrar todas as sessões ociosas (as emprestadas ao serem devolvidas)."""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+
+        for pooled in idle:
+            self._destroy(pooled, "pool encerrado")
+        logger.info("Pool de drivers encerrado")
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Cache da resolução de binários do WebDriver.
+
+Sem caminho no ``Service``, o Selenium Manager é executado a cada sessão para
+localizar/validar driver e navegador (lento e dependente de rede):
+[OK] Caminhos e versões fixados na primeira resolução (JSON em output/)
+[OK] Validação barata nas execuções seguintes (stat: tamanho e mtime)
+[OK] Funciona offline: com cache válido o Selenium Manager não é chamado
+[OK] Fallback para o driver no PATH quando o Selenium Manager falha
+[OK] Tempos de setup frio/quente registrados por navegador
+"""
+
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+from selenium.common.exceptions import NoSuchDriverException
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.service import Service
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from json_store import JsonStore
+
+DEFAULT_CACHE_PATH = Path("output") / "driver_cache.json"
+
+DRIVER_EXECUTABLES = {
+    "chrome": "chromedriver",
+    "firefox": "geckodriver",
+    "MicrosoftEdge": "msedgedriver",
+}
+
+
+def _fingerprint(path: str) -> Optional[Dict[str, int]]:
+    """Tamanho e mtime do binário (None se ausente ou não executável)."""
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not os.access(path, os.X_OK):
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+class DriverResolver(JsonStore):
+    """Resolver e fixar caminhos de driver/navegador entre execuções."""
+
+    DEFAULT_PATH = DEFAULT_CACHE_PATH
+    LABEL = "Cache de drivers"
+
+    def __init__(self, path: Optional[Path] = DEFAULT_CACHE_PATH):
+        """
+        Inicializar resolvedor.
+
+        Args:
+            path: Arquivo JSON de persistência (None = somente memória)
+        """
+        super().__init__(path)
+        self._entries: Dict[str, Dict] = self._read("entries", {})
+
+    def _payload(self) -> Dict:
+        """Caminhos, impressões digitais e tempos de setup para ``save``."""
+        return {"entries": self._entries}
+
+    @staticmethod
+    def key(options: ArgOptions) -> str:
+        """Chave do cache: navegador e versão solicitada."""
+        browser = options.capabilities["browserName"]
+        return f"{browser}@{options.browser_version or 'stable'}"
+
+    def _valid(self, entry: Dict) -> bool:
+        """Validação barata: binários presentes e inalterados desde a fixação."""
+        driver_fingerprint = _fingerprint(entry.get("driver_path", ""))
+        if driver_fingerprint is None or driver_fingerprint != entry.get("driver_fingerprint"):
+            return False
+        return _fingerprint(entry.get("browser_path", "")) == entry.get("browser_fingerprint")
+
+    def _discover(self, service: Service, options: ArgOptions) -> Dict[str, str]:
+        """Resolução fria via Selenium Manager (ou driver no PATH)."""
+        try:
+            try:
+                finder = DriverFinder(service, options)
+                return {
+                    "driver_path": finder.get_driver_path(),
+                    "browser_path": finder.get_browser_path(),
+                }
+            except (TypeError, AttributeError):
+                # Selenium < 4.20: API estática, só o caminho do driver
+                return {
+                    "driver_path": DriverFinder.get_path(service, options),
+                    "browser_path": "",
+                }
+        except NoSuchDriverException as e:
+            browser = options.capabilities["browserName"]
+            fallback = shutil.which(DRIVER_EXECUTABLES.get(browser, ""))
+            if not fallback:
+                raise
+            logger.warning(f"Selenium Manager indisponível ({e}); usando {fallback}")
+            return {"driver_path": fallback, "browser_path": ""}
+
+    def resolve(self, service: Service, options: ArgOptions) -> str:
+        """
+        Preencher ``service.path`` e ``options.binary_location``.
+
+        Args:
+            service: Service do driver (sem caminho definido)
+            options: Opções do navegador
+
+        Returns:
+            ``"warm"`` (cache válido), ``"cold"`` (nova resolução) ou
+            ``"explicit"`` (caminho já definido pelo chamador)
+        """
+        if service.path:
+            return "explicit"
+
+        key = self.key(options)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry and self._valid(entry):
+            resolution = "warm"
+        else:
+            if entry:
+                logger.info(f"Binários de {key} alterados; resolvendo novamente")
+            paths = self._discover(service, options)
+            entry = {
+                **paths,
+                "driver_fingerprint": _fingerprint(paths["driver_path"]),
+                "browser_fingerprint": _fingerprint(paths["browser_path"]),
+                "resolved_at": time.time(),
+            }
+            with self._lock:
+                self._entries[key] = {**self._entries.get(key, {}), **entry}
+                self._dirty = True
+            self.save()
+            resolution = "cold"
+
+        service.path = entry["driver_path"]
+        if entry["browser_path"] and hasattr(options, "binary_location"):
+            options.binary_location = entry["browser_path"]
+        logger.debug(f"Driver {key} ({resolution}): {entry['driver_path']}")
+        return resolution
+
+    def record_setup(
+        self, options: ArgOptions, driver: WebDriver, seconds: float, resolution: str
+    ) -> None:
+        """Registrar versões da sessão e tempo de setup frio/quente."""
+        if resolution == "explicit":
+            return
+
+        capabilities = driver.capabilities or {}
+        browser = options.capabilities["browserName"]
+        driver_version = (
+            capabilities.get(browser, {}).get("chromedriverVersion")
+            or capabilities.get("msedge", {}).get("msedgedriverVersion")
+            or capabilities.get("moz:geckodriverVersion")
+            or ""
+        )
+
+        with self._lock:
+            entry = self._entries.setdefault(self.key(options), {})
+            entry["browser_version"] = capabilities.get("browserVersion")
+            entry["driver_version"] = driver_version.split(" ")[0] or None
+            entry[f"{resolution}_setup_seconds"] = round(seconds, 3)
+            entry["last_resolution"] = resolution
+            self._dirty = True
+        self.save()
+
+    def stats(self) -> Dict[str, Dict]:
+        """Versões fixadas e tempos de setup frio/quente por navegador."""
+        with self._lock:
+            return {
+                key: {
+                    "driver_path": entry.get("driver_path"),
+                    "driver_version": entry.get("driver_version"),
+                    "browser_version": entry.get("browser_version"),
+                    "cold_setup_seconds": entry.get("cold_setup_seconds"),
+                    "warm_setup_seconds": entry.get("warm_setup_seconds"),
+                    "last_resolution": entry.get("last_resolution"),
+                }
+                for key, entry in self._entries.items()
+            }
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Supervisor de sessões WebDriver tolerante a falhas do navegador.
+
+Um Chrome que trava ou morre no meio da suite não derruba as etapas seguintes:
+[OK] Heartbeat (script trivial) com prazo próprio, sem depender do timeout HTTP
+[OK] Watchdog por etapa: sessão travada tem a árvore de processos encerrada (psutil)
+[OK] Substituição transparente da sessão morta
+[OK] Nova tentativa de etapas idempotentes interrompidas pela queda
+[OK] Métricas de heartbeats, quedas, reinícios e duração das etapas
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from metrics import LatencyRecorder
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil está em requirements.txt
+    psutil = None
+
+
+class SessionLost(Exception):
+    """A sessão morreu e a etapa não pôde ser concluída."""
+
+
+@dataclass
+class SupervisorConfig:
+    """Configuração do supervisor."""
+
+    heartbeat_timeout: float = 5.0
+    # Prazo de cada etapa antes de considerar o navegador travado (None = sem watchdog)
+    step_timeout: Optional[float] = 120.0
+    retries: int = 1
+    max_restarts: int = 5
+    quit_timeout: float = 10.0
+
+
+def call_with_timeout(fn: Callable[[], Any], timeout: float) -> Any:
+    """
+    Executar ``fn`` em thread auxiliar e desistir após ``timeout``.
+
+    Raises:
+        TimeoutError: ``fn`` não retornou no prazo (a thread é abandonada)
+    """
+    outcome: Dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            outcome["value"] = fn()
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, name="driver-call", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"Sem resposta em {timeout}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("value")
+
+
+def kill_process_tree(driver: WebDriver) -> int:
+    """
+    Encerrar o driver e todos os processos do navegador.
+
+    Returns:
+        Quantidade de processos encerrados (0 para sessões remotas)
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None:
+        return 0
+    if psutil is None:
+        process.kill()
+        return 1
+
+    try:
+        root = psutil.Process(process.pid)
+        processes = root.children(recursive=True) + [root]
+    except psutil.Error:
+        return 0
+
+    for proc in processes:
+        try:
+            proc.kill()
+        except psutil.Error:
+            continue
+    psutil.wait_procs(processes, timeout=5)
+    return len(processes)
+
+
+class DriverSupervisor:
+    """Executar etapas vigiando a sessão e substituindo-a quando morre."""
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        factory: Callable[[], WebDriver],
+        on_replace: Callable[[WebDriver], None],
+        dispose: Optional[Callable[[WebDriver], None]] = None,
+        config: Optional[SupervisorConfig] = None,
+    ):
+        """
+        Inicializar supervisor.
+
+        Args:
+            driver: Sessão atual
+            factory: Cria uma sessão substituta (ex.: ``create_driver`` ou ``pool.acquire``)
+            on_replace: Recebe a sessão substituta (ex.: ``attach_driver``)
+            dispose: Descarta a sessão morta após matar seus processos (padrão: ``quit``)
+            config: Prazos e limites
+        """
+        self.driver = driver
+        self.factory = factory
+        self.on_replace = on_replace
+        self.dispose = dispose or (lambda driver: driver.quit())
+        self.config = config or SupervisorConfig()
+        self.step_latency = LatencyRecorder()
+        self.stats = {
+            "heartbeats": 0,
+            "heartbeat_failures": 0,
+            "hangs": 0,
+            "restarts": 0,
+            "retries": 0,
+            "lost_steps": 0,
+        }
+        self._lock = threading.Lock()
+
+    def heartbeat(self) -> bool:
+        """Sessão responde a um script trivial dentro do prazo."""
+        with self._lock:
+            self.stats["heartbeats"] += 1
+        try:
+            alive = (
+                call_with_timeout(
+                    lambda: self.driver.execute_script("return 1;"),
+                    self.config.heartbeat_timeout,
+                )
+                == 1
+            )
+        except Exception as e:
+            logger.warning(f"Heartbeat falhou: {e}")
+            alive = False
+        if not alive:
+            with self._lock:
+                self.stats["heartbeat_failures"] += 1
+        return alive
+
+    def _on_hang(self, step: str, driver: WebDriver) -> None:
+        """Watchdog: etapa excedeu o prazo; matar o navegador destrava a chamada em curso."""
+        with self._lock:
+            self.stats["hangs"] += 1
+        killed = kill_process_tree(driver)
+        logger.error(
+            f"Etapa '{step}' travada após {self.config.step_timeout}s; "
+            f"{killed} processos encerrados"
+        )
+
+    def replace(self, reason: str) -> WebDriver:
+        """
+        Descartar a sessão atual e iniciar uma substituta.
+
+        Raises:
+            SessionLost: Limite de reinícios atingido
+        """
+        with self._lock:
+            if self.stats["restarts"] >= self.config.max_restarts:
+                raise SessionLost(f"Limite de {self.config.max_restarts} reinícios atingido")
+            self.stats["restarts"] += 1
+
+        dead = self.driver
+        logger.warning(f"Substituindo sessão WebDriver ({reason})")
+        kill_process_tree(dead)
+        try:
+            call_with_timeout(lambda: self.dispose(dead), self.config.quit_timeout)
+        except Exception as e:
+            logger.debug(f"Erro ao descartar sessão morta: {e}")
+
+        start = time.perf_counter()
+        self.driver = self.factory()
+        self.on_replace(self.driver)
+        logger.info(f"Sessão substituta pronta em {time.perf_counter() - start:.2f}s")
+        return self.driver
+
+    def _attempt(self, step: str, fn: Callable[[], Any]) -> Any:
+        """Executar a etapa sob o watchdog."""
+        watchdog = None
+        if self.config.step_timeout:
+            watchdog = threading.Timer(
+                self.config.step_timeout, self._on_hang, (step, self.driver)
+            )
+            watchdog.daemon = True
+            watchdog.start()
+        start = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            if watchdog:
+                watchdog.cancel()
+            self.step_latency.record(time.perf_counter() - start)
+
+    def run(self, step: str, fn: Callable[[], Any], idempotent: bool = True) -> Any:
+        """
+        Executar etapa com recuperação de sessão.
+
+        A etapa falhou por queda da sessão quando lança exceção ou retorna
+        ``{"success": False}`` e o heartbeat seguinte não responde. Nesse caso a
+        sessão é substituída e, se a etapa for idempotente, executada de novo.
+
+        Args:
+            step: Nome da etapa (logs)
+            fn: Etapa (usa o driver corrente da automação)
+            idempotent: Pode ser repetida sem efeitos colaterais
+
+        Returns:
+            Resultado da etapa (com ``session_lost`` se a sessão caiu em todas
+            as tentativas)
+
+        Raises:
+            SessionLost: Sessão caiu e a etapa lançou exceção em todas as tentativas
+        """
+        if not self.heartbeat():
+            self.replace(f"sessão morta antes de '{step}'")
+
+        attempts = 1 + (self.config.retries if idempotent else 0)
+        for attempt in range(1, attempts + 1):
+            error: Optional[Exception] = None
+            try:
+                result = self._attempt(step, fn)
+            except Exception as e:
+                error, result = e, None
+
+            failed = error is not None or (
+                isinstance(result, dict) and not result.get("success")
+            )
+            if not failed or self.heartbeat():
+                # Sucesso, ou falha da própria etapa com a sessão viva
+                if error is not None:
+                    raise error
+                return result
+
+            self.replace(f"sessão caiu durante '{step}'")
+            if attempt < attempts:
+                with self._lock:
+                    self.stats["retries"] += 1
+                logger.info(f"Repetindo etapa '{step}' ({attempt + 1}/{attempts})")
+
+        with self._lock:
+            self.stats["lost_steps"] += 1
+        if isinstance(result, dict):
+            # Sessão já substituída: as próximas etapas seguem normalmente
+            return {**result, "session_lost": True}
+        raise SessionLost(f"Sessão caiu durante '{step}'") from error
+
+    def metrics(self) -> Dict:
+        """Contadores de saúde e duração das etapas."""
+        with self._lock:
+            stats = dict(self.stats)
+        return {**stats, "step_latency": self.step_latency.summary()}
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Envio em massa de formulários a partir de planilhas (CSV/Excel/DataFrame).
+
+[OK] Leitura em blocos (``pandas.read_csv(chunksize=...)``; Excel via openpyxl read-only)
+[OK] Colunas mapeadas e validadas antes de ocupar um navegador
+[OK] Linhas distribuídas entre N navegadores do pool, com fila limitada
+[OK] Resultado por linha gravado em CSV à medida que conclui (na ordem da planilha)
+[OK] Checkpoint atômico: execução interrompida retoma após a última linha gravada
+"""
+
+import csv
+import json
+import os
+import re
+import threading
+import time
+from itertools import islice
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from driver_pool import DriverPool, PoolConfig
+from parallel_runner import pooled_automation, save_shared_caches
+from rate_limiter import DomainScheduler
+from selector_cache import SelectorCache
+from selenium_automation import FORM_FIELD_NAMES, WebAutomation
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas está em requirements.txt
+    pd = None
+
+try:
+    from openpyxl import load_workbook
+except ImportError:  # pragma: no cover - openpyxl está em requirements.txt
+    load_workbook = None
+
+# Valores aceitos pelo formulário (também evitam seletores CSS arbitrários)
+PIZZA_SIZES = {"small", "medium", "large"}
+TOPPINGS = {"bacon", "cheese", "onion", "mushroom"}
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+OUTCOME_FIELDS = ["row", "status", "error", "execution_time", "worker"]
+
+
+class RowValidationError(ValueError):
+    """Linha da planilha inválida para o formulário."""
+
+
+def _blank(value: Any) -> bool:
+    """Célula vazia (None, NaN do pandas ou texto em branco)."""
+    return value is None or value != value or str(value).strip() == ""
+
+
+@dataclass
+class FormRowMapper:
+    """Colunas da planilha → chaves de ``form_data``, com validação."""
+
+    # coluna → chave (padrão: colunas com os próprios nomes das chaves)
+    columns: Dict[str, str] = field(default_factory=lambda: {k: k for k in FORM_FIELD_NAMES})
+    required: Tuple[str, ...] = ("customer_name",)
+
+    def map(self, row: Dict[str, Any]) -> Dict:
+        """
+        Converter uma linha em ``form_data``.
+
+        Raises:
+            RowValidationError: Campo obrigatório ausente ou valor inválido
+        """
+        form_data: Dict[str, Any] = {}
+        for column, key in self.columns.items():
+            value = row.get(column)
+            if not _blank(value):
+                form_data[key] = str(value).strip()
+
+        missing = [key for key in self.required if key not in form_data]
+        if missing:
+            raise RowValidationError(f"Campos obrigatórios ausentes: {', '.join(missing)}")
+
+        if "email" in form_data and not EMAIL_PATTERN.match(form_data["email"]):
+            raise RowValidationError(f"E-mail inválido: {form_data['email']}")
+        if "pizza_size" in form_data:
+            form_data["pizza_size"] = form_data["pizza_size"].lower()
+            if form_data["pizza_size"] not in PIZZA_SIZES:
+                raise RowValidationError(f"Tamanho inválido: {form_data['pizza_size']}")
+        if "toppings" in form_data:
+            toppings = [t.strip().lower() for t in re.split(r"[;,]", form_data["toppings"])]
+            toppings = [t for t in toppings if t]
+            unknown = set(toppings) - TOPPINGS
+            if unknown:
+                raise RowValidationError(f"Coberturas inválidas: {', '.join(sorted(unknown))}")
+            form_data["toppings"] = toppings
+        return form_data
+
+
+def read_rows(source: Any, chunksize: int = 1000, skip: int = 0) -> Iterator[Tuple[int, Dict]]:
+    """
+    Ler linhas da planilha sem carregá-la inteira.
+
+    Args:
+        source: Caminho CSV/XLSX, DataFrame ou iterável de dicionários
+        chunksize: Linhas por bloco lido do CSV/DataFrame
+        skip: Linhas de dados já processadas (retomada)
+
+    Yields:
+        (índice da linha de dados, valores por coluna)
+    """
+    if pd is not None and isinstance(source, pd.DataFrame):
+        for start in range(skip, len(source), chunksize):
+            chunk = source.iloc[start : start + chunksize]
+            for offset, record in enumerate(chunk.to_dict("records")):
+                yield start + offset, record
+        return
+    if not isinstance(source, (str, Path)):
+        yield from enumerate(islice(source, skip, None), start=skip)
+        return
+
+    path = Path(source)
+    if path.suffix.lower() in (".xlsx", ".xlsm"):
+        if load_workbook is None:
+            raise ImportError("openpyxl é necessário para ler planilhas Excel")
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [str(name) for name in next(rows, ())]
+            for index, values in enumerate(rows):
+                if index >= skip:
+                    yield index, dict(zip(header, values))
+        finally:
+            workbook.close()
+        return
+
+    if pd is None:
+        raise ImportError("pandas é necessário para ler planilhas CSV")
+    reader = pd.read_csv(
+        path,
+        chunksize=chunksize,
+        dtype=str,
+        keep_default_na=False,
+        skiprows=range(1, skip + 1),
+    )
+    index = skip
+    for chunk in reader:
+        for record in chunk.to_dict("records"):
+            yield index, record
+            index += 1
+
+
+class FormBatchRunner:
+    """Enviar um formulário por linha da planilha usando vários navegadores."""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        browser: str = "chrome",
+        headless: bool = True,
+        pool: Optional[DriverPool] = None,
+        mapper: Optional[FormRowMapper] = None,
+        chunksize: int = 1000,
+        checkpoint_every: int = 50,
+        rate_limiter: Optional[DomainScheduler] = None,
+    ):
+        """
+        Inicializar runner de envio em massa.
+
+        Args:
+            workers: Navegadores/threads simultâneos
+            browser: Navegador a usar
+            headless: Executar sem interface gráfica
+            pool: Pool existente (por padrão um pool com ``workers`` sessões)
+            mapper: Mapeamento e validação das colunas
+            chunksize: Linhas por bloco lido da planilha
+            checkpoint_every: Linhas gravadas entre checkpoints
+            rate_limiter: Limites por domínio (padrão: compartilhado)
+        """
+        self.workers = workers
+        self.browser = browser
+        self.headless = headless
+        self.mapper = mapper or FormRowMapper()
+        self.chunksize = chunksize
+        self.checkpoint_every = checkpoint_every
+        self.rate_limiter = rate_limiter or DomainScheduler.shared()
+        # Compartilhado pelas linhas e salvo uma vez ao final de ``run``
+        self.selector_cache = SelectorCache.shared()
+        self._owns_pool = pool is None
+        self.pool = pool or DriverPool(
+            WebAutomation(browser=browser, headless=headless).create_driver,
+            PoolConfig(size=workers),
+        )
+
+    @staticmethod
+    def checkpoint_path(output: Path) -> Path:
+        """Arquivo de checkpoint de uma saída."""
+        return output.with_name(output.name + ".checkpoint.json")
+
+    def _submit(self, index: int, form_data: Dict) -> Dict:
+        """Enviar uma linha em um driver emprestado do pool."""
+        worker = threading.current_thread().name
+        start = time.perf_counter()
+        try:
+            # Falha ao encerrar a automação é só registrada: a linha enviada não
+            # pode virar falha, ou a retomada a reenviaria
+            with pooled_automation(
+                self.pool,
+                browser=self.browser,
+                headless=self.headless,
+                rate_limiter=self.rate_limiter,
+                selector_cache=self.selector_cache,
+            ) as automation:
+                result = automation.automate_form_filling(form_data)
+            success, error = bool(result.get("success")), result.get("error", "")
+        except Exception as e:
+            success, error = False, str(e)
+
+        return {
+            "row": index,
+            "status": "ok" if success else "failed",
+            "error": error,
+            "execution_time": round(time.perf_counter() - start, 3),
+            "worker": worker,
+        }
+
+    def _save_checkpoint(
+        self, path: Path, source: Any, committed: int, offset: int, counts: Dict
+    ) -> None:
+        """Gravar checkpoint de forma atômica."""
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "source": str(source)
+                    if isinstance(source, (str, Path))
+                    else type(source).__name__,
+                    "committed": committed,
+                    "offset": offset,
+                    "counts": counts,
+                    "updated": datetime.now().isoformat(),
+                },
+                f,
+            )
+        tmp.replace(path)
+
+    def run(self, source: Any, output: Optional[Path] = None, resume: bool = True) -> Dict:
+        """
+        Processar a planilha inteira.
+
+        Resultados são gravados na ordem das linhas; o checkpoint só avança
+        após a gravação (com fsync). Linhas em andamento numa interrupção são
+        reenviadas na retomada.
+
+        Args:
+            source: Caminho CSV/XLSX, DataFrame ou iterável de dicionários
+            output: CSV de resultados (padrão: ``output/form_batch_<timestamp>.csv``)
+            resume: Continuar a partir do checkpoint da saída, se existir
+
+        Returns:
+            Contagens, tempo total e linhas por segundo
+        """
+        if output is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output = Path("output") / f"form_batch_{timestamp}.csv"
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint = self.checkpoint_path(output)
+
+        committed = 0
+        counts = {"ok": 0, "failed": 0, "invalid": 0}
+        if resume and checkpoint.exists() and output.exists():
+            state = json.loads(checkpoint.read_text(encoding="utf-8"))
+            committed, counts = state["committed"], state["counts"]
+            # Linhas gravadas após o último checkpoint serão reenviadas: descartá-las
+            with open(output, "r+b") as fh:
+                fh.truncate(state["offset"])
+            logger.info(f"Retomando {output.name} após a linha {committed}")
+        resumed_from = committed
+
+        start = time.perf_counter()
+        pending: Dict[int, Dict] = {}  # concluídas aguardando as anteriores
+        inflight: Dict[Future, int] = {}
+        max_inflight = self.workers * 2
+
+        with open(output, "a" if committed else "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=OUTCOME_FIELDS)
+            if not committed:
+                writer.writeheader()
+            since_checkpoint = 0
+
+            def collect(futures) -> None:
+                for future in futures:
+                    outcome = future.result()
+                    pending[inflight.pop(future)] = outcome
+
+            def flush() -> None:
+                nonlocal committed, since_checkpoint
+                while committed in pending:
+                    outcome = pending.pop(committed)
+                    writer.writerow(outcome)
+                    counts[outcome["status"]] += 1
+                    committed += 1
+                    since_checkpoint += 1
+                if since_checkpoint >= self.checkpoint_every:
+                    commit()
+
+            def commit() -> None:
+                nonlocal since_checkpoint
+                f.flush()
+                os.fsync(f.fileno())
+                self._save_checkpoint(checkpoint, source, committed, f.tell(), counts)
+                since_checkpoint = 0
+
+            executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="form")
+            try:
+                for index, row in read_rows(source, self.chunksize, skip=committed):
+                    try:
+                        form_data = self.mapper.map(row)
+                    except RowValidationError as e:
+                        pending[index] = {"row": index, "status": "invalid", "error": str(e)}
+                    else:
+                        inflight[executor.submit(self._submit, index, form_data)] = index
+
+                    if len(inflight) >= max_inflight:
+                        done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    flush()
+
+                collect(wait(inflight).done)
+                flush()
+            finally:
+                # Interrupção: gravar o que já concluiu em ordem, descartar a fila
+                for future in list(inflight):
+                    if future.cancel():
+                        inflight.pop(future)
+                executor.shutdown(wait=True)
+                collect([future for future in inflight if not future.cancelled()])
+                flush()
+                commit()
+                save_shared_caches(self.selector_cache)
+
+        processed = committed - resumed_from
+        wall_time = time.perf_counter() - start
+        logger.success(
+            "Envio em massa concluído",
+            rows=processed,
+            ok=counts["ok"],
+            time=f"{wall_time:.3f}s",
+        )
+        return {
+            "success": True,
+            "output": str(output),
+            "checkpoint": str(checkpoint),
+            "resumed_from": resumed_from,
+            "rows_processed": processed,
+            "total_rows": committed,
+            **counts,
+            "wall_time": round(wall_time, 3),
+            "rows_per_sec": round(processed / wall_time, 3) if wall_time else 0.0,
+            "driver_pool": self.pool.metrics(),
+        }
+
+    def close(self) -> None:
+        """Encerrar o pool criado pelo runner."""
+        if self._owns_pool:
+            self.pool.close()
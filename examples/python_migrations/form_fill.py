@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Preenchimento de formulários em lote com uma única chamada.
+
+Aplica um mapeamento seletor → valor/estado com um único ``execute_script``:
+[OK] Valores definidos pelo setter nativo (compatível com frameworks reativos)
+[OK] Eventos ``input`` e ``change`` disparados como na digitação
+[OK] Checkboxes/radios marcados via ``click()`` somente quando necessário
+[OK] Verificação dos valores aplicados na mesma chamada
+[OK] Modo por tecla (``send_keys``) para campos que exigem digitação real
+"""
+
+import json
+from typing import Dict, Iterable, List, Mapping, Union
+
+from loguru import logger
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# str = valor do campo; bool = estado de checkbox/radio
+FieldValue = Union[str, bool]
+
+FILL_MODES = ("script", "keys")
+
+FILL_SCRIPT = """
+var fields = arguments[0];
+
+function find(selector) {
+  try { return document.querySelector(selector); } catch (e) { return null; }
+}
+
+function setValue(el, value) {
+  var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+    : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+    : HTMLInputElement.prototype;
+  var descriptor = Object.getOwnPropertyDescriptor(proto, "value");
+  if (descriptor && descriptor.set) {
+    descriptor.set.call(el, value);
+  } else {
+    el.value = value;
+  }
+  el.dispatchEvent(new Event("input", {bubbles: true}));
+  el.dispatchEvent(new Event("change", {bubbles: true}));
+}
+
+var results = [];
+for (var i = 0; i < fields.length; i++) {
+  var f = fields[i], el = find(f.selector);
+  if (!el) {
+    results.push({selector: f.selector, found: false, ok: false, actual: null});
+    continue;
+  }
+  if (f.apply) {
+    if (f.checked !== null) {
+      if (el.checked !== f.checked) { el.click(); }
+    } else {
+      setValue(el, f.value);
+    }
+  }
+  var actual = f.checked !== null ? el.checked : el.value;
+  var expected = f.checked !== null ? f.checked : f.value;
+  results.push({selector: f.selector, found: true, ok: actual === expected, actual: actual});
+}
+return JSON.stringify(results);
+"""
+
+
+def _entry(selector: str, value: FieldValue, apply: bool) -> Dict:
+    """Item da especificação enviada ao navegador."""
+    is_checkbox = isinstance(value, bool)
+    return {
+        "selector": selector,
+        "value": None if is_checkbox else str(value),
+        "checked": value if is_checkbox else None,
+        "apply": apply,
+    }
+
+
+def _type_field(driver: WebDriver, selector: str, value: FieldValue) -> bool:
+    """Caminho por tecla: find_element + clear + send_keys (ou clique)."""
+    try:
+        element = driver.find_element(By.CSS_SELECTOR, selector)
+        if isinstance(value, bool):
+            if element.is_selected() != value:
+                driver.execute_script("arguments[0].click();", element)
+        else:
+            element.clear()
+            element.send_keys(str(value))
+        return True
+    except WebDriverException as e:
+        logger.debug(f"Campo '{selector}' não preenchido por tecla: {e}")
+        return False
+
+
+def fill_form(
+    driver: WebDriver,
+    fields: Mapping[str, FieldValue],
+    mode: str = "script",
+    keys_fields: Iterable[str] = (),
+) -> Dict[str, List]:
+    """
+    Preencher e verificar campos de formulário.
+
+    Args:
+        driver: WebDriver na página do formulário
+        fields: Seletor CSS → valor (str) ou estado marcado (bool)
+        mode: ``script`` (uma chamada) ou ``keys`` (send_keys por campo)
+        keys_fields: Seletores que exigem digitação real mesmo no modo ``script``
+
+    Returns:
+        Dicionário com ``filled``, ``missing`` e ``mismatched`` (seletores)
+    """
+    if mode not in FILL_MODES:
+        raise ValueError(f"Modo de preenchimento inválido: {mode}")
+
+    keys_fields = set(keys_fields)
+    typed = [s for s in fields if mode == "keys" or s in keys_fields]
+    for selector in typed:
+        _type_field(driver, selector, fields[selector])
+
+    # Campos digitados são apenas verificados; os demais são aplicados e verificados
+    spec = [_entry(s, v, s not in typed) for s, v in fields.items()]
+    payload = driver.execute_script(FILL_SCRIPT, spec)
+    results = json.loads(payload) if payload else []
+
+    report: Dict[str, List] = {"filled": [], "missing": [], "mismatched": []}
+    for item in results:
+        if not item["found"]:
+            report["missing"].append(item["selector"])
+        elif not item["ok"]:
+            report["mismatched"].append(item["selector"])
+        else:
+            report["filled"].append(item["selector"])
+
+    if report["missing"] or report["mismatched"]:
+        logger.warning(
+            f"Preenchimento incompleto: ausentes={report['missing']} "
+            f"divergentes={report['mismatched']}"
+        )
+    return report
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Envio de formulários estáticos via HTTP, sem navegador.
+
+Formulários simples (ex.: httpbin ``/forms/post``) não precisam de um
+navegador para serem submetidos:
+[OK] Detecção de formulários estáticos com ``html.parser`` (stdlib)
+[OK] Ação, método e campos extraídos uma única vez por página
+[OK] ``requests.Session`` com keep-alive e pool de conexões por thread
+[OK] Envios em paralelo preservando a ordem das entradas
+[OK] Fallback para Selenium quando o formulário depende de JavaScript
+[OK] Envio já transmitido nunca é repetido pelo navegador (sem pedidos duplicados)
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from urllib.parse import urljoin
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from metrics import LatencyRecorder
+
+FieldValue = Union[str, Sequence[str]]
+
+SKIPPED_INPUT_TYPES = {"submit", "button", "image", "reset"}
+CHECKABLE_INPUT_TYPES = {"checkbox", "radio"}
+# Trechos de script inline que indicam envio controlado por JavaScript
+JS_SUBMIT_MARKERS = ("submit", "preventDefault", "XMLHttpRequest", "fetch(")
+# Referências a formulários sem id/nome (``document.forms``, ``querySelector('form')``)
+GENERIC_FORM_REF = re.compile(r"document\.forms\b|['\"`]form\b")
+
+
+class BrowserRequired(Exception):
+    """O formulário depende de JavaScript e precisa do caminho Selenium."""
+
+
+class SubmissionSent(Exception):
+    """O envio falhou depois de transmitido: repetir no navegador pode duplicá-lo."""
+
+
+def _sent_before_failure(error: requests.RequestException) -> bool:
+    """A requisição pode ter chegado ao servidor antes do erro?"""
+    if isinstance(error, requests.ConnectTimeout):
+        return False
+    if isinstance(error, requests.ConnectionError):
+        # MaxRetryError.reason: conexão recusada ou DNS falhou antes do envio
+        reason = error.args[0] if error.args else None
+        return not isinstance(getattr(reason, "reason", reason), NewConnectionError)
+    return True
+
+
+def _script_targets(script: str, refs: Sequence[str]) -> bool:
+    """Script inline faz referência ao formulário (id, nome ou seletor genérico)?"""
+    if GENERIC_FORM_REF.search(script):
+        return True
+    return any(
+        re.search(rf"['\"`](?:[^'\"`]*#)?{re.escape(ref)}['\"`\]]", script) for ref in refs
+    )
+
+
+@dataclass
+class StaticForm:
+    """Formulário extraído do HTML."""
+
+    action: str
+    method: str = "get"
+    enctype: str = "application/x-www-form-urlencoded"
+    # Valores padrão enviados pelo navegador (campos marcados/preenchidos)
+    defaults: List[Tuple[str, str]] = field(default_factory=list)
+    # Todos os nomes de campo e opções de checkbox/radio/select
+    fields: Dict[str, List[str]] = field(default_factory=dict)
+    # Motivos pelos quais o formulário exige navegador
+    js_reasons: List[str] = field(default_factory=list)
+
+    @property
+    def is_static(self) -> bool:
+        """Formulário pode ser enviado diretamente via HTTP."""
+        return not self.js_reasons
+
+
+class FormParser(HTMLParser):
+    """Extrair formulários e sinais de dependência de JavaScript."""
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.forms: List[StaticForm] = []
+        # id/nome de cada formulário, para associar scripts inline
+        self.form_refs: List[List[str]] = []
+        self.scripts: List[str] = []
+        self._form: Optional[StaticForm] = None
+        self._textarea: Optional[Tuple[str, List[str]]] = None
+        self._select: Optional[Tuple[str, List[Tuple[str, bool]]]] = None
+        self._option: Optional[List] = None
+        self._in_script = False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attr = {name: value or "" for name, value in attrs}
+
+        if tag == "script":
+            self._in_script = "src" not in attr
+            if self._in_script:
+                self.scripts.append("")
+        elif tag == "form":
+            action = attr.get("action", "")
+            self._form = StaticForm(
+                action=urljoin(self.base_url, action),
+                method=(attr.get("method") or "get").lower(),
+                enctype=attr.get("enctype") or "application/x-www-form-urlencoded",
+            )
+            if "onsubmit" in attr:
+                self._form.js_reasons.append("onsubmit")
+            if action.strip().lower().startswith("javascript:"):
+                self._form.js_reasons.append("javascript: action")
+            self.forms.append(self._form)
+            self.form_refs.append([attr[key] for key in ("id", "name") if attr.get(key)])
+        elif self._form is not None:
+            self._form_control(tag, attr)
+
+    def _form_control(self, tag: str, attr: Dict[str, str]) -> None:
+        """Registrar campo de formulário."""
+        name = attr.get("name")
+        if tag in ("button", "input") and "onclick" in attr:
+            self._form.js_reasons.append(f"onclick em {name or tag}")
+        if "disabled" in attr and tag in ("input", "textarea", "select", "option"):
+            # O navegador não envia campos (nem opções) desabilitados
+            return
+
+        if tag == "input" and name:
+            kind = attr.get("type", "text").lower()
+            if kind in SKIPPED_INPUT_TYPES:
+                return
+            if kind == "file":
+                self._form.js_reasons.append(f"upload de arquivo ({name})")
+                return
+            value = attr.get("value", "on" if kind in CHECKABLE_INPUT_TYPES else "")
+            options = self._form.fields.setdefault(name, [])
+            if kind in CHECKABLE_INPUT_TYPES:
+                options.append(value)
+                if "checked" in attr:
+                    self._form.defaults.append((name, value))
+            else:
+                self._form.defaults.append((name, value))
+        elif tag == "textarea" and name:
+            self._form.fields.setdefault(name, [])
+            self._textarea = (name, [])
+        elif tag == "select" and name:
+            self._form.fields.setdefault(name, [])
+            self._select = (name, [])
+        elif tag == "option" and self._select is not None:
+            self._option = [attr.get("value"), "selected" in attr, []]
+
+    def handle_data(self, data: str) -> None:
+        if self._in_script:
+            self.scripts[-1] += data
+        elif self._textarea is not None:
+            self._textarea[1].append(data)
+        elif self._option is not None:
+            self._option[2].append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script":
+            self._in_script = False
+        elif tag == "form":
+            self._form = None
+        elif tag == "textarea" and self._textarea is not None:
+            name, chunks = self._textarea
+            self._form.defaults.append((name, "".join(chunks)))
+            self._textarea = None
+        elif tag == "option" and self._option is not None:
+            value, selected, text = self._option
+            value = "".join(text).strip() if value is None else value
+            self._select[1].append((value, selected))
+            self._form.fields[self._select[0]].append(value)
+            self._option = None
+        elif tag == "select" and self._select is not None:
+            name, options = self._select
+            selected = [value for value, chosen in options if chosen] or [
+                value for value, _ in options[:1]
+            ]
+            self._form.defaults += [(name, value) for value in selected]
+            self._select = None
+
+
+def parse_forms(html: str, base_url: str) -> List[StaticForm]:
+    """
+    Extrair formulários de uma página.
+
+    Scripts externos (``<script src>``) não são considerados: apenas handlers
+    inline (``onsubmit``/``onclick``) e scripts inline que interceptam o envio
+    do próprio formulário (por id, nome ou seletor genérico) marcam o
+    formulário como dependente de JavaScript.
+
+    Args:
+        html: Conteúdo da página
+        base_url: URL da página (para resolver ``action`` relativa)
+
+    Returns:
+        Formulários na ordem do documento
+    """
+    parser = FormParser(base_url)
+    parser.feed(html)
+    parser.close()
+
+    for form, refs in zip(parser.forms, parser.form_refs):
+        markers = {
+            marker
+            for script in parser.scripts
+            if _script_targets(script, refs)
+            for marker in JS_SUBMIT_MARKERS
+            if marker in script
+        }
+        if markers:
+            form.js_reasons.append(f"script inline ({', '.join(sorted(markers))})")
+    return parser.forms
+
+
+class HybridFormExecutor:
+    """Submeter formulários via HTTP, com fallback para o navegador."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        pool_size: int = 10,
+        timeout: float = 15.0,
+        fallback: Optional[Callable[[Dict], Dict]] = None,
+    ):
+        """
+        Inicializar executor.
+
+        Args:
+            workers: Threads para envios em paralelo
+            pool_size: Conexões keep-alive por host em cada sessão
+            timeout: Timeout de cada requisição (s)
+            fallback: Envio via Selenium para formulários que exigem JavaScript
+        """
+        self.workers = workers
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.fallback = fallback
+        self._local = threading.local()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._sessions: List[requests.Session] = []
+        self._forms: Dict[Tuple[str, int], StaticForm] = {}
+        self._lock = threading.Lock()
+        self.latency = LatencyRecorder()
+        self.stats = {"http": 0, "selenium": 0, "discovered": 0, "errors": 0}
+
+    @property
+    def session(self) -> requests.Session:
+        """Sessão keep-alive da thread atual."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def discover(self, page_url: str, index: int = 0) -> StaticForm:
+        """
+        Obter formulário da página (baixado e analisado uma única vez).
+
+        Raises:
+            BrowserRequired: Página sem o formulário solicitado
+        """
+        key = (page_url, index)
+        with self._lock:
+            cached = self._forms.get(key)
+        if cached:
+            return cached
+
+        response = self.session.get(page_url, timeout=self.timeout)
+        response.raise_for_status()
+        forms = parse_forms(response.text, response.url)
+        if len(forms) <= index:
+            raise BrowserRequired(f"Formulário {index} não encontrado em {page_url}")
+
+        form = forms[index]
+        with self._lock:
+            self._forms[key] = form
+            self.stats["discovered"] += 1
+        if not form.is_static:
+            logger.info(f"Formulário em {page_url} requer navegador: {form.js_reasons}")
+        return form
+
+    @staticmethod
+    def build_payload(form: StaticForm, values: Mapping[str, FieldValue]) -> List[Tuple]:
+        """Valores padrão do formulário sobrescritos pelos informados."""
+        unknown = set(values) - set(form.fields)
+        if unknown:
+            raise BrowserRequired(f"Campos inexistentes no formulário: {sorted(unknown)}")
+
+        payload = [(name, value) for name, value in form.defaults if name not in values]
+        for name, value in values.items():
+            items = [value] if isinstance(value, str) else list(value)
+            payload += [(name, str(item)) for item in items]
+        return payload
+
+    def submit(self, page_url: str, values: Mapping[str, FieldValue], index: int = 0) -> Dict:
+        """
+        Submeter formulário com os valores informados.
+
+        Args:
+            page_url: Página que contém o formulário
+            values: Nome do campo → valor (lista para checkboxes)
+            index: Posição do formulário na página
+
+        Returns:
+            Resultado com ``transport`` ("http" ou "selenium")
+
+        Raises:
+            BrowserRequired: Formulário exige navegador e não há fallback
+            SubmissionSent: Falha após transmitir um envio não idempotente
+            requests.RequestException: Falha antes do envio (seguro repetir)
+        """
+        start = time.perf_counter()
+        try:
+            form = self.discover(page_url, index)
+            if not form.is_static:
+                raise BrowserRequired(", ".join(form.js_reasons))
+            payload = self.build_payload(form, values)
+        except BrowserRequired:
+            if not self.fallback:
+                raise
+            result = self.fallback(dict(values))
+            with self._lock:
+                self.stats["selenium"] += 1
+            return {**result, "transport": "selenium"}
+
+        try:
+            if form.method == "post":
+                response = self.session.post(form.action, data=payload, timeout=self.timeout)
+            else:
+                response = self.session.get(form.action, params=payload, timeout=self.timeout)
+        except requests.RequestException as e:
+            if form.method != "get" and _sent_before_failure(e):
+                raise SubmissionSent(f"{form.method.upper()} {form.action}: {e}") from e
+            raise
+
+        elapsed = time.perf_counter() - start
+        self.latency.record(elapsed)
+        with self._lock:
+            self.stats["http"] += 1
+            self.stats["errors"] += 0 if response.ok else 1
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text[:500]
+
+        return {
+            "transport": "http",
+            "status_code": response.status_code,
+            "fields_filled": len({name for name, _ in payload if name in values}),
+            "response": body,
+            "execution_time": round(elapsed, 3),
+            "timestamp": datetime.now().isoformat(),
+            "success": response.ok,
+        }
+
+    def submit_many(
+        self, page_url: str, payloads: Sequence[Mapping[str, FieldValue]], index: int = 0
+    ) -> List[Dict]:
+        """Submeter vários formulários em paralelo (resultados na ordem de entrada)."""
+        self.discover(page_url, index)
+
+        def run(values: Mapping[str, FieldValue]) -> Dict:
+            try:
+                return self.submit(page_url, values, index)
+            except Exception as e:
+                logger.warning(f"Envio HTTP falhou: {e}")
+                with self._lock:
+                    self.stats["errors"] += 1
+                return {"error": str(e), "success": False, "transport": "http"}
+
+        # Threads persistentes: cada uma reutiliza sua sessão keep-alive entre lotes
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="http"
+                )
+            pool = self._pool
+        return list(pool.map(run, payloads))
+
+    def metrics(self) -> Dict:
+        """Contagem por transporte e latência dos envios HTTP."""
+        with self._lock:
+            stats = dict(self.stats)
+        return {**stats, "latency": self.latency.summary()}
+
+    def close(self) -> None:
+        """Encerrar threads e fechar sessões HTTP."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            sessions, self._sessions = self._sessions, []
+        if pool:
+            pool.shutdown(wait=True)
+        for session in sessions:
+            session.close()
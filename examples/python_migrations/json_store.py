@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Base dos armazenamentos JSON persistidos em output/.
+
+Caches de seletores, consultas, drivers e estado de sessão compartilham o
+mesmo ciclo de vida:
+[OK] Instância única por arquivo (``shared``), compartilhada entre workers
+[OK] Leitura tolerante: arquivo ausente ou corrompido é ignorado com aviso
+[OK] Escrita atômica sob o lock (temporário exclusivo + ``os.replace``)
+[OK] Alterações pendentes (``_dirty``) só descartadas após gravar com sucesso
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+
+class JsonStore:
+    """
+    Armazenamento JSON com instância compartilhada e gravação atômica.
+
+    Subclasses definem ``DEFAULT_PATH`` e ``LABEL``, implementam ``_payload``
+    e marcam ``self._dirty`` (com ``self._lock``) a cada alteração.
+    """
+
+    DEFAULT_PATH: Optional[Path] = None
+    LABEL = "Arquivo JSON"
+
+    _instances: Dict[Tuple[type, Optional[Path]], "JsonStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Optional[Path]):
+        """
+        Inicializar armazenamento.
+
+        Args:
+            path: Arquivo JSON de persistência (None = somente memória)
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @classmethod
+    def shared(cls, path: Optional[Path] = None):
+        """Instância única por arquivo (None = ``DEFAULT_PATH`` da classe)."""
+        path = Path(path) if path else cls.DEFAULT_PATH
+        with JsonStore._instances_lock:
+            key = (cls, path)
+            if key not in JsonStore._instances:
+                JsonStore._instances[key] = cls(path)
+            return JsonStore._instances[key]
+
+    def _read(self, key: str, default: Any) -> Any:
+        """Valor de ``key`` no arquivo (``default`` se ausente ou corrompido)."""
+        if not self.path or not self.path.exists():
+            return default
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f).get(key, default)
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"{self.LABEL} ignorado ({self.path}): {e}")
+            return default
+
+    def _payload(self) -> Dict:
+        """Conteúdo a gravar (chamado com ``self._lock`` adquirido)."""
+        raise NotImplementedError
+
+    def save(self) -> None:
+        """Persistir alterações pendentes (escrita atômica)."""
+        if not self.path:
+            return
+
+        # Instância compartilhada entre workers: serializar e gravar sob o mesmo lock
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps(self._payload(), indent=2, ensure_ascii=False)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Temporário exclusivo: outros processos gravando o mesmo arquivo não colidem
+            fd, tmp = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+            self._dirty = False
+        logger.debug(f"{self.LABEL} salvo: {self.path}")
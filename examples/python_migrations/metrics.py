@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Métricas de latência compartilhadas pelas automações web.
+
+[OK] Amostras limitadas (memória constante)
+[OK] Percentis p50/p95
+[OK] Thread-safe
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable
+
+
+def percentile(samples: Iterable[float], pct: float) -> float:
+    """Calcular percentil por interpolação linear."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class LatencyRecorder:
+    """Registrar latências mantendo apenas as amostras mais recentes."""
+
+    def __init__(self, max_samples: int = 1000):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Adicionar amostra (segundos)."""
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+
+    def summary(self) -> Dict[str, float]:
+        """Resumo com contagem total e percentis da janela recente."""
+        with self._lock:
+            samples = list(self._samples)
+            count, total = self.count, self.total
+
+        return {
+            "count": count,
+            "mean": round(total / count, 4) if count else 0.0,
+            "p50": round(percentile(samples, 50), 4),
+            "p95": round(percentile(samples, 95), 4),
+            "max": round(max(samples), 4) if samples else 0.0,
+        }
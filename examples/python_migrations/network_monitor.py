@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Monitor de atividade de rede via log de performance do Chrome.
+
+Eventos ``Network.*`` do DevTools chegam pelo log ``performance`` do
+ChromeDriver; a página está pronta quando o tráfego assenta:
+[OK] Requisições em andamento rastreadas por ``requestId``
+[OK] ``wait_for_network_idle(idle_ms, max_inflight)`` sem sleeps fixos
+[OK] Requisições, bytes e falhas por página
+[OK] Status HTTP do documento principal (detecção de 429 pelo limitador de domínio)
+[OK] Indisponível (Firefox/outros) → ``available`` falso, chamador usa as esperas JS
+"""
+
+import json
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from loguru import logger
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+Condition = Callable[[WebDriver], bool]
+
+
+class NetworkMonitor:
+    """Requisições em andamento e tráfego por página a partir dos eventos do DevTools."""
+
+    def __init__(self, driver: WebDriver, poll_frequency: float = 0.05):
+        """
+        Inicializar monitor (consome o log de performance do driver).
+
+        Args:
+            driver: WebDriver criado com ``NetworkMonitor.enable``
+            poll_frequency: Intervalo entre leituras do log nas esperas
+        """
+        self.driver = driver
+        self.poll_frequency = poll_frequency
+        self._inflight: Set[str] = set()
+        self._last_activity = time.perf_counter()
+        self.pages: List[Dict] = []
+        # Status HTTP do último documento principal carregado na página atual
+        self.document_status: Optional[int] = None
+        # Frame da navegação: primeiro documento pedido após ``begin_page``
+        self._main_frame: Optional[str] = None
+        self.available = self._probe()
+
+    @staticmethod
+    def enable(options: ChromeOptions) -> None:
+        """Habilitar log de performance apenas com eventos de rede."""
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option(
+            "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+        )
+
+    def _probe(self) -> bool:
+        """Verificar se o driver expõe o log de performance."""
+        try:
+            entries = self.driver.get_log("performance")
+        except (WebDriverException, AttributeError):
+            logger.debug("Log de performance indisponível - monitor de rede desativado")
+            return False
+        return isinstance(entries, list)
+
+    def _current(self) -> Optional[Dict]:
+        return self.pages[-1] if self.pages else None
+
+    def poll(self) -> int:
+        """Processar eventos pendentes do log; retorna quantos foram lidos."""
+        if not self.available:
+            return 0
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException as e:
+            logger.debug(f"Falha ao ler log de performance: {e}")
+            return 0
+
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            self._handle(message.get("method", ""), message.get("params", {}))
+        return len(entries)
+
+    def _handle(self, method: str, params: Dict) -> None:
+        """Atualizar requisições em andamento e contadores da página."""
+        request_id = params.get("requestId")
+        page = self._current()
+
+        if method == "Network.requestWillBeSent":
+            self._inflight.add(request_id)
+            self._last_activity = time.perf_counter()
+            if page is not None:
+                page["requests"] += 1
+            if params.get("type") == "Document" and self._main_frame is None:
+                self._main_frame = params.get("frameId")
+        elif method == "Network.responseReceived" and params.get("type") == "Document":
+            # Documentos de iframes (anúncios, widgets) não definem o status da página
+            if params.get("frameId") == self._main_frame:
+                self.document_status = params.get("response", {}).get("status")
+        elif method == "Network.loadingFinished" and request_id in self._inflight:
+            self._inflight.discard(request_id)
+            self._last_activity = time.perf_counter()
+            if page is not None:
+                page["bytes"] += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and request_id in self._inflight:
+            self._inflight.discard(request_id)
+            self._last_activity = time.perf_counter()
+            if page is not None and not params.get("canceled"):
+                page["failed"] += 1
+
+    @property
+    def inflight(self) -> int:
+        """Requisições iniciadas e ainda não concluídas."""
+        return len(self._inflight)
+
+    def begin_page(self, label: str) -> None:
+        """Iniciar contagem de uma nova página (chamar antes de navegar)."""
+        if not self.available:
+            return
+        # Eventos anteriores pertencem à página anterior
+        self.poll()
+        self._inflight.clear()
+        self.document_status = None
+        self._main_frame = None
+        self._last_activity = time.perf_counter()
+        self.pages.append({"page": label, "requests": 0, "bytes": 0, "failed": 0})
+
+    def idle(self, idle_ms: int = 500, max_inflight: int = 0) -> Condition:
+        """
+        Condição: no máximo ``max_inflight`` requisições por ``idle_ms`` seguidos.
+
+        ``max_inflight`` tolera conexões longas (long-polling, analytics). Com
+        ``max_inflight=0`` qualquer evento de rede reinicia a contagem.
+        """
+        quiet_since: List[Optional[float]] = [None]
+
+        def _condition(driver: WebDriver) -> bool:
+            self.poll()
+            now = time.perf_counter()
+            if len(self._inflight) > max_inflight:
+                quiet_since[0] = None
+                return False
+            if max_inflight == 0:
+                since = self._last_activity
+            else:
+                since = quiet_since[0] = quiet_since[0] or now
+            return (now - since) * 1000 >= idle_ms
+
+        return _condition
+
+    def wait_for_network_idle(
+        self, idle_ms: int = 500, max_inflight: int = 0, timeout: float = 10.0
+    ) -> bool:
+        """
+        Aguardar o tráfego de rede assentar.
+
+        Args:
+            idle_ms: Tempo contínuo sem atividade acima do limite (ms)
+            max_inflight: Requisições em andamento toleradas
+            timeout: Prazo máximo (s)
+
+        Returns:
+            True se a rede assentou no prazo (False também se indisponível)
+        """
+        if not self.available:
+            return False
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(
+                self.idle(idle_ms, max_inflight)
+            )
+            return True
+        except TimeoutException:
+            logger.debug(f"Rede não assentou em {timeout}s ({self.inflight} em andamento)")
+            return False
+
+    def pop_pages(self) -> List[Dict]:
+        """Retornar e zerar as estatísticas por página."""
+        self.poll()
+        pages, self.pages = self.pages, []
+        return pages
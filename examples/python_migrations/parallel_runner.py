@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Execução paralela da suite Selenium em vários navegadores headless.
+
+[OK] Distribui etapas independentes e muitas entradas entre N workers
+[OK] Resultados mantêm a ordem das entradas
+[OK] Falha de um job não afeta os demais
+[OK] Tempo total e throughput reportados
+[OK] Ritmo por domínio compartilhado entre os workers (token bucket + backoff)
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from driver_pool import DriverPool, PoolConfig
+from rate_limiter import DomainScheduler
+from selector_cache import SelectorCache
+from selenium_automation import WebAutomation
+
+
+@contextmanager
+def pooled_automation(pool: DriverPool, **automation_kwargs) -> Iterator[WebAutomation]:
+    """
+    WebAutomation sobre um driver emprestado do pool, encerrada ao sair do bloco.
+
+    O driver volta ao pool pelo lease; a automação encerra apenas os próprios
+    recursos (screenshots, revalidações pendentes). Os caches compartilhados
+    são salvos uma vez por lote por quem executa os jobs. Erros do
+    encerramento são registrados e não alteram o resultado do job.
+    """
+    with pool.lease() as driver:
+        automation = WebAutomation(**automation_kwargs)
+        automation.attach_driver(driver)
+        try:
+            yield automation
+        finally:
+            try:
+                automation.detach_driver()
+                automation.cleanup(save_caches=False)
+            except Exception as e:
+                logger.warning(f"Falha ao encerrar automação do job: {e}")
+
+
+def save_shared_caches(selector_cache: SelectorCache) -> None:
+    """Salvar o placar de seletores ao final de um lote (falha apenas registrada)."""
+    try:
+        selector_cache.save()
+    except OSError as e:
+        logger.warning(f"Cache de seletores não salvo: {e}")
+
+
+@dataclass
+class SuiteJob:
+    """Job executado por um worker: método de WebAutomation e argumentos."""
+
+    method: str
+    args: Tuple = field(default_factory=tuple)
+
+    @property
+    def label(self) -> str:
+        """Nome legível do job."""
+        return f"{self.method}({', '.join(repr(a)[:30] for a in self.args)})"
+
+
+class ParallelSuiteRunner:
+    """Distribuir jobs de WebAutomation entre vários navegadores."""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        browser: str = "chrome",
+        headless: bool = True,
+        pool: Optional[DriverPool] = None,
+        profile: str = "default",
+        rate_limiter: Optional[DomainScheduler] = None,
+    ):
+        """
+        Inicializar runner paralelo.
+
+        Args:
+            workers: Número de navegadores/threads simultâneos
+            browser: Navegador a usar
+            headless: Executar sem interface gráfica
+            pool: Pool existente (por padrão um pool com ``workers`` sessões)
+            profile: Perfil dos drivers criados pelo pool (ex.: "throughput")
+            rate_limiter: Limites por domínio de todos os workers (padrão: compartilhado)
+        """
+        self.workers = workers
+        self.browser = browser
+        self.headless = headless
+        self.rate_limiter = rate_limiter or DomainScheduler.shared()
+        # Compartilhado pelos jobs e salvo uma vez ao final de ``run``
+        self.selector_cache = SelectorCache.shared()
+        self._owns_pool = pool is None
+        self.pool = pool or DriverPool(
+            WebAutomation(browser=browser, headless=headless, profile=profile).create_driver,
+            PoolConfig(size=workers),
+        )
+
+    def _run_job(self, index: int, job: SuiteJob) -> Dict:
+        """Executar um job isolado em um driver emprestado do pool."""
+        worker = threading.current_thread().name
+        start = time.perf_counter()
+
+        try:
+            with pooled_automation(
+                self.pool,
+                browser=self.browser,
+                headless=self.headless,
+                rate_limiter=self.rate_limiter,
+                selector_cache=self.selector_cache,
+            ) as automation:
+                result = getattr(automation, job.method)(*job.args)
+        except Exception as e:
+            logger.warning(f"Job {job.label} falhou no worker {worker}: {e}")
+            result = {
+                "error": str(e),
+                "success": False,
+                "timestamp": datetime.now().isoformat(),
+            }
+
+        result.update(
+            {
+                "job": job.method,
+                "job_index": index,
+                "worker": worker,
+                "wall_time": round(time.perf_counter() - start, 3),
+            }
+        )
+        return result
+
+    def run(self, jobs: Sequence[SuiteJob]) -> Dict:
+        """
+        Executar jobs em paralelo.
+
+        Args:
+            jobs: Jobs a executar
+
+        Returns:
+            Resultados na ordem dos jobs, tempo total e throughput
+        """
+        logger.info(f"Executando {len(jobs)} jobs em {self.workers} workers")
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="web"
+        ) as executor:
+            futures = [executor.submit(self._run_job, i, job) for i, job in enumerate(jobs)]
+            results = [future.result() for future in futures]
+        save_shared_caches(self.selector_cache)
+
+        wall_time = time.perf_counter() - start
+        successful = sum(1 for r in results if r.get("success", False))
+
+        per_worker: Dict[str, Dict[str, float]] = {}
+        for r in results:
+            stats = per_worker.setdefault(r["worker"], {"jobs": 0, "failures": 0, "busy": 0.0})
+            stats["jobs"] += 1
+            stats["failures"] += 0 if r.get("success", False) else 1
+            stats["busy"] = round(stats["busy"] + r["wall_time"], 3)
+
+        logger.success(
+            "Execução paralela concluída",
+            jobs=len(jobs),
+            successful=successful,
+            time=f"{wall_time:.3f}s",
+        )
+
+        return {
+            "success": True,
+            "results": results,
+            "total_jobs": len(jobs),
+            "successful_jobs": successful,
+            "workers": self.workers,
+            "wall_time": round(wall_time, 3),
+            "throughput": round(len(jobs) / wall_time, 3) if wall_time else 0.0,
+            "per_worker": per_worker,
+            "driver_pool": self.pool.metrics(),
+            "rate_limits": self.rate_limiter.metrics(),
+        }
+
+    def run_suite(
+        self, queries: Iterable[str] = (), form_payloads: Iterable[Dict] = ()
+    ) -> Dict:
+        """
+        Executar a suite padrão distribuindo suas etapas independentes.
+
+        Args:
+            queries: Pesquisas Google (padrão: a mesma da suite sequencial)
+            form_payloads: Dados de formulário (padrão: o mesmo da suite sequencial)
+        """
+        queries = list(queries) or ["Python automation selenium"]
+        form_payloads = list(form_payloads) or [
+            {
+                "customer_name": "Teste Automação",
+                "email": "teste@automation.com",
+                "pizza_size": "large",
+                "toppings": ["bacon", "cheese"],
+                "comments": "Pedido de teste via automação Python",
+            }
+        ]
+
+        jobs: List[SuiteJob] = [SuiteJob("test_simple_form")]
+        jobs += [SuiteJob("search_google", (query,)) for query in queries]
+        jobs += [SuiteJob("automate_form_filling", (payload,)) for payload in form_payloads]
+
+        return self.run(jobs)
+
+    def save_results(self, report: Dict) -> Path:
+        """Salvar relatório da execução paralela em JSON."""
+        output_dir = Path("output")
+        output_dir.mkdir(exist_ok=True)
+        filename = (
+            output_dir / f"parallel_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+        logger.info(f"Resultados salvos: {filename}")
+        return filename
+
+    def close(self) -> None:
+        """Encerrar o pool criado pelo runner."""
+        if self._owns_pool:
+            self.pool.close()
+
+
+def main():
+    """Executar suite em paralelo."""
+    runner = ParallelSuiteRunner(workers=3, headless=True)
+    try:
+        report = runner.run_suite(
+            queries=["Python automation selenium", "selenium webdriver wait"]
+        )
+        runner.save_results(report)
+        print(f"✅ {report['successful_jobs']}/{report['total_jobs']} jobs com sucesso")
+        print(f"⏱️  Tempo total: {report['wall_time']}s ({report['throughput']} jobs/s)")
+    finally:
+        runner.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Cache de resultados de pesquisa por consulta normalizada.
+
+Consultas repetidas não precisam de uma nova navegação completa:
+[OK] LRU em memória com persistência opcional em disco (JSON)
+[OK] TTL por fonte (ex.: Google expira antes da documentação Python)
+[OK] Stale-while-revalidate: resultado vencido entregue na hora e atualizado depois
+[OK] Estatísticas de acertos, vencidos, faltas e despejos
+[OK] Thread-safe (compartilhado entre workers)
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from json_store import JsonStore
+
+Fetch = Callable[[], Dict]
+
+DEFAULT_CACHE_PATH = Path("output") / "query_cache.json"
+
+# Validade (s) dos resultados de cada fonte
+DEFAULT_TTLS = {"google": 3600.0, "python_docs": 86400.0}
+
+# Medições da busca original: não descrevem um resultado servido do cache
+TIMING_FIELDS = ("execution_time", "timestamp", "network")
+
+
+def normalize_query(query: str) -> str:
+    """Consulta canônica: sem diferença de caixa ou de espaços."""
+    return " ".join(query.split()).casefold()
+
+
+class QueryCache(JsonStore):
+    """LRU de resultados por (fonte, consulta) com TTL e revalidação adiada."""
+
+    LABEL = "Cache de consultas"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: int = 256,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 3600.0,
+        stale_ttl: float = 86400.0,
+    ):
+        """
+        Inicializar cache.
+
+        Args:
+            path: Arquivo JSON de persistência (None = somente memória)
+            max_entries: Entradas mantidas (as menos usadas são despejadas)
+            ttls: Validade por fonte (s), sobre ``DEFAULT_TTLS``
+            default_ttl: Validade das fontes sem TTL próprio
+            stale_ttl: Tempo após o vencimento em que o resultado ainda é servido
+        """
+        super().__init__(path)
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._revalidating: set = set()
+        self.counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "revalidation_errors": 0,
+            "evictions": 0,
+        }
+        self._load()
+
+    def _load(self) -> None:
+        """Carregar entradas válidas do disco (ignora arquivo ausente ou corrompido)."""
+        now = time.time()
+        for key, entry in self._read("entries", []):
+            if self._age_state(entry, now) != "expired":
+                self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def key(source: str, query: str, scope: str = "") -> str:
+        """Chave da entrada: fonte, escopo (ex.: host) e consulta normalizada."""
+        return f"{source}@{scope}|{normalize_query(query)}"
+
+    def _age_state(self, entry: Dict, now: float) -> str:
+        """``fresh``, ``stale`` (servível) ou ``expired``."""
+        age = now - entry["stored"]
+        ttl = self.ttls.get(entry["source"], self.default_ttl)
+        if age < ttl:
+            return "fresh"
+        return "stale" if age < ttl + self.stale_ttl else "expired"
+
+    def get(self, source: str, query: str, scope: str = "") -> Tuple[Optional[Dict], str]:
+        """
+        Consultar o cache sem buscar.
+
+        Returns:
+            (resultado ou None, estado: ``fresh``, ``stale`` ou ``miss``)
+        """
+        key = self.key(source, query, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            state = self._age_state(entry, time.time()) if entry else "miss"
+            if state == "expired":
+                del self._entries[key]
+                self._dirty = True
+                state = "miss"
+
+            if state == "miss":
+                self.counters["misses"] += 1
+                return None, state
+
+            self._entries.move_to_end(key)
+            entry["hits"] += 1
+            self.counters["hits" if state == "fresh" else "stale_hits"] += 1
+            return copy.deepcopy(entry["value"]), state
+
+    def put(self, source: str, query: str, value: Dict, scope: str = "") -> None:
+        """Armazenar resultado (despeja os menos usados acima do limite)."""
+        key = self.key(source, query, scope)
+        with self._lock:
+            self._entries[key] = {
+                "source": source,
+                "query": query,
+                "value": copy.deepcopy(value),
+                "stored": time.time(),
+                "hits": 0,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.counters["evictions"] += 1
+            self._dirty = True
+
+    def get_or_fetch(
+        self,
+        source: str,
+        query: str,
+        fetch: Fetch,
+        scope: str = "",
+        deferred: Optional[List[Callable[[], None]]] = None,
+    ) -> Dict:
+        """
+        Resultado do cache ou da busca; apenas resultados com ``success`` são guardados.
+
+        Um resultado vencido (dentro de ``stale_ttl``) é devolvido imediatamente e
+        a busca de atualização é adiada: acrescentada a ``deferred``, para quem
+        controla o navegador executar quando ele estiver livre, ou executada em
+        uma thread própria se ``deferred`` for None (buscas thread-safe, ex. HTTP).
+
+        Args:
+            source: Fonte (define o TTL), ex.: ``google``
+            query: Consulta original
+            fetch: Busca sem cache
+            scope: Diferencia instâncias da mesma fonte (ex.: host)
+            deferred: Fila de revalidações a executar depois
+
+        Returns:
+            Resultado com as chaves ``cache`` (``hit``, ``stale`` ou ``miss``) e
+            ``cached``; acertos não trazem ``TIMING_FIELDS`` da busca original
+        """
+        value, state = self.get(source, query, scope)
+        if state == "miss":
+            value = fetch()
+            if value.get("success"):
+                self.put(source, query, value, scope)
+            return {**value, "cache": "miss", "cached": False}
+
+        if state == "stale":
+            key = self.key(source, query, scope)
+            with self._lock:
+                schedule = key not in self._revalidating
+                self._revalidating.add(key)
+            if schedule:
+
+                def revalidate() -> None:
+                    self._revalidate(source, query, fetch, scope)
+
+                # Chave liberada por ``cancel_deferred`` se a revalidação nunca rodar
+                revalidate.key = key
+                if deferred is not None:
+                    deferred.append(revalidate)
+                else:
+                    threading.Thread(target=revalidate, name="query-revalidate").start()
+
+        served = {name: item for name, item in value.items() if name not in TIMING_FIELDS}
+        return {**served, "cache": "hit" if state == "fresh" else "stale", "cached": True}
+
+    def cancel_deferred(self, deferred: List[Callable[[], None]]) -> int:
+        """
+        Descartar revalidações adiadas que não vão rodar (ex.: sem navegador).
+
+        As consultas voltam a poder ser revalidadas no próximo acerto vencido.
+
+        Returns:
+            Quantidade de revalidações descartadas
+        """
+        keys = [getattr(task, "key", None) for task in deferred]
+        with self._lock:
+            self._revalidating.difference_update(keys)
+        deferred.clear()
+        return len(keys)
+
+    def _revalidate(self, source: str, query: str, fetch: Fetch, scope: str) -> None:
+        """Buscar novamente um resultado vencido (falha mantém o vencido)."""
+        key = self.key(source, query, scope)
+        try:
+            value = fetch()
+            if value.get("success"):
+                self.put(source, query, value, scope)
+                outcome = "revalidations"
+            else:
+                outcome = "revalidation_errors"
+        except Exception as e:
+            logger.warning(f"Revalidação de '{query}' ({source}) falhou: {e}")
+            outcome = "revalidation_errors"
+        with self._lock:
+            self.counters[outcome] += 1
+            self._revalidating.discard(key)
+
+    def stats(self) -> Dict:
+        """Contadores, taxa de acerto e ocupação."""
+        with self._lock:
+            counters = dict(self.counters)
+            entries = len(self._entries)
+            pending = len(self._revalidating)
+        lookups = counters["hits"] + counters["stale_hits"] + counters["misses"]
+        served = counters["hits"] + counters["stale_hits"]
+        return {
+            **counters,
+            "entries": entries,
+            "pending_revalidations": pending,
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0,
+        }
+
+    def _payload(self) -> Dict:
+        """Entradas na ordem LRU para ``save``."""
+        return {"updated": time.time(), "entries": list(self._entries.items())}
+
+
+def run_deferred(deferred: List[Callable[[], None]]) -> int:
+    """Executar revalidações adiadas (esvazia a fila); retorna quantas rodaram."""
+    count = 0
+    while deferred:
+        deferred.pop(0)()
+        count += 1
+    return count
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Limite de requisições por domínio para jobs web.
+
+Todos os workers de ``WebAutomation`` do processo compartilham o mesmo
+agendador, então paralelizar não multiplica o ritmo de acesso a um site:
+[OK] Token bucket por domínio (taxa + rajada), com fila justa (reserva de tokens)
+[OK] Limite de navegações simultâneas por domínio
+[OK] Domínios sem política configurada não são limitados (só recebem backoff)
+[OK] Backoff exponencial com jitter ao detectar 429/503 ou captcha
+[OK] Métricas de espera na fila e taxa efetiva por domínio
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional
+
+from loguru import logger
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from metrics import LatencyRecorder
+from web_urls import host_of
+
+# Status HTTP que indicam limitação pelo servidor
+THROTTLE_STATUS = {429, 503}
+
+# Página de bloqueio: /sorry/ do Google, widgets de captcha ou aviso de tráfego incomum
+BLOCKED_SCRIPT = """
+const text = document.body ? document.body.innerText.slice(0, 2000) : '';
+return location.pathname.indexOf('/sorry/') === 0 ||
+    !!document.querySelector("#captcha-form, .g-recaptcha, iframe[src*='recaptcha']") ||
+    /unusual traffic|tráfego incomum/i.test(text);
+"""
+
+
+@dataclass
+class DomainPolicy:
+    """Ritmo permitido para um domínio (None = sem limite)."""
+
+    rate: Optional[float] = None  # requisições por segundo (média)
+    burst: int = 1
+    max_concurrency: Optional[int] = None
+    backoff_base: float = 2.0
+    backoff_max: float = 120.0
+
+
+# Buscadores bloqueiam rápido: uma navegação por vez, no máximo uma a cada 5s
+DEFAULT_POLICIES = {
+    "www.google.com": DomainPolicy(rate=0.2, burst=1, max_concurrency=1, backoff_base=10.0),
+}
+
+
+def is_blocked(driver: WebDriver) -> bool:
+    """Página atual é um captcha/aviso anti-bot (False se não for possível verificar)."""
+    try:
+        return bool(driver.execute_script(BLOCKED_SCRIPT))
+    except WebDriverException:
+        return False
+
+
+class TokenBucket:
+    """Token bucket com reserva: cada chamador recebe o instante do seu token."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializar bucket cheio.
+
+        Args:
+            rate: Tokens por segundo
+            burst: Capacidade (requisições imediatas após ociosidade)
+            clock: Relógio monotônico (injetável em testes)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reservar um token.
+
+        Returns:
+            Segundos até o token estar disponível (0 = imediato)
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Saldo negativo = fila: quem chegou depois espera mais
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class _DomainState:
+    """Bucket, vagas e histórico de bloqueios de um domínio."""
+
+    def __init__(self, policy: DomainPolicy):
+        self.policy = policy
+        self.bucket = TokenBucket(policy.rate, policy.burst) if policy.rate else None
+        self.slots = (
+            threading.BoundedSemaphore(policy.max_concurrency)
+            if policy.max_concurrency
+            else None
+        )
+        self.queue_wait = LatencyRecorder()
+        self.strikes = 0
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.backoff_seconds = 0.0
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+
+
+class DomainScheduler:
+    """Agendador compartilhado de acessos por domínio."""
+
+    _instance: Optional["DomainScheduler"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, DomainPolicy]] = None,
+        default: Optional[DomainPolicy] = None,
+    ):
+        """
+        Inicializar agendador.
+
+        Args:
+            policies: Política por domínio (padrão: ``DEFAULT_POLICIES``)
+            default: Política dos demais domínios (padrão: sem limite de ritmo)
+        """
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.default = default or DomainPolicy()
+        self._domains: Dict[str, _DomainState] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "DomainScheduler":
+        """Instância única do processo (compartilhada por todos os workers)."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def _state(self, url: str) -> _DomainState:
+        host = host_of(url)
+        with self._lock:
+            if host not in self._domains:
+                self._domains[host] = _DomainState(self.policies.get(host, self.default))
+            return self._domains[host]
+
+    def throttle(self, url: str) -> float:
+        """
+        Aguardar a vez de acessar o domínio (token + backoff pendente).
+
+        Returns:
+            Segundos aguardados
+        """
+        return self._take(self._state(url), time.monotonic())
+
+    def _take(self, state: _DomainState, queued_at: float) -> float:
+        """Consumir token (e backoff); espera contada desde a entrada na fila."""
+        delay = state.bucket.reserve() if state.bucket else 0.0
+        with self._lock:
+            delay = max(delay, state.blocked_until - time.monotonic())
+        if delay > 0:
+            time.sleep(delay)
+
+        now = time.monotonic()
+        waited = now - queued_at
+        with self._lock:
+            state.requests += 1
+            state.first = state.first if state.first is not None else now
+            state.last = now
+        state.queue_wait.record(waited)
+        return waited
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[float]:
+        """
+        Ocupar uma vaga do domínio durante a navegação.
+
+        Yields:
+            Segundos aguardados (vaga + token)
+        """
+        state = self._state(url)
+        start = time.monotonic()
+        if state.slots is None:
+            yield self._take(state, start)
+            return
+        state.slots.acquire()
+        try:
+            yield self._take(state, start)
+        finally:
+            state.slots.release()
+
+    def report(
+        self,
+        url: str,
+        status: Optional[int] = None,
+        blocked: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> float:
+        """
+        Informar o resultado de um acesso.
+
+        Limitação (429/503 ou captcha) suspende o domínio por um backoff
+        exponencial com jitter; um acesso normal zera o histórico.
+
+        Args:
+            url: Endereço acessado
+            status: Status HTTP do documento (se conhecido)
+            blocked: Página de captcha/bloqueio detectada
+            retry_after: Cabeçalho Retry-After (s), respeitado como mínimo
+
+        Returns:
+            Backoff aplicado (0 = acesso normal)
+        """
+        state = self._state(url)
+        if not blocked and status not in THROTTLE_STATUS:
+            with self._lock:
+                state.strikes = 0
+            return 0.0
+
+        policy = state.policy
+        with self._lock:
+            state.strikes += 1
+            state.throttled += 1
+            ceiling = min(policy.backoff_max, policy.backoff_base * 2 ** (state.strikes - 1))
+            # Jitter evita que todos os workers voltem ao mesmo tempo
+            delay = max(random.uniform(ceiling / 2, ceiling), retry_after or 0.0)
+            state.blocked_until = max(state.blocked_until, time.monotonic() + delay)
+            state.backoff_seconds += delay
+            strikes = state.strikes
+
+        logger.warning(
+            f"Limitação em {host_of(url)} (status={status}, captcha={blocked}): "
+            f"pausa de {delay:.1f}s (ocorrência {strikes})"
+        )
+        return delay
+
+    def metrics(self) -> Dict[str, Dict]:
+        """Espera na fila, taxa efetiva e bloqueios por domínio."""
+        with self._lock:
+            domains = dict(self._domains)
+        metrics = {}
+        for host, state in domains.items():
+            span = (state.last - state.first) if state.first is not None else 0.0
+            metrics[host] = {
+                "requests": state.requests,
+                "effective_rate": (
+                    round((state.requests - 1) / span, 3)
+                    if state.requests > 1 and span
+                    else 0.0
+                ),
+                "configured_rate": state.policy.rate,
+                "max_concurrency": state.policy.max_concurrency,
+                "throttled": state.throttled,
+                "backoff_seconds": round(state.backoff_seconds, 3),
+                "queue_wait": state.queue_wait.summary(),
+            }
+        return metrics
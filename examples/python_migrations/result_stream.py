@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Streaming de resultados paginados com pré-carregamento da próxima página.
+
+Gera resultados sob demanda, página a página:
+[OK] Próxima página carregada em outra aba enquanto o consumidor processa a atual
+[OK] Limites de quantidade, páginas e tempo
+[OK] Deduplicação de links com janela limitada (memória constante)
+[OK] Apenas uma página de resultados em memória por vez
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from selector_probe import wait_for_any
+from tab_scheduler import navigate, page_at
+
+Locator = Tuple[str, str]
+
+
+class BoundedDedup:
+    """Conjunto de chaves vistas limitado às ``max_items`` mais recentes."""
+
+    def __init__(self, max_items: int = 10000):
+        self.max_items = max_items
+        self._seen: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def add(self, key: Hashable) -> bool:
+        """Registrar chave; False se já vista (dentro da janela)."""
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return False
+        self._seen[key] = None
+        if len(self._seen) > self.max_items:
+            self._seen.popitem(last=False)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+def stream_results(
+    driver: WebDriver,
+    page_url: Callable[[int], str],
+    extract_page: Callable[[], List[Dict]],
+    ready: Sequence[Locator],
+    max_results: Optional[int] = 100,
+    max_pages: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    prefetch: bool = True,
+    page_timeout: float = 20.0,
+    dedup_window: int = 10000,
+    key: Callable[[Dict], Hashable] = lambda item: item.get("link"),
+    stats: Optional[Dict] = None,
+) -> Iterator[Dict]:
+    """
+    Gerar resultados de várias páginas sob demanda.
+
+    Enquanto o consumidor processa uma página, a seguinte já carrega em uma
+    segunda aba do mesmo driver. O driver não deve ser usado pelo consumidor
+    entre dois itens.
+
+    Args:
+        driver: WebDriver em uso
+        page_url: Índice da página (0, 1, ...) → URL
+        extract_page: Extrai os resultados da página atual
+        ready: Seletores que indicam página de resultados carregada
+        max_results: Máximo de resultados gerados (None = sem limite)
+        max_pages: Máximo de páginas (None = até acabar)
+        time_budget: Tempo máximo (s) desde o início
+        prefetch: Pré-carregar a próxima página em outra aba
+        page_timeout: Prazo para cada página ficar pronta
+        dedup_window: Quantidade de chaves lembradas para deduplicação
+        key: Chave de deduplicação de cada item
+        stats: Dicionário preenchido com estatísticas da execução
+
+    Yields:
+        Itens com ``position`` (global) e ``page``
+    """
+    stats = {} if stats is None else stats
+    stats.update(
+        {"pages": 0, "yielded": 0, "duplicates": 0, "prefetched": 0, "stopped_by": None}
+    )
+    start = time.perf_counter()
+    seen = BoundedDedup(dedup_window)
+
+    original = driver.current_window_handle
+    tabs = [original]
+    if prefetch:
+        driver.switch_to.new_window("tab")
+        tabs.append(driver.current_window_handle)
+        driver.switch_to.window(original)
+
+    def over_budget(pending: int = 0) -> Optional[str]:
+        if max_results is not None and stats["yielded"] + pending >= max_results:
+            return "max_results"
+        if time_budget is not None and time.perf_counter() - start >= time_budget:
+            return "time_budget"
+        return None
+
+    def exhausted(next_page: int, pending: int = 0) -> Optional[str]:
+        if max_pages is not None and next_page >= max_pages:
+            return "max_pages"
+        return over_budget(pending)
+
+    try:
+        page = 0
+        prefetched: Optional[str] = None
+        driver.get(page_url(page))
+
+        while True:
+            try:
+                if prefetched:
+                    # Página pré-carregada pronta quando o novo documento substituiu o anterior
+                    WebDriverWait(driver, page_timeout, poll_frequency=0.05).until(
+                        page_at(prefetched)
+                    )
+                wait_for_any(driver, ready, page_timeout)
+            except TimeoutException:
+                stats["stopped_by"] = "page_timeout"
+                break
+
+            items = extract_page()
+            stats["pages"] += 1
+            next_page = page + 1
+
+            # Próxima página começa a carregar antes de entregar a atual (se a
+            # página atual não bastar para atingir o limite de resultados)
+            prefetched = None
+            if prefetch and not exhausted(next_page, len(items)):
+                prefetched = page_url(next_page)
+                driver.switch_to.window(tabs[next_page % 2])
+                navigate(driver, prefetched)
+                stats["prefetched"] += 1
+
+            new_items = 0
+            for item in items:
+                if not seen.add(key(item)):
+                    stats["duplicates"] += 1
+                    continue
+                if over_budget():
+                    break
+                new_items += 1
+                stats["yielded"] += 1
+                yield {**item, "position": stats["yielded"], "page": page + 1}
+
+            stats["stopped_by"] = exhausted(next_page)
+            if stats["stopped_by"]:
+                break
+            if not new_items:
+                stats["stopped_by"] = "no_new_results"
+                break
+
+            page = next_page
+            if not prefetched:
+                driver.get(page_url(page))
+    finally:
+        stats["elapsed"] = round(time.perf_counter() - start, 3)
+        try:
+            for handle in tabs[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(original)
+        except WebDriverException as e:
+            logger.debug(f"Erro ao fechar aba de pré-carregamento: {e}")
+        logger.info(
+            f"Streaming concluído: {stats['yielded']} resultados em {stats['pages']} páginas "
+            f"({stats['stopped_by']})"
+        )
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Captura de screenshots com gravação em segundo plano.
+
+A etapa só espera a captura (bytes base64 do navegador); decodificação,
+deduplicação e escrita em disco ficam com um pool de threads:
+[OK] ``Page.captureScreenshot`` via CDP com PNG, JPEG ou WebP (qualidade ajustável)
+[OK] Recorte por elemento ou por região (``clip``) da página
+[OK] Quadros idênticos gravados uma única vez (hash SHA-256, hardlink para o original)
+[OK] Fallback para ``get_screenshot_as_base64`` em navegadores sem CDP (somente PNG)
+[OK] Métricas de captura, escrita, bytes e duplicatas
+"""
+
+import base64
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from metrics import LatencyRecorder
+
+FORMATS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+
+# Retângulo do elemento em coordenadas da página (CSS px), formato do ``clip`` do CDP
+ELEMENT_RECT_SCRIPT = """
+const r = arguments[0].getBoundingClientRect();
+return {x: r.left + window.scrollX, y: r.top + window.scrollY,
+        width: r.width, height: r.height};
+"""
+
+
+class ScreenshotPipeline:
+    """Capturar na thread do driver; decodificar e gravar em segundo plano."""
+
+    def __init__(
+        self,
+        output_dir: Path = Path("output"),
+        image_format: str = "png",
+        quality: int = 80,
+        workers: int = 2,
+        dedup: bool = True,
+        max_hashes: int = 256,
+    ):
+        """
+        Inicializar pipeline.
+
+        Args:
+            output_dir: Diretório dos arquivos
+            image_format: Formato padrão (png, jpeg ou webp)
+            quality: Qualidade padrão de JPEG/WebP (0-100)
+            workers: Threads de gravação
+            dedup: Gravar quadros idênticos uma única vez
+            max_hashes: Quadros recentes lembrados para deduplicação (memória limitada)
+        """
+        if image_format not in FORMATS:
+            raise ValueError(f"Formato não suportado: {image_format}")
+        self.output_dir = Path(output_dir)
+        self.image_format = image_format
+        self.quality = quality
+        self.workers = workers
+        self.dedup = dedup
+        self.max_hashes = max_hashes
+        self.capture_latency = LatencyRecorder()
+        self.write_latency = LatencyRecorder()
+        self.stats = {"captured": 0, "written": 0, "duplicates": 0, "bytes": 0, "errors": 0}
+        self._by_hash: "OrderedDict[str, Path]" = OrderedDict()
+        self._pending: List[Future] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _grab(
+        self,
+        driver: WebDriver,
+        image_format: str,
+        quality: int,
+        element: Optional[WebElement],
+        clip: Optional[Dict],
+    ) -> Tuple[str, str]:
+        """Obter bytes base64 do navegador; retorna (dados, formato efetivo)."""
+        if element is not None and clip is None:
+            clip = driver.execute_script(ELEMENT_RECT_SCRIPT, element)
+
+        if hasattr(driver, "execute_cdp_cmd"):
+            params: Dict = {"format": image_format, "captureBeyondViewport": clip is not None}
+            if image_format != "png":
+                params["quality"] = quality
+            if clip is not None:
+                params["clip"] = {"scale": 1, **clip}
+            try:
+                data = driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"]
+                return data, image_format
+            except WebDriverException as e:
+                logger.debug(f"Page.captureScreenshot indisponível: {e}")
+
+        if image_format != "png" or (clip is not None and element is None):
+            logger.debug("Captura sem CDP: PNG da janela inteira ou do elemento")
+        if element is not None:
+            return element.screenshot_as_base64, "png"
+        return driver.get_screenshot_as_base64(), "png"
+
+    def capture(
+        self,
+        driver: WebDriver,
+        filename: str,
+        element: Optional[WebElement] = None,
+        clip: Optional[Dict] = None,
+        image_format: Optional[str] = None,
+        quality: Optional[int] = None,
+    ) -> str:
+        """
+        Capturar screenshot e agendar a gravação.
+
+        Args:
+            driver: WebDriver (chamado apenas nesta thread)
+            filename: Nome do arquivo (a extensão segue o formato efetivo)
+            element: Capturar apenas este elemento
+            clip: Região da página ``{"x", "y", "width", "height"}`` em CSS px
+            image_format: png, jpeg ou webp (padrão do pipeline)
+            quality: Qualidade de JPEG/WebP (padrão do pipeline)
+
+        Returns:
+            Path do arquivo (disponível após ``flush``)
+        """
+        image_format = image_format or self.image_format
+        if image_format not in FORMATS:
+            raise ValueError(f"Formato não suportado: {image_format}")
+
+        start = time.perf_counter()
+        data, image_format = self._grab(
+            driver,
+            image_format,
+            self.quality if quality is None else quality,
+            element,
+            clip,
+        )
+        self.capture_latency.record(time.perf_counter() - start)
+
+        path = (self.output_dir / filename).with_suffix(FORMATS[image_format])
+        with self._lock:
+            self.stats["captured"] += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="screenshot"
+                )
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(self._executor.submit(self._write, data, path))
+        return str(path)
+
+    def _write(self, data: str, path: Path) -> None:
+        """Decodificar, deduplicar e gravar (thread de gravação)."""
+        start = time.perf_counter()
+        try:
+            raw = base64.b64decode(data)
+            digest = hashlib.sha256(raw).hexdigest()
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with self._lock:
+                # ``path`` vai ser sobrescrito: hashes antigos não descrevem mais o arquivo
+                for stale in [
+                    d for d, p in self._by_hash.items() if p == path and d != digest
+                ]:
+                    del self._by_hash[stale]
+                original = self._by_hash.get(digest) if self.dedup else None
+                if original is None:
+                    self._by_hash[digest] = path
+                    if len(self._by_hash) > self.max_hashes:
+                        self._by_hash.popitem(last=False)
+
+            if original is not None and original != path and self._link(original, path):
+                with self._lock:
+                    self.stats["duplicates"] += 1
+                return
+
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(raw)
+            tmp.replace(path)
+            with self._lock:
+                self.stats["written"] += 1
+                self.stats["bytes"] += len(raw)
+        except Exception as e:
+            with self._lock:
+                self.stats["errors"] += 1
+            logger.warning(f"Erro ao gravar screenshot {path}: {e}")
+        finally:
+            self.write_latency.record(time.perf_counter() - start)
+
+    @staticmethod
+    def _link(original: Path, path: Path) -> bool:
+        """Apontar ``path`` para o arquivo já gravado (False = gravar cópia)."""
+        try:
+            if path.exists():
+                path.unlink()
+            os.link(original, path)
+            return True
+        except OSError:
+            return False
+
+    def flush(self, timeout: Optional[float] = None) -> int:
+        """
+        Aguardar gravações pendentes.
+
+        Returns:
+            Quantidade de gravações aguardadas
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result(timeout=timeout)
+        return len(pending)
+
+    def close(self) -> None:
+        """Concluir gravações pendentes e encerrar as threads."""
+        self.flush()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def metrics(self) -> Dict:
+        """Contadores e latências de captura/gravação."""
+        with self._lock:
+            stats = dict(self.stats)
+        return {
+            **stats,
+            "capture_latency": self.capture_latency.summary(),
+            "write_latency": self.write_latency.summary(),
+        }
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Cache persistente de seletores bem-sucedidos.
+
+Aprende qual alternativa de seletor funciona em cada (site, finalidade):
+[OK] Reordena candidatos pelo sucesso recente (decaimento exponencial)
+[OK] Persiste em disco entre execuções (JSON)
+[OK] Estatísticas de deriva (troca do seletor vencedor)
+[OK] Thread-safe (compartilhado entre workers)
+"""
+
+import math
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+
+from json_store import JsonStore
+
+Locator = Tuple[str, str]
+Candidate = Union[Locator, str]
+
+DEFAULT_CACHE_PATH = Path("output") / "selector_cache.json"
+
+
+def _key(candidate: Candidate) -> str:
+    """Chave textual de um seletor (localizador ou CSS)."""
+    return candidate if isinstance(candidate, str) else f"{candidate[0]}={candidate[1]}"
+
+
+class SelectorCache(JsonStore):
+    """Placar de seletores por (site, finalidade) com decaimento temporal."""
+
+    DEFAULT_PATH = DEFAULT_CACHE_PATH
+    LABEL = "Cache de seletores"
+
+    def __init__(self, path: Optional[Path] = DEFAULT_CACHE_PATH, half_life_days: float = 7.0):
+        """
+        Inicializar cache.
+
+        Args:
+            path: Arquivo JSON de persistência (None = somente memória)
+            half_life_days: Meia-vida do placar de cada seletor
+        """
+        super().__init__(path)
+        self.half_life = half_life_days * 86400
+        self._entries: Dict[str, Dict] = self._read("entries", {})
+
+    def _decayed(self, score: float, updated: float, now: float) -> float:
+        """Aplicar decaimento exponencial ao placar."""
+        if self.half_life <= 0:
+            return score
+        return score * math.pow(0.5, max(0.0, now - updated) / self.half_life)
+
+    def order(
+        self, site: str, purpose: str, candidates: Sequence[Candidate]
+    ) -> List[Candidate]:
+        """
+        Ordenar candidatos pelo sucesso recente (empates mantêm a ordem original).
+
+        Args:
+            site: Domínio da página
+            purpose: Finalidade do seletor (ex.: ``search_box``)
+            candidates: Alternativas na ordem padrão
+
+        Returns:
+            Alternativas reordenadas
+        """
+        now = time.time()
+        with self._lock:
+            scores = self._entries.get(f"{site}|{purpose}", {}).get("selectors", {})
+            ranked = {
+                _key(c): self._decayed(
+                    scores[_key(c)]["score"], scores[_key(c)]["updated"], now
+                )
+                for c in candidates
+                if _key(c) in scores
+            }
+        return sorted(candidates, key=lambda c: -ranked.get(_key(c), 0.0))
+
+    def record(self, site: str, purpose: str, candidate: Candidate) -> None:
+        """Registrar sucesso de um seletor."""
+        now = time.time()
+        key = _key(candidate)
+
+        with self._lock:
+            entry = self._entries.setdefault(
+                f"{site}|{purpose}", {"selectors": {}, "winner": None, "drift": 0}
+            )
+            stats = entry["selectors"].setdefault(
+                key, {"score": 0.0, "updated": now, "successes": 0}
+            )
+            stats["score"] = self._decayed(stats["score"], stats["updated"], now) + 1.0
+            stats["updated"] = now
+            stats["successes"] += 1
+
+            if entry["winner"] not in (None, key):
+                entry["drift"] += 1
+                logger.info(
+                    f"Deriva de seletor em {site}/{purpose}: {entry['winner']} -> {key}"
+                )
+            entry["winner"] = key
+            self._dirty = True
+
+    def stats(self) -> Dict[str, Dict]:
+        """Vencedor atual, deriva e sucessos por (site, finalidade)."""
+        with self._lock:
+            return {
+                name: {
+                    "winner": entry["winner"],
+                    "drift": entry["drift"],
+                    "successes": {k: v["successes"] for k, v in entry["selectors"].items()},
+                }
+                for name, entry in self._entries.items()
+            }
+
+    def _payload(self) -> Dict:
+        """Placar completo para ``save``."""
+        return {"updated": time.time(), "entries": self._entries}
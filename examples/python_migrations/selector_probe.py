@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Sondagem de seletores alternativos sem o custo do implicit wait.
+
+Com ``driver.implicitly_wait(15)`` cada ``find_element`` de um seletor
+ausente bloqueia até 15 s. Este módulo:
+[OK] Desativa temporariamente o implicit wait durante sondagens
+[OK] Testa todas as alternativas em cada ciclo de polling
+[OK] Usa um único prazo compartilhado para o conjunto de alternativas
+[OK] Espera composta (OR) que informa qual seletor venceu
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Set, Tuple, Union
+
+from loguru import logger
+from selenium.common.exceptions import InvalidSelectorException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+Locator = Tuple[str, str]
+Scope = Union[WebDriver, WebElement]
+
+
+@dataclass
+class ProbeResult:
+    """Alternativa vencedora de uma sondagem."""
+
+    locator: Locator
+    element: WebElement
+    index: int
+    elapsed: float
+
+
+def _driver_of(scope: Scope) -> WebDriver:
+    """WebDriver dono do escopo (driver ou elemento)."""
+    return scope.parent if isinstance(scope, WebElement) else scope
+
+
+@contextmanager
+def implicit_wait_disabled(driver: WebDriver) -> Iterator[None]:
+    """Zerar o implicit wait durante o bloco e restaurar o valor anterior."""
+    try:
+        previous = driver.timeouts.implicit_wait
+    except Exception:
+        previous = 0
+
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        driver.implicitly_wait(previous)
+
+
+def first_match(
+    scope: Scope,
+    candidates: Sequence[Locator],
+    displayed: bool = False,
+    invalid: Optional[Set[int]] = None,
+) -> Optional[Tuple[int, Locator, WebElement]]:
+    """
+    Uma passada por todas as alternativas (sem esperar).
+
+    Args:
+        scope: WebDriver ou elemento onde buscar
+        candidates: Localizadores alternativos, em ordem de preferência
+        displayed: Exigir que o elemento esteja visível e habilitado
+        invalid: Índices de seletores inválidos (atualizado e ignorado)
+
+    Returns:
+        (índice, localizador, elemento) da primeira alternativa presente
+    """
+    invalid = set() if invalid is None else invalid
+
+    for index, locator in enumerate(candidates):
+        if index in invalid:
+            continue
+        try:
+            elements = scope.find_elements(*locator)
+        except InvalidSelectorException:
+            logger.debug(f"Seletor inválido ignorado: {locator[1]}")
+            invalid.add(index)
+            continue
+        except WebDriverException:
+            continue
+
+        for element in elements:
+            try:
+                if displayed and not (element.is_displayed() and element.is_enabled()):
+                    continue
+            except WebDriverException:
+                continue
+            return index, locator, element
+
+    return None
+
+
+def probe(
+    scope: Scope,
+    candidates: Sequence[Locator],
+    timeout: float = 0.0,
+    poll_frequency: float = 0.05,
+    displayed: bool = False,
+) -> Optional[ProbeResult]:
+    """
+    Procurar a primeira alternativa presente dentro de um prazo único.
+
+    Args:
+        scope: WebDriver ou elemento onde buscar
+        candidates: Localizadores alternativos, em ordem de preferência
+        timeout: Prazo total para todas as alternativas (0 = uma única passada)
+        poll_frequency: Intervalo entre passadas
+        displayed: Exigir que o elemento esteja visível e habilitado
+
+    Returns:
+        Alternativa encontrada ou None ao esgotar o prazo
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+    invalid: Set[int] = set()
+
+    with implicit_wait_disabled(_driver_of(scope)):
+        while True:
+            match = first_match(scope, candidates, displayed, invalid)
+            if match:
+                index, locator, element = match
+                return ProbeResult(locator, element, index, time.perf_counter() - start)
+
+            if time.perf_counter() >= deadline:
+                return None
+            time.sleep(poll_frequency)
+
+
+class any_present:
+    """
+    Expected condition composta: qualquer uma das alternativas presente.
+
+    Retorna ``(índice, localizador, elemento)`` da primeira encontrada, para
+    uso com ``WebDriverWait.until``.
+    """
+
+    def __init__(self, candidates: Sequence[Locator], displayed: bool = False):
+        self.candidates = list(candidates)
+        self.displayed = displayed
+        self._invalid: Set[int] = set()
+
+    def __call__(self, driver: WebDriver):
+        return first_match(driver, self.candidates, self.displayed, self._invalid) or False
+
+
+def wait_for_any(
+    driver: WebDriver,
+    candidates: Sequence[Locator],
+    timeout: float,
+    displayed: bool = False,
+    poll_frequency: float = 0.1,
+) -> ProbeResult:
+    """
+    Aguardar qualquer alternativa em um único loop de polling.
+
+    O pior caso é limitado por um timeout, não pela soma de um timeout por
+    seletor.
+
+    Args:
+        driver: WebDriver em uso
+        candidates: Localizadores alternativos
+        timeout: Prazo total
+        displayed: Exigir elemento visível e habilitado
+        poll_frequency: Intervalo entre passadas
+
+    Returns:
+        Alternativa vencedora
+
+    Raises:
+        TimeoutException: Nenhuma alternativa apareceu no prazo
+    """
+    start = time.perf_counter()
+    with implicit_wait_disabled(driver):
+        index, locator, element = WebDriverWait(
+            driver, timeout, poll_frequency=poll_frequency
+        ).until(
+            any_present(candidates, displayed),
+            message=f"Nenhum seletor encontrado: {[c[1] for c in candidates]}",
+        )
+    return ProbeResult(locator, element, index, time.perf_counter() - start)
@@ -12,10 +12,12 @@ Demonstra competências em:
 """
 
 import time
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Union
 from pathlib import Path
 import json
+from dataclasses import replace
 from datetime import datetime
+from urllib.parse import urlencode, urljoin, urlparse
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -24,35 +26,267 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from loguru import logger
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from dom_extract import ExtractionSpec, FieldSpec, extract
+from driver_pool import DriverPool
+from driver_profiles import (
+    DriverProfile,
+    apply_chrome_options,
+    apply_firefox_options,
+    install_url_blocking,
+    resolve_profile,
+)
+from driver_resolver import DriverResolver
+from driver_supervisor import DriverSupervisor, SupervisorConfig
+from form_fill import fill_form
+from http_forms import HybridFormExecutor, SubmissionSent
+from network_monitor import NetworkMonitor
+from query_cache import QueryCache, run_deferred
+from rate_limiter import THROTTLE_STATUS, DomainScheduler, is_blocked
+from result_stream import stream_results
+from screenshot_pipeline import ScreenshotPipeline
+from selector_cache import SelectorCache
+from selector_probe import probe, wait_for_any
+from session_state import (
+    SessionState,
+    prepare_profile,
+    release_profiles,
+    remove_restore_scripts,
+)
+from stand_in_server import TEST_FORM_HTML
+from web_urls import host_of, origin_of
+from web_waits import (
+    PageWaiter,
+    document_ready,
+    dom_quiescent,
+    element_stable,
+    value_equals,
+)
+
+# Chaves de form_data → nomes dos campos do formulário httpbin
+FORM_FIELD_NAMES = {
+    "customer_name": "custname",
+    "email": "custemail",
+    "pizza_size": "size",
+    "toppings": "topping",
+    "comments": "comments",
+}
+
+# Seletores alternativos para resultados do Google (layout muda com frequência)
+SEARCH_RESULT_SPEC = ExtractionSpec(
+    containers=[
+        "div.g",  # Seletor clássico
+        "[data-ved] h3..",  # Baseado em atributos do Google
+        ".yuRUbf",  # Seletor mais novo
+        ".tF2Cxc",  # Outro seletor comum
+        "[jscontroller] h3..",  # Baseado em JS controller
+    ],
+    fields={
+        "title": FieldSpec(["h3", ".LC20lb", "[role='heading']", ".DKV0Md"]),
+        "link": FieldSpec(["a", ".yuRUbf a", "h3 a", "[href]"], "href", startswith="http"),
+        "snippet": FieldSpec([".VwiC3b", "[data-sncf]", ".s3v9rd", ".st", "[data-snhf]"]),
+    },
+    limit=5,
+)
+
+# Indicadores de página de resultados carregada
+SEARCH_RESULT_READY = [
+    (By.ID, "search"),
+    (By.CSS_SELECTOR, "#search"),
+    (By.CSS_SELECTOR, "[data-async-context*='query']"),
+    (By.CSS_SELECTOR, ".g"),
+    (By.CSS_SELECTOR, "[data-ved]"),
+]
 
 
 class WebAutomation:
     """Automação web com Selenium - Migração de AutoIt."""
 
-    def __init__(self, browser: str = "chrome", headless: bool = False):
+    GOOGLE_URL = "https://www.google.com"
+    FORM_URL = "https://httpbin.org/forms/post"
+    # None = página de teste gravada em output/ e aberta via file://
+    TEST_FORM_URL: Optional[str] = None
+
+    def __init__(
+        self,
+        browser: str = "chrome",
+        headless: bool = False,
+        pool: Optional[DriverPool] = None,
+        selector_cache: Optional[SelectorCache] = None,
+        profile: Union[str, DriverProfile] = "default",
+        driver_resolver: Optional[DriverResolver] = None,
+        form_executor: Optional[HybridFormExecutor] = None,
+        query_cache: Optional[QueryCache] = None,
+        session_state: Optional[SessionState] = None,
+        profile_template: Optional[Path] = None,
+        supervisor_config: Optional[SupervisorConfig] = None,
+        screenshots: Optional[ScreenshotPipeline] = None,
+        rate_limiter: Optional[DomainScheduler] = None,
+    ):
         """
         Inicializar automação web.
 
         Args:
             browser: Navegador a usar (chrome, firefox, edge)
             headless: Executar sem interface gráfica
+            pool: Pool de sessões aquecidas (opcional) usado no lugar de setup_driver
+            selector_cache: Placar de seletores (padrão: compartilhado em output/)
+            profile: Perfil do driver ("default", "throughput" ou DriverProfile)
+            driver_resolver: Cache de caminhos do driver (padrão: compartilhado em output/)
+            form_executor: Envio HTTP de formulários estáticos (None = sempre navegador)
+            query_cache: Cache de pesquisas (None = sempre pesquisar; ex.:
+                ``QueryCache.shared()``)
+            session_state: Cookies/localStorage por origem (padrão: compartilhado em output/)
+            profile_template: Perfil pré-configurado copiado para cada sessão (opcional)
+            supervisor_config: Heartbeat/watchdog da suite (None = configuração padrão)
+            screenshots: Captura com gravação em segundo plano (padrão: PNG em output/)
+            rate_limiter: Ritmo de acesso por domínio (padrão: compartilhado no processo)
         """
         self.browser = browser
         self.headless = headless
+        self.pool = pool
+        self.selector_cache = selector_cache or SelectorCache.shared()
+        self.profile = resolve_profile(profile)
+        self.driver_resolver = driver_resolver or DriverResolver.shared()
+        self.form_executor = form_executor
+        self.query_cache = query_cache
+        # Revalidações de pesquisas vencidas, executadas com o navegador livre
+        self._stale_queries: List = []
+        self.session_state = session_state or SessionState.shared()
+        self.profile_template = Path(profile_template) if profile_template else None
+        self._profile_dirs: List[Path] = []
+        # Origens já restauradas no driver atual → fluxos concluídos (ex.: consent)
+        self._restored: Dict[str, Set[str]] = {}
+        # Scripts CDP de restauração registrados no driver atual
+        self._restore_scripts: List[str] = []
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
+        self.waiter: Optional[PageWaiter] = None
+        self.network: Optional[NetworkMonitor] = None
+        self.supervisor_config = supervisor_config
+        self.supervisor: Optional[DriverSupervisor] = None
+        self.screenshots = screenshots or ScreenshotPipeline()
+        # Screenshot a cada erro de etapa (desligado em suites sem persistência)
+        self.debug_screenshots = True
+        # Compartilhado entre workers: paralelizar não acelera o acesso a um domínio
+        self.rate_limiter = rate_limiter or DomainScheduler.shared()
         self.results: List[Dict] = []
+        # Prazo único para sondar seletores alternativos (sem implicit wait)
+        self.probe_timeout = 5.0
+        # Timeout das esperas explícitas (um único prazo por conjunto de seletores)
+        self.wait_timeout = 20
+        # Preenchimento de formulários: "script" (uma chamada) ou "keys" (send_keys)
+        self.fill_mode = "script"
+        # Resultados por página do buscador (parâmetro ``start`` da paginação)
+        self.results_per_page = 10
+        # Silêncio de rede exigido para considerar a página pronta (ms)
+        self.network_idle_ms = 300
 
         self.wait = WebDriverWait(self.driver, 10)
         logger.info("WebAutomation inicializada")
 
+    def configure_urls(
+        self,
+        google: Optional[str] = None,
+        form: Optional[str] = None,
+        test_form: Optional[str] = None,
+    ) -> None:
+        """
+        Apontar as etapas da suite para outros endereços.
+
+        Usado com ``StandInServer.site_urls()`` para executar a suite offline.
+
+        Args:
+            google: Página inicial da pesquisa
+            form: Formulário no formato do httpbin
+            test_form: Formulário simples
+        """
+        if google:
+            self.GOOGLE_URL = google
+        if form:
+            self.FORM_URL = form
+        if test_form:
+            self.TEST_FORM_URL = test_form
+
     def setup_driver(self) -> None:
         """Configurar WebDriver com opções otimizadas."""
         logger.info("Configurando WebDriver...")
+        self.attach_driver(self.create_driver())
+        logger.success("WebDriver configurado com sucesso")
 
+    def attach_driver(self, driver: WebDriver) -> None:
+        """Associar um WebDriver já criado (ex.: emprestado de um pool)."""
+        self.driver = driver
+        self.wait = WebDriverWait(self.driver, self.wait_timeout)
+        self.waiter = PageWaiter(self.driver)
+        self.network = NetworkMonitor(self.driver)
+        self._restored = {}
+        self._restore_scripts = []
+
+    def detach_driver(self) -> Optional[WebDriver]:
+        """
+        Desassociar o driver sem encerrá-lo (ex.: antes de devolvê-lo ao pool).
+
+        Scripts de restauração registrados nesta sessão são removidos para não
+        se acumularem no driver reutilizado pelos próximos jobs.
+        """
+        driver, self.driver = self.driver, None
+        if driver is not None:
+            remove_restore_scripts(driver, self._restore_scripts)
+        return driver
+
+    def _page_ready(self, step: str, nominal: float) -> float:
+        """Aguardar a página: tráfego de rede assentado (log de performance) ou esperas JS."""
+        if self.network.available:
+            return self.waiter.settle(
+                step, nominal, document_ready(), self.network.idle(self.network_idle_ms)
+            )
+        return self.waiter.page_settled(step, nominal)
+
+    def _report_response(self, url: str) -> None:
+        """
+        Informar o limitador de domínio sobre a página carregada.
+
+        Raises:
+            Exception: Página de captcha ou status 429/503 (domínio entra em backoff)
+        """
+        status = self.network.document_status if self.network else None
+        blocked = is_blocked(self.driver)
+        self.rate_limiter.report(url, status=status, blocked=blocked)
+        if blocked or status in THROTTLE_STATUS:
+            raise Exception(f"Bloqueio anti-bot em {host_of(url)} (status={status})")
+
+    def _warm_session(self, url: str) -> Set[str]:
+        """Restaurar estado salvo da origem (uma vez por driver); retorna fluxos concluídos."""
+        origin = origin_of(url)
+        if origin not in self._restored:
+            self._restored[origin] = self.session_state.restore(
+                self.driver, url, self._restore_scripts
+            )
+        return self._restored[origin]
+
+    def _user_data_dir(self) -> Optional[Path]:
+        """Cópia exclusiva do perfil modelo para uma nova sessão."""
+        if not self.profile_template:
+            return None
+        path = prepare_profile(self.profile_template)
+        self._profile_dirs.append(path)
+        return path
+
+    def create_driver(self) -> WebDriver:
+        """
+        Criar WebDriver configurado sem associá-lo a esta instância.
+
+        Usado por setup_driver e como fábrica do DriverPool.
+
+        Returns:
+            Nova sessão WebDriver
+        """
         if self.browser.lower() == "chrome":
             options = ChromeOptions()
 
@@ -77,18 +311,34 @@ class WebAutomation:
             else:
                 options.add_argument("--start-maximized")
 
-            # Configurar driver
-            service = Service()
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.wait = WebDriverWait(self.driver, 10)
+            # Perfil pré-configurado (consentimentos/logins já feitos)
+            user_data_dir = self._user_data_dir()
+            if user_data_dir:
+                options.add_argument(f"--user-data-dir={user_data_dir.resolve()}")
+
+            # Estratégia de carregamento, extensões e rede em segundo plano
+            apply_chrome_options(options, self.profile)
+
+            # Eventos de rede do DevTools para detectar quando o tráfego assenta
+            NetworkMonitor.enable(options)
+
+            # Configurar driver (caminhos fixados: sem Selenium Manager a cada sessão)
+            driver = self._start_driver(webdriver.Chrome, Service(), options)
+
+            # Bloqueio de recursos por padrão de URL (CDP)
+            install_url_blocking(driver, self.profile)
 
         elif self.browser.lower() == "firefox":
             # Configuração para Firefox (opcional)
             options = FirefoxOptions()
             if self.headless:
                 options.add_argument("--headless")
-            self.driver = webdriver.Firefox(options=options)
-            self.wait = WebDriverWait(self.driver, 10)
+            apply_firefox_options(options, self.profile)
+            user_data_dir = self._user_data_dir()
+            if user_data_dir:
+                options.add_argument("-profile")
+                options.add_argument(str(user_data_dir.resolve()))
+            driver = self._start_driver(webdriver.Firefox, FirefoxService(), options)
 
         else:
             raise ValueError(
@@ -96,56 +346,78 @@ class WebAutomation:
             )
 
         # Configurar timeouts aumentados
-        self.driver.implicitly_wait(15)
-        self.driver.set_page_load_timeout(45)
-
-        # Configurar WebDriverWait com timeout maior
-        self.wait = WebDriverWait(self.driver, 20)
-
-        logger.success("WebDriver configurado com sucesso")
+        driver.implicitly_wait(15)
+        driver.set_page_load_timeout(45)
+
+        return driver
+
+    def _start_driver(self, factory, service, options) -> WebDriver:
+        """Iniciar sessão com caminhos do cache e registrar o tempo de setup."""
+        start = time.perf_counter()
+        resolution = self.driver_resolver.resolve(service, options)
+        driver = factory(service=service, options=options)
+        self.driver_resolver.record_setup(
+            options, driver, time.perf_counter() - start, resolution
+        )
+        logger.info(f"Driver iniciado ({resolution}) em {time.perf_counter() - start:.2f}s")
+        return driver
 
     def search_google(self, query: str) -> Dict:
         """
-        Pesquisar no Google e extrair resultados.
+        Pesquisar no Google e extrair resultados (via cache de consultas).
 
         Args:
             query: Termo de pesquisa
 
         Returns:
-            Dicionário com resultados da pesquisa
+            Dicionário com resultados da pesquisa e origem (``cache``, com cache)
         """
+        if self.query_cache is None:
+            return self._search_google(query)
+        return self.query_cache.get_or_fetch(
+            "google",
+            query,
+            lambda: self._search_google(query),
+            scope=urlparse(self.GOOGLE_URL).netloc,
+            deferred=self._stale_queries,
+        )
+
+    def refresh_stale_queries(self) -> int:
+        """Revalidar pesquisas servidas vencidas (usa o navegador desta instância)."""
+        if not self._stale_queries or not self.driver:
+            return 0
+        count = run_deferred(self._stale_queries)
+        logger.info(f"Pesquisas revalidadas: {count}")
+        return count
+
+    def _search_google(self, query: str) -> Dict:
+        """Pesquisar no Google e extrair resultados (sem cache)."""
         logger.info(f"Pesquisando no Google: {query}")
         start_time = time.time()
 
         try:
-            # Navegar para o Google
-            self.driver.get("https://www.google.com")
-
-            # Aguardar página carregar
-            time.sleep(2)
-
-            # Tentar aceitar cookies se aparecer
-            try:
-                accept_button = self.wait.until(
-                    EC.element_to_be_clickable(
-                        (
-                            By.XPATH,
-                            "//button[contains(text(), 'Aceitar') or "
-                            "contains(text(), 'Accept') or "
-                            "contains(text(), 'I agree')]",
-                        )
-                    )
+            # Navegar para o Google (com cookies/localStorage da última sessão)
+            site = urlparse(self.GOOGLE_URL).hostname
+            completed = self._warm_session(self.GOOGLE_URL)
+            with self.rate_limiter.slot(self.GOOGLE_URL):
+                self.network.begin_page("google_home")
+                self.driver.get(self.GOOGLE_URL)
+
+            # Aguardar página carregar (tráfego de rede assentado)
+            self._page_ready("google_load", 2.0)
+            self._report_response(self.GOOGLE_URL)
+
+            # Aceitar cookies se aparecer (sessão restaurada já tem o consentimento)
+            if "consent" in completed:
+                self.waiter.skip(
+                    "cookies_consent",
+                    self.session_state.step_seconds(self.GOOGLE_URL, "consent"),
                 )
-                accept_button.click()
-                time.sleep(1)
-                logger.info("Cookies aceitos")
-            except TimeoutException:
-                logger.info("Popup de cookies não encontrado ou já aceito")
-            except Exception as e:
-                logger.debug(f"Não foi possível aceitar cookies: {e}")
+                logger.info("Consentimento de cookies restaurado da sessão anterior")
+            else:
+                self._accept_cookies()
 
             # Localizar campo de pesquisa (múltiplos seletores)
-            search_box = None
             selectors = [
                 (By.NAME, "q"),
                 (By.CSS_SELECTOR, "input[name='q']"),
@@ -154,66 +426,65 @@ class WebAutomation:
                 (By.CSS_SELECTOR, "[title='Search']"),
             ]
 
-            for by, selector in selectors:
-                try:
-                    search_box = self.wait.until(
-                        EC.presence_of_element_located((by, selector))
-                    )
-                    logger.info(f"Campo de pesquisa encontrado com: {selector}")
-                    break
-                except TimeoutException:
-                    continue
-
-            if not search_box:
+            # Todas as alternativas competem no mesmo loop de polling
+            selectors = self.selector_cache.order(site, "search_box", selectors)
+            try:
+                found = wait_for_any(self.driver, selectors, self.wait_timeout)
+            except TimeoutException:
                 raise Exception("Campo de pesquisa não encontrado")
 
-            # Realizar pesquisa com timing mais humano
+            self.selector_cache.record(site, "search_box", found.locator)
+            search_box = found.element
+            winners = {"search_box": found.locator[1]}
+            logger.info(f"Campo de pesquisa encontrado com: {found.locator[1]}")
+
+            # Realizar pesquisa aguardando o campo refletir cada ação
             search_box.clear()
-            time.sleep(0.5)
-
-            # Digitar com pequenos intervalos para simular digitação humana
-            for char in query:
-                search_box.send_keys(char)
-                time.sleep(0.05)  # 50ms entre caracteres
-
-            time.sleep(0.5)
-            search_box.send_keys(Keys.RETURN)
-
-            # Aguardar resultados com múltiplos seletores
-            results_found = False
-            result_selectors = [
-                (By.ID, "search"),
-                (By.CSS_SELECTOR, "#search"),
-                (By.CSS_SELECTOR, "[data-async-context*='query']"),
-                (By.CSS_SELECTOR, ".g"),
-                (By.CSS_SELECTOR, "[data-ved]"),
-            ]
+            self.waiter.settle("search_clear", 0.5, value_equals(search_box, ""))
 
-            for by, selector in result_selectors:
-                try:
-                    self.wait.until(EC.presence_of_element_located((by, selector)))
-                    results_found = True
-                    logger.info(f"Resultados encontrados com: {selector}")
-                    break
-                except TimeoutException:
-                    continue
-
-            if not results_found:
+            search_box.send_keys(query)
+            typing_nominal = 0.05 * len(query) + 0.5
+            self.waiter.settle(
+                "search_typing", typing_nominal, value_equals(search_box, query)
+            )
+            with self.rate_limiter.slot(self.GOOGLE_URL):
+                self.network.begin_page("google_results")
+                search_box.send_keys(Keys.RETURN)
+
+            # Aguardar resultados com múltiplos seletores (um único timeout)
+            result_selectors = self.selector_cache.order(site, "results", SEARCH_RESULT_READY)
+            try:
+                found = wait_for_any(self.driver, result_selectors, self.wait_timeout)
+            except TimeoutException:
+                # Captcha no lugar dos resultados: backoff do domínio antes de desistir
+                self._report_response(self.GOOGLE_URL)
                 raise Exception("Página de resultados não carregou")
 
-            # Aguardar um pouco mais para garantir carregamento completo
-            time.sleep(2)
+            self.selector_cache.record(site, "results", found.locator)
+            winners["results"] = found.locator[1]
+            logger.info(f"Resultados encontrados com: {found.locator[1]}")
+
+            # Aguardar rede ociosa antes de extrair
+            self._page_ready("results_settle", 2.0)
+            self._report_response(self.GOOGLE_URL)
 
             # Extrair resultados
             results = self._extract_search_results()
 
             execution_time = time.time() - start_time
+            saved_by_step = {step: round(s, 3) for step, s in self.waiter.savings.items()}
+            time_saved = self.waiter.pop_savings()
+            logger.info(f"Tempo economizado em esperas: {time_saved:.3f}s")
 
             result = {
                 "query": query,
                 "results_count": len(results),
                 "results": results,
                 "execution_time": round(execution_time, 3),
+                "time_saved": time_saved,
+                "time_saved_by_step": saved_by_step,
+                "network": self.network.pop_pages(),
+                "selectors": winners,
                 "timestamp": datetime.now().isoformat(),
                 "success": True,
             }
@@ -229,15 +500,7 @@ class WebAutomation:
 
         except Exception as e:
             logger.error(f"Erro na pesquisa: {query}", error=str(e))
-
-            # Capturar screenshot para debug
-            try:
-                debug_screenshot = self.take_screenshot(
-                    f"debug_google_error_{int(time.time())}.png"
-                )
-                logger.info(f"Screenshot de debug salvo: {debug_screenshot}")
-            except BaseException:
-                pass
+            self._debug_screenshot("debug_google_error")
 
             return {
                 "query": query,
@@ -246,96 +509,123 @@ class WebAutomation:
                 "timestamp": datetime.now().isoformat(),
             }
 
-    def _extract_search_results(self) -> List[Dict]:
-        """Extrair resultados da pesquisa do Google."""
+    def _accept_cookies(self) -> None:
+        """Tentar aceitar cookies se aparecer e salvar a sessão com o consentimento."""
+        consent_start = time.perf_counter()
+        try:
+            accept_button = self.wait.until(
+                EC.element_to_be_clickable(
+                    (
+                        By.XPATH,
+                        "//button[contains(text(), 'Aceitar') or "
+                        "contains(text(), 'Accept') or "
+                        "contains(text(), 'I agree')]",
+                    )
+                )
+            )
+            accept_button.click()
+            self.waiter.settle("cookies_dismiss", 1.0, dom_quiescent(200))
+            logger.info("Cookies aceitos")
+        except TimeoutException:
+            logger.info("Popup de cookies não encontrado ou já aceito")
+        except Exception as e:
+            logger.debug(f"Não foi possível aceitar cookies: {e}")
+            return
+
+        # Consentimento resolvido: próximas sessões restauram os cookies e pulam a etapa
+        self._restored.setdefault(origin_of(self.GOOGLE_URL), set()).add("consent")
+        self.session_state.capture(
+            self.driver,
+            self.GOOGLE_URL,
+            flags=["consent"],
+            step_seconds={"consent": time.perf_counter() - consent_start},
+        )
+
+    def iter_search_results(
+        self,
+        query: str,
+        max_results: Optional[int] = 100,
+        time_budget: Optional[float] = None,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+        stats: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """
+        Gerar resultados do Google sob demanda, atravessando páginas.
+
+        A próxima página carrega em outra aba enquanto a atual é consumida;
+        links repetidos entre páginas são descartados. Não use o driver
+        entre dois itens do gerador.
+
+        Args:
+            query: Termo de pesquisa
+            max_results: Máximo de resultados (None = até acabar)
+            time_budget: Tempo máximo (s)
+            max_pages: Máximo de páginas
+            prefetch: Pré-carregar a próxima página
+            stats: Dicionário preenchido com estatísticas do streaming
+
+        Yields:
+            Resultados com ``position`` global e ``page``
+        """
+        site = urlparse(self.GOOGLE_URL).hostname
+        search_url = urljoin(self.GOOGLE_URL, "/search")
+
+        def page_url(page: int) -> str:
+            params = {"q": query, "start": page * self.results_per_page}
+            url = f"{search_url}?{urlencode(params)}"
+            # Cada página (inclusive a pré-carregada) consome um token do domínio
+            self.rate_limiter.throttle(url)
+            return url
+
+        logger.info(f"Streaming de resultados: {query} (máx. {max_results})")
+        return stream_results(
+            self.driver,
+            page_url,
+            lambda: self._extract_search_results(limit=None),
+            self.selector_cache.order(site, "results", SEARCH_RESULT_READY),
+            max_results=max_results,
+            max_pages=max_pages,
+            time_budget=time_budget,
+            prefetch=prefetch,
+            page_timeout=self.wait_timeout,
+            stats=stats,
+        )
+
+    def _extract_search_results(
+        self, limit: Optional[int] = SEARCH_RESULT_SPEC.limit
+    ) -> List[Dict]:
+        """Extrair resultados da pesquisa do Google em uma única chamada ao navegador."""
         results = []
 
         try:
-            # Múltiplos seletores para elementos de resultado
-            result_selectors = [
-                "div.g",  # Seletor clássico
-                "[data-ved] h3..",  # Baseado em atributos do Google
-                ".yuRUbf",  # Seletor mais novo
-                ".tF2Cxc",  # Outro seletor comum
-                "[jscontroller] h3..",  # Baseado em JS controller
-            ]
+            site = urlparse(self.GOOGLE_URL).hostname
+            spec = replace(self._ordered_spec(site, SEARCH_RESULT_SPEC), limit=limit)
+            extraction = extract(self.driver, spec)
 
-            result_elements = []
-            for selector in result_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        result_elements = elements
-                        logger.info(f"Resultados encontrados com seletor: {selector}")
-                        break
-                except Exception:
-                    continue
-
-            if not result_elements:
+            if not extraction["items"]:
                 logger.warning("Nenhum elemento de resultado encontrado")
                 return results
 
-            # Processar até 5 resultados
-            for i, element in enumerate(result_elements[:5]):
-                try:
-                    # Múltiplos seletores para título
-                    title = ""
-                    title_selectors = ["h3", ".LC20lb", "[role='heading']", ".DKV0Md"]
-                    for t_selector in title_selectors:
-                        try:
-                            title_elem = element.find_element(By.CSS_SELECTOR, t_selector)
-                            if title_elem and title_elem.text:
-                                title = title_elem.text.strip()
-                                break
-                        except NoSuchElementException:
-                            continue
-
-                    # Múltiplos seletores para link
-                    link = ""
-                    link_selectors = ["a", ".yuRUbf a", "h3 a", "[href]"]
-                    for l_selector in link_selectors:
-                        try:
-                            link_elem = element.find_element(By.CSS_SELECTOR, l_selector)
-                            if link_elem:
-                                link = link_elem.get_attribute("href")
-                                if link and link.startswith("http"):
-                                    break
-                        except NoSuchElementException:
-                            continue
-
-                    # Múltiplos seletores para snippet
-                    snippet = ""
-                    snippet_selectors = [
-                        ".VwiC3b",
-                        "[data-sncf]",
-                        ".s3v9rd",
-                        ".st",
-                        "[data-snhf]",
-                    ]
-                    for s_selector in snippet_selectors:
-                        try:
-                            snippet_elem = element.find_element(By.CSS_SELECTOR, s_selector)
-                            if snippet_elem and snippet_elem.text:
-                                snippet = snippet_elem.text.strip()
-                                break
-                        except NoSuchElementException:
-                            continue
-
-                    # Adicionar resultado se tiver título e link válidos
-                    if title and link and not link.startswith("/search"):
-                        results.append(
-                            {
-                                "position": i + 1,
-                                "title": title,
-                                "link": link,
-                                "snippet": snippet or "Sem descrição",
-                            }
-                        )
-                        logger.debug(f"Resultado {i + 1}: {title[:50]}...")
-
-                except Exception as e:
-                    logger.debug(f"Erro ao processar resultado {i + 1}: {e}")
-                    continue
+            logger.info(f"Resultados encontrados com seletor: {extraction['container']}")
+            self.selector_cache.record(site, "result_container", extraction["container"])
+            for name, selector in extraction.get("field_selectors", {}).items():
+                self.selector_cache.record(site, f"result_{name}", selector)
+
+            for item in extraction["items"]:
+                title, link = item["title"], item["link"]
+
+                # Adicionar resultado se tiver título e link válidos
+                if title and link and not link.startswith("/search"):
+                    results.append(
+                        {
+                            "position": item["index"] + 1,
+                            "title": title,
+                            "link": link,
+                            "snippet": item["snippet"] or "Sem descrição",
+                        }
+                    )
+                    logger.debug(f"Resultado {item['index'] + 1}: {title[:50]}...")
 
         except Exception as e:
             logger.warning(f"Erro ao extrair resultados: {e}")
@@ -343,6 +633,21 @@ class WebAutomation:
         logger.info(f"Total de resultados extraídos: {len(results)}")
         return results
 
+    def _ordered_spec(self, site: str, spec: ExtractionSpec) -> ExtractionSpec:
+        """Reordenar seletores da especificação pelo histórico de sucesso."""
+        return ExtractionSpec(
+            containers=self.selector_cache.order(site, "result_container", spec.containers),
+            fields={
+                name: FieldSpec(
+                    self.selector_cache.order(site, f"result_{name}", field.selectors),
+                    field.attribute,
+                    field.startswith,
+                )
+                for name, field in spec.fields.items()
+            },
+            limit=spec.limit,
+        )
+
     def automate_form_filling(self, form_data: Dict) -> Dict:
         """
         Automatizar preenchimento de formulário.
@@ -354,87 +659,69 @@ class WebAutomation:
             Resultado da automação
         """
         logger.info("Automatizando preenchimento de formulário")
+
+        # Formulário estático: envio direto via HTTP, sem navegador
+        if self.form_executor is not None:
+            try:
+                values = {
+                    FORM_FIELD_NAMES[key]: value
+                    for key, value in form_data.items()
+                    if key in FORM_FIELD_NAMES
+                }
+                with self.rate_limiter.slot(self.FORM_URL):
+                    result = self.form_executor.submit(self.FORM_URL, values)
+                logger.success("Formulário enviado via HTTP", time=result["execution_time"])
+                return {"form_data": form_data, **result}
+            except SubmissionSent as e:
+                # O servidor pode ter recebido o envio: repetir no navegador o duplicaria
+                logger.error(f"Envio HTTP interrompido após transmissão: {e}")
+                return {
+                    "form_data": form_data,
+                    "transport": "http",
+                    "error": str(e),
+                    "timestamp": datetime.now().isoformat(),
+                    "success": False,
+                }
+            except Exception as e:
+                logger.info(f"Envio HTTP indisponível, usando navegador: {e}")
+
         start_time = time.time()
 
         try:
             # Navegar para página de exemplo
-            self.driver.get("https://httpbin.org/forms/post")
+            site = urlparse(self.FORM_URL).hostname
+            with self.rate_limiter.slot(self.FORM_URL):
+                self.network.begin_page("form")
+                self.driver.get(self.FORM_URL)
 
-            # Aguardar página carregar completamente
-            time.sleep(2)
+            # Aguardar página carregar completamente (tráfego de rede assentado)
+            self._page_ready("form_load", 2.0)
+            self._report_response(self.FORM_URL)
 
             # Aguardar formulário carregar
             self.wait.until(EC.presence_of_element_located((By.NAME, "custname")))
 
             logger.info("Formulário carregado, iniciando preenchimento...")
 
-            # Preencher campos
-            fields_filled = 0
-
-            # Nome do cliente
+            # Preencher e verificar todos os campos em uma única chamada
+            fields: Dict[str, object] = {}
             if "customer_name" in form_data:
-                try:
-                    name_field = self.driver.find_element(By.NAME, "custname")
-                    name_field.clear()
-                    name_field.send_keys(form_data["customer_name"])
-                    fields_filled += 1
-                    logger.debug("Campo 'nome' preenchido")
-                except Exception as e:
-                    logger.warning(f"Erro ao preencher nome: {e}")
-
-            # Email
+                fields["[name='custname']"] = form_data["customer_name"]
             if "email" in form_data:
-                try:
-                    email_field = self.driver.find_element(By.NAME, "custemail")
-                    email_field.clear()
-                    email_field.send_keys(form_data["email"])
-                    fields_filled += 1
-                    logger.debug("Campo 'email' preenchido")
-                except Exception as e:
-                    logger.warning(f"Erro ao preencher email: {e}")
-
-            # Tamanho da pizza (radio button)
+                fields["[name='custemail']"] = form_data["email"]
             if "pizza_size" in form_data:
-                try:
-                    size_radio = self.driver.find_element(
-                        By.CSS_SELECTOR, f"input[value='{form_data['pizza_size']}']"
-                    )
-                    self.driver.execute_script("arguments[0].click();", size_radio)
-                    fields_filled += 1
-                    logger.debug(f"Tamanho de pizza '{form_data['pizza_size']}' selecionado")
-                except Exception as e:
-                    logger.warning(f"Erro ao selecionar tamanho da pizza: {e}")
-
-            # Toppings (checkboxes)
-            if "toppings" in form_data:
-                for topping in form_data["toppings"]:
-                    try:
-                        topping_checkbox = self.driver.find_element(
-                            By.CSS_SELECTOR, f"input[value='{topping}']"
-                        )
-                        if not topping_checkbox.is_selected():
-                            self.driver.execute_script(
-                                "arguments[0].click();", topping_checkbox
-                            )
-                            fields_filled += 1
-                            logger.debug(f"Topping '{topping}' selecionado")
-                    except NoSuchElementException:
-                        logger.warning(f"Topping '{topping}' não encontrado")
-                        continue
-
-            # Comentários
+                fields[f"input[value='{form_data['pizza_size']}']"] = True
+            for topping in form_data.get("toppings", []):
+                fields[f"input[value='{topping}']"] = True
             if "comments" in form_data:
-                try:
-                    comments_field = self.driver.find_element(By.NAME, "comments")
-                    comments_field.clear()
-                    comments_field.send_keys(form_data["comments"])
-                    fields_filled += 1
-                    logger.debug("Campo 'comentários' preenchido")
-                except Exception as e:
-                    logger.warning(f"Erro ao preencher comentários: {e}")
+                fields["[name='comments']"] = form_data["comments"]
 
-            # Aguardar um pouco antes de submeter
-            time.sleep(1)
+            fill = fill_form(self.driver, fields, mode=self.fill_mode)
+            fields_filled = len(fill["filled"])
+            logger.debug(f"Campos preenchidos ({self.fill_mode}): {fill['filled']}")
+
+            # Aguardar reações do formulário ao preenchimento antes de submeter
+            self.waiter.settle("form_before_submit", 1.0, dom_quiescent(200))
 
             # Submeter formulário - múltiplos seletores
             submit_success = False
@@ -447,42 +734,53 @@ class WebAutomation:
                 "[type='submit']",
             ]
 
-            for selector in submit_selectors:
+            # Todas as alternativas compartilham um único prazo, sem implicit wait
+            found = probe(
+                self.driver,
+                self.selector_cache.order(
+                    site,
+                    "submit",
+                    [(By.CSS_SELECTOR, selector) for selector in submit_selectors],
+                ),
+                timeout=self.probe_timeout,
+                displayed=True,
+            )
+            if found:
+                self.selector_cache.record(site, "submit", found.locator)
                 try:
-                    submit_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if submit_button.is_displayed() and submit_button.is_enabled():
-                        # Rolar até o botão para garantir que está visível
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView(true);", submit_button
-                        )
-                        time.sleep(0.5)
-
-                        # Tentar clicar
-                        self.driver.execute_script("arguments[0].click();", submit_button)
-                        logger.info(f"Formulário submetido com seletor: {selector}")
-                        submit_success = True
-                        break
+                    submit_button = found.element
+                    # Rolar até o botão para garantir que está visível
+                    self.driver.execute_script(
+                        "arguments[0].scrollIntoView(true);", submit_button
+                    )
+                    self.waiter.settle("submit_scroll", 0.5, element_stable(submit_button))
+
+                    # Tentar clicar
+                    self.network.begin_page("form_response")
+                    self.driver.execute_script("arguments[0].click();", submit_button)
+                    logger.info(f"Formulário submetido com seletor: {found.locator[1]}")
+                    submit_success = True
                 except Exception as e:
-                    logger.debug(f"Seletor '{selector}' falhou: {e}")
-                    continue
+                    logger.debug(f"Seletor '{found.locator[1]}' falhou: {e}")
 
             if not submit_success:
                 # Última tentativa: pressionar Enter no último campo
-                try:
-                    comments_field = self.driver.find_element(By.NAME, "comments")
-                    comments_field.send_keys(Keys.RETURN)
-                    logger.info("Formulário submetido via Enter")
-                    submit_success = True
-                except Exception:
-                    pass
+                comments = probe(self.driver, [(By.NAME, "comments")])
+                if comments:
+                    try:
+                        self.network.begin_page("form_response")
+                        comments.element.send_keys(Keys.RETURN)
+                        logger.info("Formulário submetido via Enter")
+                        submit_success = True
+                    except Exception:
+                        pass
 
             if not submit_success:
                 raise Exception(
                     "Não foi possível submeter o formulário - botão submit não encontrado"
                 )
 
-            # Aguardar resposta - múltiplos seletores
-            response_found = False
+            # Aguardar resposta - múltiplos seletores (um único timeout)
             response_selectors = [
                 (By.TAG_NAME, "pre"),
                 (By.CSS_SELECTOR, "pre"),
@@ -491,24 +789,28 @@ class WebAutomation:
                 (By.CSS_SELECTOR, "[data-response]"),
             ]
 
-            for by, selector in response_selectors:
-                try:
-                    self.wait.until(EC.presence_of_element_located((by, selector)))
-                    response_found = True
-                    logger.info(f"Resposta encontrada com: {selector}")
-                    break
-                except TimeoutException:
-                    continue
-
-            if not response_found:
+            response_selectors = self.selector_cache.order(
+                site, "response", response_selectors
+            )
+            try:
+                found = wait_for_any(self.driver, response_selectors, self.wait_timeout)
+                self.selector_cache.record(site, "response", found.locator)
+                logger.info(f"Resposta encontrada com: {found.locator[1]}")
+            except TimeoutException:
                 logger.warning("Resposta não detectada, mas formulário foi submetido")
+            self._page_ready("form_response", 1.0)
 
             execution_time = time.time() - start_time
+            time_saved = self.waiter.pop_savings()
+            logger.info(f"Tempo economizado em esperas: {time_saved:.3f}s")
 
             result = {
                 "form_data": form_data,
                 "fields_filled": fields_filled,
+                "fill_mode": self.fill_mode,
                 "execution_time": round(execution_time, 3),
+                "time_saved": time_saved,
+                "network": self.network.pop_pages(),
                 "timestamp": datetime.now().isoformat(),
                 "success": True,
             }
@@ -523,15 +825,7 @@ class WebAutomation:
 
         except Exception as e:
             logger.error(f"Erro no preenchimento: {e}")
-
-            # Capturar screenshot para debug
-            try:
-                debug_screenshot = self.take_screenshot(
-                    f"debug_form_error_{int(time.time())}.png"
-                )
-                logger.info(f"Screenshot de debug salvo: {debug_screenshot}")
-            except BaseException:
-                pass
+            self._debug_screenshot("debug_form_error")
 
             return {
                 "form_data": form_data,
@@ -540,6 +834,15 @@ class WebAutomation:
                 "timestamp": datetime.now().isoformat(),
             }
 
+    @staticmethod
+    def _test_form_file_url() -> str:
+        """Gravar a página de teste em output/ somente se ausente ou alterada."""
+        page = Path("output") / "test_form.html"
+        if not page.exists() or page.read_text(encoding="utf-8") != TEST_FORM_HTML:
+            page.parent.mkdir(exist_ok=True)
+            page.write_text(TEST_FORM_HTML, encoding="utf-8")
+        return page.absolute().as_uri()
+
     def test_simple_form(self) -> Dict:
         """
         Testar automação com formulário mais simples.
@@ -551,133 +854,50 @@ class WebAutomation:
         start_time = time.time()
 
         try:
-            # Criar página HTML simples para teste
-            html_content = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Teste de Formulário</title>
-                <style>
-                    body { font-family: Arial, sans-serif; padding: 20px; }
-                    .form-group { margin: 10px 0; }
-                    label { display: block; margin-bottom: 5px; }
-                    input, textarea, select { 
-                        padding: 5px; 
-                        margin-bottom: 10px; 
-                        width: 200px; 
-                    }
-                    button { 
-                        padding: 10px 20px; 
-                        background-color: #007bff; 
-                        color: white; 
-                        border: none; 
-                        border-radius: 4px; 
-                        cursor: pointer; 
-                    }
-                </style>
-            </head>
-            <body>
-                <h1>Formulário de Teste</h1>
-                <form id="testForm">
-                    <div class="form-group">
-                        <label for="nome">Nome:</label>
-                        <input type="text" id="nome" name="nome" required>
-                    </div>
-                    <div class="form-group">
-                        <label for="email">Email:</label>
-                        <input type="email" id="email" name="email" required>
-                    </div>
-                    <div class="form-group">
-                        <label for="idade">Idade:</label>
-                        <input type="number" id="idade" name="idade" min="1" max="120">
-                    </div>
-                    <div class="form-group">
-                        <label for="comentarios">Comentários:</label>
-                        <textarea id="comentarios" name="comentarios" rows="4"></textarea>
-                    </div>
-                    <button type="submit" id="submitBtn">Enviar</button>
-                </form>
-                <div id="resultado" style="margin-top: 20px; display: none;">
-                    <h2>Formulário enviado com sucesso!</h2>
-                </div>
-                <script>
-                    document.getElementById('testForm').addEventListener(
-                        'submit', function(e) {
-                        e.preventDefault();
-                        document.getElementById('resultado').style.display = 'block';
-                    });
-                </script>
-            </body>
-            </html>
-            """
-
-            # Salvar arquivo HTML temporário
-            temp_file = Path("output") / "test_form.html"
-            temp_file.parent.mkdir(exist_ok=True)
-
-            with open(temp_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
-
-            # Navegar para o arquivo local
-            file_url = f"file:///{temp_file.absolute().as_posix()}"
-            self.driver.get(file_url)
+            # Página servida pelo servidor local ou cache em arquivo
+            self.driver.get(self.TEST_FORM_URL or self._test_form_file_url())
 
             # Aguardar carregamento
             self.wait.until(EC.presence_of_element_located((By.ID, "nome")))
 
             logger.info("Formulário de teste carregado")
 
-            # Preencher campos
-            fields_filled = 0
-
-            # Nome
-            nome_field = self.driver.find_element(By.ID, "nome")
-            nome_field.clear()
-            nome_field.send_keys("João Automação")
-            fields_filled += 1
-
-            # Email
-            email_field = self.driver.find_element(By.ID, "email")
-            email_field.clear()
-            email_field.send_keys("joao@teste.com")
-            fields_filled += 1
-
-            # Idade
-            idade_field = self.driver.find_element(By.ID, "idade")
-            idade_field.clear()
-            idade_field.send_keys("25")
-            fields_filled += 1
-
-            # Comentários
-            comments_field = self.driver.find_element(By.ID, "comentarios")
-            comments_field.clear()
-            comments_field.send_keys("Teste de automação com Selenium Python")
-            fields_filled += 1
+            # Preencher e verificar campos em uma única chamada
+            fill = fill_form(
+                self.driver,
+                {
+                    "#nome": "João Automação",
+                    "#email": "joao@teste.com",
+                    "#idade": "25",
+                    "#comentarios": "Teste de automação com Selenium Python",
+                },
+                mode=self.fill_mode,
+            )
+            fields_filled = len(fill["filled"])
 
             # Submeter formulário
             submit_button = self.driver.find_element(By.ID, "submitBtn")
             self.driver.execute_script("arguments[0].scrollIntoView(true);", submit_button)
-            time.sleep(0.5)
+            self.waiter.settle("submit_scroll", 0.5, element_stable(submit_button))
             submit_button.click()
 
             # Aguardar resultado aparecer
             self.wait.until(EC.visibility_of_element_located((By.ID, "resultado")))
 
-            # Aguardar um pouco para ver o resultado
-            time.sleep(2)
+            # Aguardar o resultado terminar de renderizar
+            self.waiter.settle("result_render", 2.0, dom_quiescent(200))
 
             execution_time = time.time() - start_time
-
-            # Limpar arquivo temporário
-            try:
-                temp_file.unlink()
-            except BaseException:
-                pass
+            time_saved = self.waiter.pop_savings()
+            logger.info(f"Tempo economizado em esperas: {time_saved:.3f}s")
 
             result = {
                 "test_type": "simple_form",
                 "fields_filled": fields_filled,
+                "fill_mode": self.fill_mode,
                 "execution_time": round(execution_time, 3),
+                "time_saved": time_saved,
+                "network": self.network.pop_pages(),
                 "timestamp": datetime.now().isoformat(),
                 "success": True,
             }
@@ -700,43 +920,93 @@ class WebAutomation:
                 "timestamp": datetime.now().isoformat(),
             }
 
-    def take_screenshot(self, filename: str = None) -> str:
+    def take_screenshot(
+        self,
+        filename: str = None,
+        element=None,
+        clip: Optional[Dict] = None,
+        image_format: Optional[str] = None,
+        quality: Optional[int] = None,
+    ) -> str:
         """
-        Capturar screenshot da página atual.
+        Capturar screenshot da página atual (gravação em segundo plano).
 
         Args:
             filename: Nome do arquivo (opcional)
+            element: Capturar apenas este elemento
+            clip: Região da página ``{"x", "y", "width", "height"}``
+            image_format: png, jpeg ou webp (padrão do pipeline)
+            quality: Qualidade de JPEG/WebP
 
         Returns:
-            Path do arquivo salvo
+            Path do arquivo (gravado até o ``cleanup``)
         """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"screenshot_{timestamp}.png"
 
-        filepath = Path("output") / filename
-        filepath.parent.mkdir(exist_ok=True)
-
-        self.driver.save_screenshot(str(filepath))
-        logger.info(f"Screenshot salvo: {filepath}")
+        filepath = self.screenshots.capture(
+            self.driver,
+            filename,
+            element=element,
+            clip=clip,
+            image_format=image_format,
+            quality=quality,
+        )
+        logger.info(f"Screenshot capturado: {filepath}")
+
+        return filepath
+
+    def _debug_screenshot(self, prefix: str) -> None:
+        """Capturar screenshot de um erro para debug (se habilitado)."""
+        if not self.debug_screenshots:
+            return
+        try:
+            debug_screenshot = self.take_screenshot(f"{prefix}_{int(time.time())}.png")
+            logger.info(f"Screenshot de debug salvo: {debug_screenshot}")
+        except BaseException:
+            pass
 
-        return str(filepath)
+    def run_automation_suite(self, persist: bool = True) -> Dict:
+        """
+        Executar suite completa de automação.
 
-    def run_automation_suite(self) -> Dict:
-        """Executar suite completa de automação."""
+        Args:
+            persist: Gravar screenshots (final e de erros) e JSON de resultados
+                (desligado no modo contínuo, que mantém apenas agregados)
+        """
         logger.info("=== Iniciando suite de automação web ===")
+        # Cada execução reporta apenas os próprios resultados
+        self.results = []
+        # Modo contínuo: erros repetidos não acumulam PNGs em output/
+        debug_screenshots = self.debug_screenshots
+        self.debug_screenshots = debug_screenshots and persist
 
         try:
-            self.setup_driver()
+            if self.pool:
+                self.attach_driver(self.pool.acquire())
+            else:
+                self.setup_driver()
+
+            # Sessão que morrer ou travar é substituída sem derrubar as etapas seguintes
+            self.supervisor = DriverSupervisor(
+                self.driver,
+                factory=self.pool.acquire if self.pool else self.create_driver,
+                on_replace=self.attach_driver,
+                dispose=self.pool.release if self.pool else None,
+                config=self.supervisor_config,
+            )
 
             # Teste 1: Formulário simples (mais confiável)
-            simple_form_result = self.test_simple_form()
+            simple_form_result = self.supervisor.run("simple_form", self.test_simple_form)
             self.results.append(simple_form_result)
 
             # Teste 2: Pesquisa no Google (pode falhar devido a proteções
             # anti-bot)
             try:
-                search_result = self.search_google("Python automation selenium")
+                search_result = self.supervisor.run(
+                    "search_google", lambda: self.search_google("Python automation selenium")
+                )
                 self.results.append(search_result)
             except Exception as e:
                 logger.warning(f"Teste de pesquisa Google pulado: {e}")
@@ -759,7 +1029,12 @@ class WebAutomation:
                     "comments": "Pedido de teste via automação Python",
                 }
 
-                form_result = self.automate_form_filling(form_data)
+                # Envio do pedido não é repetido: nova sessão apenas para as etapas seguintes
+                form_result = self.supervisor.run(
+                    "form_filling",
+                    lambda: self.automate_form_filling(form_data),
+                    idempotent=False,
+                )
                 self.results.append(form_result)
             except Exception as e:
                 logger.warning(f"Teste de formulário externo pulado: {e}")
@@ -772,11 +1047,13 @@ class WebAutomation:
                     }
                 )
 
-            # Capturar screenshot final
-            screenshot_path = self.take_screenshot("automation_final.png")
+            screenshot_path = None
+            if persist:
+                # Capturar screenshot final
+                screenshot_path = self.take_screenshot("automation_final.png")
 
-            # Salvar resultados
-            self._save_results()
+                # Salvar resultados
+                self._save_results()
 
             # Calcular estatísticas
             total_tests = len(self.results)
@@ -803,6 +1080,7 @@ class WebAutomation:
             return {"success": False, "error": str(e), "results": self.results}
 
         finally:
+            self.debug_screenshots = debug_screenshots
             self.cleanup()
 
     def _save_results(self) -> None:
@@ -824,6 +1102,15 @@ class WebAutomation:
                         "successful_tests": sum(
                             1 for r in self.results if r.get("success", False)
                         ),
+                        "driver_pool": self.pool.metrics() if self.pool else None,
+                        "selector_stats": self.selector_cache.stats(),
+                        "driver_profile": self.profile.name,
+                        "driver_setup": self.driver_resolver.stats(),
+                        "query_cache": self.query_cache.stats() if self.query_cache else None,
+                        "session_state": self.session_state.stats(),
+                        "supervisor": self.supervisor.metrics() if self.supervisor else None,
+                        "screenshots": self.screenshots.metrics(),
+                        "rate_limits": self.rate_limiter.metrics(),
                     },
                     "results": self.results,
                 },
@@ -834,14 +1121,36 @@ class WebAutomation:
 
         logger.info(f"Resultados salvos: {filename}")
 
-    def cleanup(self) -> None:
-        """Limpeza de recursos."""
-        if self.driver:
+    def cleanup(self, save_caches: bool = True) -> None:
+        """
+        Limpeza de recursos.
+
+        Args:
+            save_caches: Persistir caches de seletores/consultas (runners em lote
+                desligam e salvam uma vez ao final)
+        """
+        self.refresh_stale_queries()
+        if save_caches:
+            self.selector_cache.save()
+        if self.query_cache is not None:
+            # Sem navegador (ex.: driver já devolvido ao pool) as revalidações não rodam
+            self.query_cache.cancel_deferred(self._stale_queries)
+            if save_caches:
+                self.query_cache.save()
+        # Screenshots pendentes gravados antes de encerrar
+        self.screenshots.close()
+
+        if self.driver and self.pool:
+            # Sessão volta ao pool para o próximo job
+            self.pool.release(self.detach_driver())
+            logger.info("WebDriver devolvido ao pool")
+        elif self.driver:
             try:
                 self.driver.quit()
                 logger.info("WebDriver fechado")
             except Exception as e:
                 logger.warning(f"Erro ao fechar WebDriver: {e}")
+        release_profiles(self._profile_dirs)
 
 
 def main():
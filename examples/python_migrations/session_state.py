@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Snapshots de estado de sessão do navegador.
+
+Cada driver começa com um perfil vazio e repete banners de consentimento e
+logins. Este módulo guarda e restaura o estado por origem:
+[OK] Cookies e localStorage salvos por origem (JSON em output/)
+[OK] Restauração sem navegação extra no Chromium (CDP), com fallback padrão
+[OK] Scripts de restauração removidos ao devolver o driver (sessão reutilizada)
+[OK] Marcas de fluxos concluídos (ex.: ``consent``) para pular etapas
+[OK] Duração de cada etapa pulada (tempo economizado)
+[OK] Cópia de um diretório de perfil modelo por worker
+"""
+
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from json_store import JsonStore
+from web_urls import origin_of
+
+DEFAULT_STATE_PATH = Path("output") / "session_state.json"
+DEFAULT_PROFILES_DIR = Path("output") / "profiles"
+
+# Arquivos de trava e caches que não devem ser copiados do perfil modelo
+PROFILE_SKIP = ("Singleton*", "lockfile", "*.lock", "Crashpad", "*Cache", "Code Cache")
+
+# Reaplica o localStorage salvo antes dos scripts da página (apenas na origem salva)
+LOCAL_STORAGE_SCRIPT = """
+if (location.origin === %s) {
+    const items = %s;
+    for (const [key, value] of Object.entries(items)) {
+        if (localStorage.getItem(key) === null) localStorage.setItem(key, value);
+    }
+}
+"""
+
+
+def _cdp_cookie(cookie: Dict) -> Dict:
+    """Cookie do WebDriver no formato de ``Network.setCookies``."""
+    converted = {
+        key: cookie[key]
+        for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        if key in cookie
+    }
+    if "expiry" in cookie:
+        converted["expires"] = cookie["expiry"]
+    return converted
+
+
+class SessionState(JsonStore):
+    """Cookies, localStorage e fluxos concluídos por origem."""
+
+    DEFAULT_PATH = DEFAULT_STATE_PATH
+    LABEL = "Estado de sessão"
+
+    def __init__(self, path: Optional[Path] = DEFAULT_STATE_PATH):
+        """
+        Inicializar armazenamento.
+
+        Args:
+            path: Arquivo JSON de persistência (None = somente memória)
+        """
+        super().__init__(path)
+        self._entries: Dict[str, Dict] = self._read("origins", {})
+
+    def _payload(self) -> Dict:
+        """Snapshots por origem para ``save``."""
+        return {"origins": self._entries}
+
+    def capture(
+        self,
+        driver: WebDriver,
+        url: str,
+        flags: Iterable[str] = (),
+        step_seconds: Optional[Dict[str, float]] = None,
+    ) -> Dict:
+        """
+        Salvar cookies e localStorage da página atual.
+
+        Args:
+            driver: Driver posicionado em uma página da origem
+            url: URL da origem a salvar
+            flags: Fluxos concluídos nesta sessão (ex.: ``consent``, ``login``)
+            step_seconds: Duração de cada fluxo (tempo economizado ao pulá-lo)
+
+        Returns:
+            Snapshot salvo (vazio para páginas fora de http/https)
+        """
+        origin = origin_of(url)
+        if origin is None:
+            return {}
+        try:
+            cookies = driver.get_cookies()
+            local_storage = driver.execute_script(
+                "return location.origin === arguments[0] ? "
+                "Object.assign({}, window.localStorage) : null;",
+                origin,
+            )
+        except WebDriverException as e:
+            logger.warning(f"Não foi possível capturar sessão de {origin}: {e}")
+            return {}
+
+        with self._lock:
+            entry = self._entries.setdefault(origin, {"flags": [], "step_seconds": {}})
+            entry["cookies"] = cookies
+            if local_storage is not None:
+                entry["local_storage"] = local_storage
+            entry["flags"] = sorted(set(entry["flags"]) | set(flags))
+            entry["step_seconds"].update(
+                {step: round(seconds, 3) for step, seconds in (step_seconds or {}).items()}
+            )
+            entry["saved_at"] = time.time()
+            snapshot = dict(entry)
+            self._dirty = True
+        self.save()
+        logger.debug(
+            f"Sessão de {origin} salva: {len(cookies)} cookies, flags {snapshot['flags']}"
+        )
+        return snapshot
+
+    def restore(
+        self, driver: WebDriver, url: str, scripts: Optional[List[str]] = None
+    ) -> Set[str]:
+        """
+        Restaurar snapshot da origem antes da primeira navegação até ela.
+
+        No Chromium usa CDP (sem navegação extra); nos demais navega até a
+        origem, aplica cookies/localStorage e permanece nela.
+
+        Args:
+            driver: Driver da sessão
+            url: URL que será aberta em seguida
+            scripts: Recebe os identificadores dos scripts CDP registrados
+                (removidos com ``remove_restore_scripts`` ao devolver o driver)
+
+        Returns:
+            Fluxos concluídos restaurados (vazio sem snapshot ou com todos os
+            cookies salvos expirados)
+        """
+        origin = origin_of(url)
+        with self._lock:
+            entry = self._entries.get(origin)
+            entry = dict(entry) if entry else None
+        if not entry:
+            return set()
+
+        now = time.time()
+        cookies = [c for c in entry.get("cookies", []) if c.get("expiry", now + 1) > now]
+        local_storage = entry.get("local_storage", {})
+
+        try:
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd(
+                    "Network.setCookies", {"cookies": [_cdp_cookie(c) for c in cookies]}
+                )
+                if local_storage:
+                    script = LOCAL_STORAGE_SCRIPT % (
+                        json.dumps(origin),
+                        json.dumps(local_storage),
+                    )
+                    registered = driver.execute_cdp_cmd(
+                        "Page.addScriptToEvaluateOnNewDocument", {"source": script}
+                    )
+                    if scripts is not None and registered:
+                        scripts.append(registered["identifier"])
+            else:
+                driver.get(origin)
+                for cookie in cookies:
+                    driver.add_cookie(cookie)
+                driver.execute_script(
+                    "for (const [k, v] of Object.entries(arguments[0])) "
+                    "localStorage.setItem(k, v);",
+                    local_storage,
+                )
+        except WebDriverException as e:
+            logger.warning(f"Não foi possível restaurar sessão de {origin}: {e}")
+            return set()
+
+        logger.info(f"Sessão de {origin} restaurada: {len(cookies)} cookies")
+        if entry.get("cookies") and not cookies:
+            # Fluxos (ex.: consentimento) vivem nos cookies: expirados, precisam ser refeitos
+            logger.info(f"Cookies de {origin} expirados; fluxos serão executados novamente")
+            return set()
+        return set(entry.get("flags", []))
+
+    def step_seconds(self, url: str, step: str) -> float:
+        """Duração registrada de um fluxo da origem (0 se desconhecida)."""
+        with self._lock:
+            entry = self._entries.get(origin_of(url), {})
+            return entry.get("step_seconds", {}).get(step, 0.0)
+
+    def forget(self, url: str) -> None:
+        """Descartar snapshot da origem (ex.: sessão expirada no servidor)."""
+        with self._lock:
+            self._entries.pop(origin_of(url), None)
+            self._dirty = True
+        self.save()
+
+    def stats(self) -> Dict[str, Dict]:
+        """Cookies, chaves de localStorage, fluxos e idade por origem."""
+        now = time.time()
+        with self._lock:
+            return {
+                origin: {
+                    "cookies": len(entry.get("cookies", [])),
+                    "local_storage_keys": len(entry.get("local_storage", {})),
+                    "flags": entry.get("flags", []),
+                    "step_seconds": entry.get("step_seconds", {}),
+                    "age_seconds": round(now - entry.get("saved_at", now), 1),
+                }
+                for origin, entry in self._entries.items()
+            }
+
+
+def prepare_profile(template: Path, root: Path = DEFAULT_PROFILES_DIR) -> Path:
+    """
+    Copiar o perfil modelo para um diretório exclusivo do worker.
+
+    Travas e caches do navegador não são copiados; cada sessão tem seu próprio
+    diretório porque o navegador não compartilha ``--user-data-dir``.
+
+    Args:
+        template: Diretório de perfil pré-configurado (consentimentos, logins)
+        root: Onde criar as cópias
+
+    Returns:
+        Diretório de perfil do worker
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    target = Path(tempfile.mkdtemp(prefix="worker-", dir=root))
+    start = time.perf_counter()
+    shutil.copytree(
+        template, target, dirs_exist_ok=True, ignore=shutil.ignore_patterns(*PROFILE_SKIP)
+    )
+    logger.debug(
+        f"Perfil {template} copiado para {target} em {time.perf_counter() - start:.2f}s"
+    )
+    return target
+
+
+def remove_restore_scripts(driver: WebDriver, identifiers: List[str]) -> None:
+    """Remover scripts de restauração de localStorage do driver (esvazia a lista)."""
+    while identifiers:
+        identifier = identifiers.pop()
+        try:
+            driver.execute_cdp_cmd(
+                "Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier}
+            )
+        except WebDriverException as e:
+            logger.debug(f"Script de restauração {identifier} não removido: {e}")
+
+
+def release_profiles(paths: List[Path]) -> None:
+    """Remover cópias de perfil (esvazia a lista)."""
+    while paths:
+        shutil.rmtree(paths.pop(), ignore_errors=True)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Modo contínuo (monitor sintético) para a suite Selenium.
+
+A suite roda em loop por horas ou dias sem crescer em memória nem em disco:
+[OK] Execução a cada N segundos ou contínua (``interval=0``)
+[OK] Apenas agregados: contagens, taxa de sucesso e histograma de latência por etapa
+[OK] Janela limitada das falhas mais recentes
+[OK] Snapshot compacto sobrescrito periodicamente (um único arquivo)
+[OK] Sessão reaproveitada entre execuções (pool de um driver)
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, Optional
+
+from loguru import logger
+
+from driver_pool import DriverPool, PoolConfig
+from metrics import LatencyRecorder
+from selenium_automation import WebAutomation
+
+# Limites superiores (s) dos intervalos do histograma de latência
+LATENCY_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+
+def step_name(result: Dict) -> str:
+    """Identificar a etapa da suite que produziu o resultado."""
+    if "test_type" in result:
+        return result["test_type"]
+    if "query" in result:
+        return "search_google"
+    if "form_data" in result:
+        return "form_filling"
+    return "unknown"
+
+
+class _StepStats:
+    """Agregados de uma etapa (memória constante)."""
+
+    def __init__(self):
+        self.runs = 0
+        self.successes = 0
+        self.latency = LatencyRecorder()
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, success: bool, seconds: Optional[float]) -> None:
+        self.runs += 1
+        self.successes += 1 if success else 0
+        if seconds is not None:
+            self.latency.record(seconds)
+            bucket = next(
+                (i for i, limit in enumerate(LATENCY_BUCKETS) if seconds <= limit),
+                len(LATENCY_BUCKETS),
+            )
+            self.histogram[bucket] += 1
+
+    def summary(self) -> Dict:
+        labels = [f"<={limit:g}s" for limit in LATENCY_BUCKETS] + [
+            f">{LATENCY_BUCKETS[-1]:g}s"
+        ]
+        return {
+            "runs": self.runs,
+            "successes": self.successes,
+            "success_rate": round(self.successes / self.runs * 100, 1) if self.runs else 0.0,
+            "latency": self.latency.summary(),
+            "histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+class RollingStats:
+    """Agregados por etapa e janela das falhas recentes."""
+
+    def __init__(self, max_failures: int = 50):
+        """
+        Inicializar agregados.
+
+        Args:
+            max_failures: Falhas recentes mantidas com detalhes
+        """
+        self.steps: Dict[str, _StepStats] = {}
+        self.failures: Deque[Dict] = deque(maxlen=max_failures)
+        self.started = datetime.now().isoformat()
+        self._lock = threading.Lock()
+
+    def record(
+        self, step: str, success: bool, seconds: Optional[float], error: str = ""
+    ) -> None:
+        """Registrar uma execução de etapa."""
+        with self._lock:
+            self.steps.setdefault(step, _StepStats()).record(success, seconds)
+            if not success:
+                self.failures.append(
+                    {
+                        "step": step,
+                        "error": (error or "")[:300],
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                )
+
+    def record_suite(self, report: Dict, seconds: float) -> None:
+        """Registrar a suite inteira e cada uma das etapas do relatório."""
+        for result in report.get("results", []):
+            # Acerto de cache repete o tempo da navegação original: fora da latência
+            cached = result.get("cache") in ("hit", "stale")
+            self.record(
+                step_name(result),
+                bool(result.get("success")),
+                None if cached else result.get("execution_time"),
+                result.get("error", ""),
+            )
+        suite_ok = report.get("success", False) and report.get(
+            "successful_tests"
+        ) == report.get("total_tests")
+        self.record("suite", suite_ok, seconds, report.get("error", ""))
+
+    def snapshot(self) -> Dict:
+        """Resumo compacto (tamanho independente do tempo de execução)."""
+        with self._lock:
+            return {
+                "started": self.started,
+                "updated": datetime.now().isoformat(),
+                "steps": {name: stats.summary() for name, stats in self.steps.items()},
+                "recent_failures": list(self.failures),
+            }
+
+
+class SoakRunner:
+    """Executar ``run_automation_suite`` repetidamente mantendo só agregados."""
+
+    def __init__(
+        self,
+        automation: Optional[WebAutomation] = None,
+        interval: float = 60.0,
+        snapshot_path: Path = Path("output") / "soak_snapshot.json",
+        snapshot_every: float = 60.0,
+        max_failures: int = 50,
+    ):
+        """
+        Inicializar modo contínuo.
+
+        Args:
+            automation: Automação reutilizada (padrão: headless com pool de um driver;
+                sem cache de consultas, cada execução mede a navegação real)
+            interval: Segundos entre inícios de execuções (0 = contínuo)
+            snapshot_path: Arquivo do snapshot (sobrescrito)
+            snapshot_every: Segundos entre snapshots
+            max_failures: Falhas recentes mantidas com detalhes
+        """
+        self.automation = automation or WebAutomation(headless=True)
+        self.interval = interval
+        self.snapshot_path = Path(snapshot_path)
+        self.snapshot_every = snapshot_every
+        self.stats = RollingStats(max_failures)
+        self.iterations = 0
+        self._stop = threading.Event()
+        self._owns_pool = self.automation.pool is None
+        if self._owns_pool:
+            # Mesma sessão entre execuções: cleanup devolve o driver ao pool
+            self.automation.pool = DriverPool(
+                self.automation.create_driver, PoolConfig(size=1, prewarm=False)
+            )
+
+    def stop(self) -> None:
+        """Encerrar o loop após a execução em andamento."""
+        self._stop.set()
+
+    def write_snapshot(self) -> Dict:
+        """Sobrescrever o snapshot de forma atômica."""
+        snapshot = {"iterations": self.iterations, **self.stats.snapshot()}
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2, ensure_ascii=False)
+        tmp.replace(self.snapshot_path)
+        return snapshot
+
+    def run(self, iterations: Optional[int] = None, duration: Optional[float] = None) -> Dict:
+        """
+        Executar a suite em loop.
+
+        Args:
+            iterations: Número máximo de execuções (None = sem limite)
+            duration: Tempo máximo (s) (None = sem limite)
+
+        Returns:
+            Último snapshot
+        """
+        logger.info(f"=== Modo contínuo: intervalo {self.interval}s ===")
+        start = time.monotonic()
+        last_snapshot = start
+
+        try:
+            while not self._stop.is_set():
+                if iterations is not None and self.iterations >= iterations:
+                    break
+                if duration is not None and time.monotonic() - start >= duration:
+                    break
+
+                began = time.monotonic()
+                try:
+                    report = self.automation.run_automation_suite(persist=False)
+                except Exception as e:
+                    report = {"success": False, "error": str(e), "results": []}
+                self.stats.record_suite(report, time.monotonic() - began)
+                self.iterations += 1
+
+                if time.monotonic() - last_snapshot >= self.snapshot_every:
+                    self.write_snapshot()
+                    last_snapshot = time.monotonic()
+
+                remaining = self.interval - (time.monotonic() - began)
+                if remaining > 0:
+                    self._stop.wait(remaining)
+        except KeyboardInterrupt:
+            logger.info("Modo contínuo interrompido")
+        finally:
+            snapshot = self.write_snapshot()
+            if self._owns_pool:
+                self.automation.pool.close()
+                self.automation.pool = None
+
+        suite = snapshot["steps"].get("suite", {})
+        logger.success(
+            f"Modo contínuo encerrado: {self.iterations} execuções, "
+            f"{suite.get('success_rate', 0.0)}% de sucesso"
+        )
+        return snapshot
+
+
+def main():
+    """Executar a suite como monitor sintético a cada 5 minutos."""
+    runner = SoakRunner(interval=300)
+    runner.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Servidor HTTP local com páginas de teste em memória.
+
+Substitui google.com e httpbin.org nas etapas da suite Selenium:
+[OK] Formulário de teste, busca falsa e formulário httpbin servidos da memória
+[OK] Eco de ``/post`` no formato do httpbin (JSON)
+[OK] Injeção de latência configurável (global e por caminho)
+[OK] Roda em thread própria, porta livre escolhida pelo sistema
+
+Exemplo:
+    with StandInServer(latency=0.05) as server:
+        automation = WebAutomation(headless=True)
+        automation.configure_urls(**server.site_urls())
+        automation.run_automation_suite()
+"""
+
+import html
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from loguru import logger
+
+TEST_FORM_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Teste de Formulário</title>
+    <style>
+        body { font-family: Arial, sans-serif; padding: 20px; }
+        .form-group { margin: 10px 0; }
+        label { display: block; margin-bottom: 5px; }
+        input, textarea, select {
+            padding: 5px;
+            margin-bottom: 10px;
+            width: 200px;
+        }
+        button {
+            padding: 10px 20px;
+            background-color: #007bff;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            cursor: pointer;
+        }
+    </style>
+</head>
+<body>
+    <h1>Formulário de Teste</h1>
+    <form id="testForm">
+        <div class="form-group">
+            <label for="nome">Nome:</label>
+            <input type="text" id="nome" name="nome" required>
+        </div>
+        <div class="form-group">
+            <label for="email">Email:</label>
+            <input type="email" id="email" name="email" required>
+        </div>
+        <div class="form-group">
+            <label for="idade">Idade:</label>
+            <input type="number" id="idade" name="idade" min="1" max="120">
+        </div>
+        <div class="form-group">
+            <label for="comentarios">Comentários:</label>
+            <textarea id="comentarios" name="comentarios" rows="4"></textarea>
+        </div>
+        <button type="submit" id="submitBtn">Enviar</button>
+    </form>
+    <div id="resultado" style="margin-top: 20px; display: none;">
+        <h2>Formulário enviado com sucesso!</h2>
+    </div>
+    <script>
+        document.getElementById('testForm').addEventListener(
+            'submit', function(e) {
+            e.preventDefault();
+            document.getElementById('resultado').style.display = 'block';
+        });
+    </script>
+</body>
+</html>
+"""
+
+HTTPBIN_FORM_HTML = """<!DOCTYPE html>
+<html>
+<head><title>Formulário httpbin</title></head>
+<body>
+<form method="post" action="/post">
+  <p><label>Customer name: <input name="custname"></label></p>
+  <p><label>Telephone: <input type="tel" name="custtel"></label></p>
+  <p><label>E-mail address: <input type="email" name="custemail"></label></p>
+  <fieldset>
+    <legend> Pizza Size </legend>
+    <p><label><input type="radio" name="size" value="small"> Small </label></p>
+    <p><label><input type="radio" name="size" value="medium"> Medium </label></p>
+    <p><label><input type="radio" name="size" value="large"> Large </label></p>
+  </fieldset>
+  <fieldset>
+    <legend> Pizza Toppings </legend>
+    <p><label><input type="checkbox" name="topping" value="bacon"> Bacon </label></p>
+    <p><label><input type="checkbox" name="topping" value="cheese"> Extra Cheese </label></p>
+    <p><label><input type="checkbox" name="topping" value="onion"> Onion </label></p>
+    <p><label><input type="checkbox" name="topping" value="mushroom"> Mushroom </label></p>
+  </fieldset>
+  <p><label>Preferred delivery time: <input type="time" name="delivery"></label></p>
+  <p><label>Delivery instructions: <textarea name="comments"></textarea></label></p>
+  <p><button>Submit order</button></p>
+</form>
+</body>
+</html>
+"""
+
+SEARCH_HOME_HTML = """<!DOCTYPE html>
+<html>
+<head><title>Pesquisa</title></head>
+<body>
+  <div id="consent">
+    <button onclick="document.getElementById('consent').remove()">Accept all</button>
+  </div>
+  <form action="/search" method="get">
+    <textarea name="q" title="Search" rows="1"></textarea>
+    <button type="submit">Pesquisar</button>
+  </form>
+</body>
+</html>
+"""
+
+SEARCH_RESULT_HTML = """
+<div class="g">
+  <div class="yuRUbf">
+    <a href="https://example.com/{i}"><h3>{query} - resultado {i}</h3></a>
+  </div>
+  <div class="VwiC3b">Descrição do resultado {i} para "{query}".</div>
+</div>"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Handler das páginas em memória (configurado pelo StandInServer)."""
+
+    protocol_version = "HTTP/1.1"
+    # Cabeçalho e corpo são escritos separadamente: sem Nagle, sem atraso de ACK
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def _send(self, status: int, body: str, content_type: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):  # noqa: N802 - API do http.server
+        stand_in = self.server.stand_in
+        parts = urlsplit(self.path)
+        stand_in.delay(parts.path)
+
+        if parts.path == "/search":
+            params = parse_qs(parts.query)
+            query = params.get("q", [""])[0]
+            try:
+                start = max(0, int(params.get("start", ["0"])[0] or 0))
+            except ValueError:
+                # ``start`` inválido (ex.: ``?start=abc``): primeira página, como o Google
+                start = 0
+            self._send(200, stand_in.search_page(query, start), "text/html")
+        elif parts.path in stand_in.pages:
+            self._send(200, stand_in.pages[parts.path], "text/html")
+        else:
+            self._send(404, "<h1>404</h1>", "text/html")
+
+    def do_POST(self):  # noqa: N802 - API do http.server
+        stand_in = self.server.stand_in
+        parts = urlsplit(self.path)
+        stand_in.delay(parts.path)
+
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+        # Mesmo formato do httpbin: valor único como string, repetidos como lista
+        body = {
+            "args": {},
+            "form": {k: v[0] if len(v) == 1 else v for k, v in form.items()},
+            "headers": {k: v for k, v in self.headers.items()},
+            "url": stand_in.url(self.path),
+        }
+        self._send(200, json.dumps(body, indent=2, ensure_ascii=False), "application/json")
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stand_in: "StandInServer"
+
+
+class StandInServer:
+    """Servidor HTTP em processo com páginas de teste em memória."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        path_latency: Optional[Dict[str, float]] = None,
+        results_per_page: int = 10,
+        total_results: int = 50,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Inicializar servidor.
+
+        Args:
+            latency: Atraso aplicado a todas as respostas (s)
+            path_latency: Atraso por caminho (ex.: ``{"/search": 0.3}``)
+            results_per_page: Resultados por página da busca falsa
+            total_results: Total de resultados disponíveis (fim da paginação)
+            host: Interface de escuta
+            port: Porta (0 = livre, escolhida pelo sistema)
+        """
+        self.latency = latency
+        self.path_latency = dict(path_latency or {})
+        self.results_per_page = results_per_page
+        self.total_results = total_results
+        self.pages: Dict[str, str] = {
+            "/": SEARCH_HOME_HTML,
+            "/test_form.html": TEST_FORM_HTML,
+            "/forms/post": HTTPBIN_FORM_HTML,
+        }
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._address = (host, port)
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StandInServer":
+        """Iniciar servidor em thread própria."""
+        if self._server is None:
+            self._server = _Server(self._address, StandInHandler)
+            self._server.stand_in = self
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="stand-in", daemon=True
+            )
+            self._thread.start()
+            logger.info(f"Servidor local em {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Encerrar servidor."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join(timeout=5)
+            self._server = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        """URL base (servidor precisa estar iniciado)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str = "/") -> str:
+        """URL absoluta de um caminho."""
+        return f"{self.base_url}{path}"
+
+    def site_urls(self) -> Dict[str, str]:
+        """Endereços para ``WebAutomation.configure_urls``."""
+        return {
+            "google": self.url("/"),
+            "form": self.url("/forms/post"),
+            "test_form": self.url("/test_form.html"),
+        }
+
+    def add_page(self, path: str, content: str) -> None:
+        """Servir página adicional da memória."""
+        self.pages[path] = content
+
+    def delay(self, path: str) -> None:
+        """Aplicar latência configurada e contar a requisição."""
+        with self._lock:
+            self.requests += 1
+        seconds = self.path_latency.get(path, self.latency)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def search_page(self, query: str, start: int = 0) -> str:
+        """Página de resultados no formato do Google (``start`` = deslocamento)."""
+        safe = html.escape(query)
+        end = min(start + self.results_per_page, self.total_results)
+        results = "".join(
+            SEARCH_RESULT_HTML.format(i=i, query=safe) for i in range(start, end)
+        )
+        return (
+            f"<!DOCTYPE html><html><head><title>{safe}</title></head><body>"
+            f"<form action='/search'><textarea name='q'>{safe}</textarea></form>"
+            f"<div id='search'>{results}</div></body></html>"
+        )
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Concorrência entre abas de um único navegador.
+
+Cada tarefa é um gerador que inicia navegações sem bloquear e cede
+(``yield``) a condição que indica que sua aba está pronta para o próximo
+passo. O escalonador alterna entre as abas e atende a primeira que ficar
+pronta:
+[OK] Esperas de rede sobrepostas sem processos de navegador extras
+[OK] Navegação não bloqueante via ``window.location``
+[OK] Tempos por aba (total, espera, trabalho, passos)
+[OK] Prazo por tarefa e falhas isoladas por aba
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generator, List, Optional
+from urllib.parse import urlsplit
+
+from loguru import logger
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from selector_probe import implicit_wait_disabled
+
+Condition = Callable[[WebDriver], Any]
+TabTask = Callable[[WebDriver], Generator[Condition, Any, Dict]]
+
+# O documento atual é marcado antes de sair; a marca some quando o novo documento carrega
+NAVIGATE_SCRIPT = "window.__staleTabPage = true; window.location.href = arguments[0];"
+FRESH_SCRIPT = "return !window.__staleTabPage && document.readyState !== 'loading';"
+
+
+def navigate(driver: WebDriver, url: str) -> None:
+    """Iniciar navegação na aba atual sem aguardar o carregamento."""
+    driver.execute_script(NAVIGATE_SCRIPT, url)
+
+
+class page_at:
+    """Condição: aba já está no endereço de ``url`` e o novo DOM foi carregado."""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.prefix = f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+    def __call__(self, driver: WebDriver) -> bool:
+        if not driver.current_url.startswith(self.prefix):
+            return False
+        return driver.execute_script(FRESH_SCRIPT)
+
+
+@dataclass
+class _Tab:
+    """Estado de uma tarefa em execução."""
+
+    name: str
+    handle: str
+    generator: Generator[Condition, Any, Dict]
+    started: float
+    deadline: float
+    condition: Optional[Condition] = None
+    waiting_since: float = 0.0
+    wait_time: float = 0.0
+    steps: List[float] = field(default_factory=list)
+    result: Optional[Dict] = None
+    finished: float = 0.0
+
+
+class TabScheduler:
+    """Executar tarefas geradoras em abas do mesmo driver."""
+
+    def __init__(self, driver: WebDriver, timeout: float = 30.0, poll_interval: float = 0.05):
+        """
+        Inicializar escalonador.
+
+        Args:
+            driver: WebDriver compartilhado pelas abas
+            timeout: Prazo de cada tarefa (s)
+            poll_interval: Pausa quando nenhuma aba está pronta
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    def _advance(self, tab: _Tab, value: Any = None, error: Exception = None) -> None:
+        """Executar a tarefa até a próxima condição (ou até terminar)."""
+        start = time.perf_counter()
+        try:
+            if error is not None:
+                tab.condition = tab.generator.throw(error)
+            else:
+                tab.condition = tab.generator.send(value)
+            tab.waiting_since = time.perf_counter()
+        except StopIteration as stop:
+            tab.result = stop.value if stop.value is not None else {"success": True}
+        except Exception as e:
+            logger.warning(f"Aba '{tab.name}' falhou: {e}")
+            tab.result = {"error": str(e), "success": False}
+        tab.steps.append(time.perf_counter() - start)
+        if tab.result is not None:
+            tab.finished = time.perf_counter()
+
+    def _poll(self, tab: _Tab) -> Any:
+        """Avaliar a condição da aba (falso se ainda não pronta)."""
+        try:
+            return tab.condition(self.driver)
+        except WebDriverException:
+            return False
+
+    def run(self, tasks: Dict[str, TabTask], close_tabs: bool = True) -> Dict[str, Dict]:
+        """
+        Executar tarefas, uma por aba, atendendo a primeira aba pronta.
+
+        Args:
+            tasks: Nome → função geradora que recebe o driver
+            close_tabs: Fechar as abas extras ao final
+
+        Returns:
+            Nome → resultado da tarefa com a chave ``tab`` (tempos da aba)
+        """
+        original = self.driver.current_window_handle
+        tabs: List[_Tab] = []
+
+        with implicit_wait_disabled(self.driver):
+            for index, (name, task) in enumerate(tasks.items()):
+                if index:
+                    self.driver.switch_to.new_window("tab")
+                now = time.perf_counter()
+                tab = _Tab(
+                    name=name,
+                    handle=self.driver.current_window_handle,
+                    generator=task(self.driver),
+                    started=now,
+                    deadline=now + self.timeout,
+                )
+                tabs.append(tab)
+                # Inicia a navegação e segue para a próxima aba sem esperar
+                self._advance(tab)
+
+            current = tabs[-1].handle if tabs else original
+            pending = [tab for tab in tabs if tab.result is None]
+            while pending:
+                progressed = False
+                for tab in pending:
+                    if current != tab.handle:
+                        self.driver.switch_to.window(tab.handle)
+                        current = tab.handle
+
+                    value = self._poll(tab)
+                    now = time.perf_counter()
+                    if value or now >= tab.deadline:
+                        tab.wait_time += now - tab.waiting_since
+                        if value:
+                            self._advance(tab, value)
+                        else:
+                            self._advance(tab, error=TimeoutException(f"Aba '{tab.name}'"))
+                        progressed = True
+
+                pending = [tab for tab in pending if tab.result is None]
+                if pending and not progressed:
+                    time.sleep(self.poll_interval)
+
+            if close_tabs:
+                for tab in tabs:
+                    if tab.handle != original:
+                        self.driver.switch_to.window(tab.handle)
+                        self.driver.close()
+            self.driver.switch_to.window(original)
+
+        results = {}
+        for tab in tabs:
+            results[tab.name] = {
+                **tab.result,
+                "tab": {
+                    "handle": tab.handle,
+                    "wall_time": round(tab.finished - tab.started, 3),
+                    "wait_time": round(tab.wait_time, 3),
+                    "work_time": round(sum(tab.steps), 3),
+                    "steps": len(tab.steps),
+                },
+            }
+        return results
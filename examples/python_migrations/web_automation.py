@@ -17,14 +17,31 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from query_cache import QueryCache, run_deferred
+from screenshot_pipeline import ScreenshotPipeline
+from tab_scheduler import TabScheduler, navigate, page_at
+
 
 class WebAutomation:
     """Automação web com Selenium."""
 
-    def __init__(self, headless: bool = True):
+    PYTHON_DOCS_URL = "https://docs.python.org/3/"
+    GITHUB_URL = "https://github.com/"
+
+    def __init__(
+        self,
+        headless: bool = True,
+        query_cache: QueryCache = None,
+        screenshots: ScreenshotPipeline = None,
+    ):
         self.headless = headless
         self.driver = None
         self.results = []
+        # Pesquisas repetidas servidas do cache (opcional, ex.: QueryCache.shared())
+        self.query_cache = query_cache
+        self._stale_queries = []
+        # Screenshots gravados em segundo plano (padrão: PNG em output/)
+        self.screenshots = screenshots or ScreenshotPipeline()
 
     def setup_driver(self):
         """Configurar Chrome WebDriver."""
@@ -38,24 +55,60 @@ class WebAutomation:
         self.wait = WebDriverWait(self.driver, 10)
 
     def search_python_docs(self, query: str):
-        """Pesquisar na documentação Python."""
+        """Pesquisar na documentação Python (via cache de consultas, se houver)."""
+
+        def fetch():
+            return self._run_steps(self._python_docs_steps(self.driver, query))
+
+        if self.query_cache is None:
+            return fetch()
+        return self.query_cache.get_or_fetch(
+            "python_docs",
+            query,
+            fetch,
+            scope=self.PYTHON_DOCS_URL,
+            deferred=self._stale_queries,
+        )
+
+    def automate_github_search(self, repo_name: str):
+        """Automatizar busca no GitHub."""
+        return self._run_steps(self._github_steps(self.driver, repo_name))
+
+    def _run_steps(self, steps):
+        """Executar passos de uma tarefa em sequência, na aba atual."""
+        try:
+            condition = next(steps)
+            while True:
+                try:
+                    value = self.wait.until(condition)
+                except Exception as e:
+                    # Erro entregue à tarefa, que o trata como no fluxo original
+                    condition = steps.throw(e)
+                else:
+                    condition = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+
+    def _python_docs_steps(self, driver, query: str):
+        """Passos da pesquisa na documentação Python (cede a condição de cada espera)."""
         print(f"[BUSCA] Pesquisando: {query}")
         start_time = time.time()
 
         try:
-            # Navegar para docs Python
-            self.driver.get("https://docs.python.org/3/")
+            # Navegar para docs Python (sem bloquear a aba)
+            navigate(driver, self.PYTHON_DOCS_URL)
+            yield page_at(self.PYTHON_DOCS_URL)
 
             # Localizar campo de busca
-            search_box = self.wait.until(EC.presence_of_element_located((By.NAME, "q")))
+            search_box = yield EC.presence_of_element_located((By.NAME, "q"))
 
             # Realizar pesquisa
             search_box.send_keys(query)
             search_box.submit()
 
             # Aguardar resultados
-            results = self.wait.until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".search li"))
+            results = yield EC.presence_of_all_elements_located(
+                (By.CSS_SELECTOR, ".search li")
             )
 
             # Extrair títulos dos primeiros 3 resultados
@@ -79,26 +132,26 @@ class WebAutomation:
         except Exception as e:
             return {"query": query, "error": str(e), "success": False}
 
-    def automate_github_search(self, repo_name: str):
-        """Automatizar busca no GitHub."""
+    def _github_steps(self, driver, repo_name: str):
+        """Passos da busca no GitHub (cede a condição de cada espera)."""
         print(f"[BUSCA] Buscando repositório: {repo_name}")
 
         try:
-            self.driver.get("https://github.com")
+            navigate(driver, self.GITHUB_URL)
+            yield page_at(self.GITHUB_URL)
 
             # Localizar campo de busca
-            search_box = self.wait.until(EC.presence_of_element_located((By.NAME, "q")))
+            search_box = yield EC.presence_of_element_located((By.NAME, "q"))
 
             search_box.send_keys(repo_name)
             search_box.submit()
 
             # Aguardar resultados
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".repo-list-item"))
+            first_repo = yield EC.presence_of_element_located(
+                (By.CSS_SELECTOR, ".repo-list-item")
             )
 
             # Extrair primeiro resultado
-            first_repo = self.driver.find_element(By.CSS_SELECTOR, ".repo-list-item")
             title = first_repo.find_element(By.CSS_SELECTOR, "h3 a").text
             description = first_repo.find_element(By.CSS_SELECTOR, "p").text
 
@@ -111,28 +164,48 @@ class WebAutomation:
         except Exception as e:
             return {"repo_searched": repo_name, "error": str(e), "success": False}
 
-    def take_screenshot(self, name: str = "screenshot"):
-        """Capturar screenshot."""
-        Path("output").mkdir(exist_ok=True)
-        filename = f"output/{name}_{datetime.now().strftime('%H%M%S')}.png"
-        self.driver.save_screenshot(filename)
-        print(f" Screenshot salvo: {filename}")
+    def take_screenshot(self, name: str = "screenshot", **options):
+        """Capturar screenshot (opções de ``ScreenshotPipeline.capture``)."""
+        filename = self.screenshots.capture(
+            self.driver, f"{name}_{datetime.now().strftime('%H%M%S')}.png", **options
+        )
+        print(f" Screenshot capturado: {filename}")
         return filename
 
-    def run_tests(self):
-        """Executar suite de testes."""
+    def run_tests(self, tabs: bool = False):
+        """
+        Executar suite de testes.
+
+        Args:
+            tabs: Executar os testes em abas concorrentes do mesmo navegador
+        """
         print("[INICIO] Iniciando automação web...")
 
         self.setup_driver()
+        start_time = time.time()
 
         try:
-            # Teste 1: Pesquisa Python docs
-            result1 = self.search_python_docs("selenium automation")
-            self.results.append(result1)
-
-            # Teste 2: Busca GitHub
-            result2 = self.automate_github_search("python selenium")
-            self.results.append(result2)
+            if tabs:
+                # Uma aba por teste: esperas de rede sobrepostas no mesmo navegador
+                scheduled = TabScheduler(self.driver, timeout=30).run(
+                    {
+                        "python_docs": lambda driver: self._python_docs_steps(
+                            driver, "selenium automation"
+                        ),
+                        "github": lambda driver: self._github_steps(driver, "python selenium"),
+                    }
+                )
+                self.results.extend(scheduled.values())
+                tab_timings = {name: result["tab"] for name, result in scheduled.items()}
+                print(f"[ABAS] Tempos por aba: {tab_timings}")
+            else:
+                # Teste 1: Pesquisa Python docs
+                result1 = self.search_python_docs("selenium automation")
+                self.results.append(result1)
+
+                # Teste 2: Busca GitHub
+                result2 = self.automate_github_search("python selenium")
+                self.results.append(result2)
 
             # Screenshot final
             self.take_screenshot("final_result")
@@ -145,6 +218,8 @@ class WebAutomation:
             return {
                 "status": "concluído",
                 "formularios_preenchidos": len(self.results),
+                "modo": "abas" if tabs else "sequencial",
+                "tempo_total": round(time.time() - start_time, 3),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -165,6 +240,8 @@ class WebAutomation:
                         "total": len(self.results),
                         "successful": sum(1 for r in self.results if r.get("success")),
                     },
+                    "query_cache": self.query_cache.stats() if self.query_cache else None,
+                    "screenshots": self.screenshots.metrics(),
                 },
                 f,
                 indent=2,
@@ -175,6 +252,14 @@ class WebAutomation:
 
     def cleanup(self):
         """Limpar recursos."""
+        if self.query_cache is not None:
+            if self.driver and self._stale_queries:
+                # Pesquisas servidas vencidas são atualizadas antes de fechar o navegador
+                print(f"[CACHE] Revalidando {run_deferred(self._stale_queries)} pesquisas")
+            self.query_cache.cancel_deferred(self._stale_queries)
+            self.query_cache.save()
+        self.screenshots.close()
+
         if self.driver:
             self.driver.quit()
             print("🧹 WebDriver fechado")
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Chaves derivadas de URLs usadas pelas automações web.
+
+Pool de drivers, estado de sessão e limitador por domínio agrupam acessos
+pelo mesmo critério:
+[OK] Origem ``scheme://host[:porta]`` apenas para páginas http(s)
+[OK] Host sem porta como chave do limite por domínio
+"""
+
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+def origin_of(url: str) -> Optional[str]:
+    """Origem ``scheme://host[:porta]`` de URLs http(s) (None para about:, file: etc.)."""
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def host_of(url: str) -> str:
+    """Domínio usado como chave do limite (``host`` sem porta)."""
+    return urlsplit(url).hostname or url
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Esperas baseadas em condições para Selenium.
+
+Substitui ``time.sleep`` fixos por condições observáveis na página:
+[OK] document.readyState completo
+[OK] Elemento estável (posição/tamanho inalterados)
+[OK] Sem requisições XHR/fetch pendentes
+[OK] DOM quiescente por X ms
+[OK] Registro do tempo economizado por etapa
+"""
+
+import time
+from typing import Callable, Dict, Tuple, Union
+
+from loguru import logger
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+Condition = Callable[[WebDriver], bool]
+Locator = Tuple[str, str]
+
+# Instrumenta fetch/XHR e mutações do DOM (idempotente)
+INSTRUMENTATION_SCRIPT = """
+(function () {
+  if (window.__autoitInstrumented) { return; }
+  window.__autoitInstrumented = true;
+  window.__autoitPending = 0;
+  window.__autoitLastMutation = performance.now();
+
+  var done = function () { window.__autoitPending = Math.max(0, window.__autoitPending - 1); };
+
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function () {
+      window.__autoitPending++;
+      return originalFetch.apply(this, arguments).then(
+        function (r) { done(); return r; },
+        function (e) { done(); throw e; }
+      );
+    };
+  }
+
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    window.__autoitPending++;
+    this.addEventListener('loadend', done);
+    return originalSend.apply(this, arguments);
+  };
+
+  var observe = function () {
+    new MutationObserver(function () {
+      window.__autoitLastMutation = performance.now();
+    }).observe(document, {
+      childList: true, subtree: true, attributes: true, characterData: true
+    });
+  };
+  if (document.documentElement) { observe(); }
+  else { document.addEventListener('DOMContentLoaded', observe); }
+})();
+"""
+
+
+def document_ready() -> Condition:
+    """Condição: ``document.readyState`` igual a ``complete``."""
+
+    def _condition(driver: WebDriver) -> bool:
+        return driver.execute_script("return document.readyState;") == "complete"
+
+    return _condition
+
+
+def no_pending_requests() -> Condition:
+    """Condição: nenhuma requisição XHR/fetch em andamento."""
+
+    def _condition(driver: WebDriver) -> bool:
+        return not driver.execute_script("return window.__autoitPending || 0;")
+
+    return _condition
+
+
+def dom_quiescent(quiet_ms: int = 300) -> Condition:
+    """Condição: nenhuma mutação no DOM nos últimos ``quiet_ms`` milissegundos."""
+
+    def _condition(driver: WebDriver) -> bool:
+        idle = driver.execute_script(
+            "return window.__autoitLastMutation === undefined"
+            " ? Infinity : performance.now() - window.__autoitLastMutation;"
+        )
+        return idle is None or idle >= quiet_ms
+
+    return _condition
+
+
+def element_stable(target: Union[WebElement, Locator]) -> Condition:
+    """Condição: posição e tamanho do elemento iguais em duas verificações seguidas."""
+    state: Dict[str, object] = {"rect": None}
+
+    def _condition(driver: WebDriver) -> bool:
+        element = driver.find_element(*target) if isinstance(target, tuple) else target
+        rect = driver.execute_script(
+            "var r = arguments[0].getBoundingClientRect();"
+            "return [r.x, r.y, r.width, r.height];",
+            element,
+        )
+        stable = rect == state["rect"]
+        state["rect"] = rect
+        return stable
+
+    return _condition
+
+
+def value_equals(element: WebElement, expected: str) -> Condition:
+    """Condição: valor do campo igual ao texto esperado."""
+
+    def _condition(driver: WebDriver) -> bool:
+        return element.get_attribute("value") == expected
+
+    return _condition
+
+
+class PageWaiter:
+    """Executa esperas por condição e contabiliza o tempo economizado."""
+
+    def __init__(self, driver: WebDriver, poll_frequency: float = 0.05):
+        """
+        Inicializar esperas.
+
+        Args:
+            driver: WebDriver em uso
+            poll_frequency: Intervalo entre verificações (segundos)
+        """
+        self.driver = driver
+        self.poll_frequency = poll_frequency
+        self.savings: Dict[str, float] = {}
+        self._register_instrumentation()
+
+    def _register_instrumentation(self) -> None:
+        """Instrumentar novos documentos desde o início (Chrome/CDP)."""
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": INSTRUMENTATION_SCRIPT}
+            )
+        except Exception:
+            logger.debug("CDP indisponível - instrumentação aplicada após o carregamento")
+
+    def instrument(self) -> None:
+        """Instrumentar o documento atual (no-op se já instrumentado)."""
+        try:
+            self.driver.execute_script(INSTRUMENTATION_SCRIPT)
+        except WebDriverException as e:
+            logger.debug(f"Não foi possível instrumentar a página: {e}")
+
+    def settle(self, step: str, nominal: float, *conditions: Condition) -> float:
+        """
+        Aguardar condições no lugar de um ``time.sleep(nominal)``.
+
+        Nunca espera mais que ``nominal``: se as condições não forem
+        atendidas a tempo, segue adiante como o sleep original faria.
+
+        Args:
+            step: Nome da etapa (para estatísticas)
+            nominal: Duração do sleep substituído (segundos)
+            conditions: Condições que devem ser verdadeiras simultaneamente
+
+        Returns:
+            Tempo efetivamente aguardado
+        """
+        start = time.perf_counter()
+        self.instrument()
+
+        try:
+            WebDriverWait(
+                self.driver,
+                nominal,
+                poll_frequency=self.poll_frequency,
+                ignored_exceptions=(WebDriverException,),
+            ).until(lambda driver: all(condition(driver) for condition in conditions))
+        except TimeoutException:
+            logger.debug(f"Espera '{step}' atingiu o limite de {nominal}s")
+
+        waited = time.perf_counter() - start
+        saved = max(0.0, nominal - waited)
+        self.savings[step] = self.savings.get(step, 0.0) + saved
+        logger.debug(f"Espera '{step}': {waited:.3f}s (economia de {saved:.3f}s)")
+        return waited
+
+    def page_settled(self, step: str, nominal: float, quiet_ms: int = 300) -> float:
+        """Aguardar carregamento completo, rede ociosa e DOM quiescente."""
+        return self.settle(
+            step, nominal, document_ready(), no_pending_requests(), dom_quiescent(quiet_ms)
+        )
+
+    def skip(self, step: str, seconds: float) -> None:
+        """Contabilizar etapa pulada (ex.: consentimento já dado em sessão restaurada)."""
+        self.savings[step] = self.savings.get(step, 0.0) + seconds
+        logger.debug(f"Etapa '{step}' pulada (economia de {seconds:.3f}s)")
+
+    def pop_savings(self) -> float:
+        """Retornar e zerar o tempo total economizado desde a última chamada."""
+        total = sum(self.savings.values())
+        self.savings.clear()
+        return round(total, 3)
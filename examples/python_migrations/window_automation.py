@@ -6,21 +6,61 @@ Demonstra migração profissional com melhorias significativas:
 [OK] Arquitetura modular    [OK] Type hints completos
 [OK] Logging estruturado   [OK] Tratamento de exceções
 [OK] Testes automatizados  [OK] Performance otimizada
+[OK] Fórmulas lidas de planilhas Excel em streaming (openpyxl read-only/write-only)
 """
 
 import asyncio
+import re
 import subprocess
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pyautogui
 import pygetwindow as gw
 from loguru import logger
 import pyperclip
 
+from metrics import LatencyRecorder
+
+try:
+    from openpyxl import Workbook, load_workbook
+except ImportError:  # pragma: no cover - openpyxl está em requirements.txt
+    Workbook = load_workbook = None
+
+# Apenas teclas aceitas pela calculadora (``_ALLOWED_CHARS``): sem funções nem parênteses
+FORMULA_PATTERN = re.compile(r"^[0-9+\-*/. ]+$")
+
+WORKBOOK_RESULT_HEADER = [
+    "row",
+    "description",
+    "formula",
+    "result",
+    "success",
+    "error",
+    "execution_time",
+]
+
+
+def normalize_formula(value: Any) -> Optional[str]:
+    """
+    Converter célula da planilha em sequência de teclas da calculadora.
+
+    Returns:
+        Fórmula terminada em "=" (None para célula vazia)
+
+    Raises:
+        ValueError: Fórmula com funções, referências ou texto
+    """
+    if value is None or str(value).strip() == "":
+        return None
+    formula = str(value).strip().lstrip("=").rstrip("=").strip()
+    if not FORMULA_PATTERN.match(formula):
+        raise ValueError(f"Fórmula não suportada: {value}")
+    return formula.replace(" ", "") + "="
+
 
 @dataclass
 class AutomationConfig:
@@ -29,6 +69,8 @@ class AutomationConfig:
     app_name: str = "Calculadora"
     timeout: int = 5
     output_dir: Path = Path("./output")
+    # Comando alternativo para abrir o app (ex.: calculadora stand-in no Linux)
+    app_command: Optional[List[str]] = None
 
 
 class WindowAutomation:
@@ -82,14 +124,151 @@ class WindowAutomation:
             logger.error(f"Erro na automação: {e}")
             return {"success": False, "error": str(e)}
 
+    async def run_workbook(
+        self,
+        source: Path,
+        output: Optional[Path] = None,
+        sheet: Optional[str] = None,
+        formula_column: str = "formula",
+        description_column: str = "description",
+        progress_every: int = 1000,
+    ) -> Dict:
+        """
+        Calcular as fórmulas de uma planilha e gravar os resultados em outra.
+
+        A planilha de entrada é lida em modo read-only e a de saída escrita em
+        modo write-only: linha a linha, sem carregar nenhuma delas inteira, e
+        sem acumular resultados em ``self.results`` (memória constante).
+
+        Args:
+            source: Planilha .xlsx com cabeçalho na primeira linha
+            output: Planilha de resultados (padrão: ``output_dir/calc_<timestamp>.xlsx``)
+            sheet: Aba de entrada (padrão: a ativa)
+            formula_column: Coluna das fórmulas (padrão: primeira coluna se ausente)
+            description_column: Coluna da descrição (opcional)
+            progress_every: Linhas entre logs de progresso
+
+        Returns:
+            Contagens, caminho da saída e linhas por segundo
+        """
+        if load_workbook is None:
+            raise ImportError("openpyxl é necessário para processar planilhas")
+
+        output = (
+            Path(output)
+            if output
+            else (
+                self.config.output_dir
+                / f"calc_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+            )
+        )
+        logger.info(f"=== Processando planilha {source} ===")
+        counts = {"rows": 0, "successful": 0, "failed": 0, "skipped": 0}
+        latency = LatencyRecorder()
+        start = time.perf_counter()
+
+        source_book = load_workbook(source, read_only=True)
+        target_book = Workbook(write_only=True)
+        # Aba de resultados criada antes de tudo: o save do finally nunca falha por falta dela
+        target = target_book.create_sheet("resultados")
+        target.append(WORKBOOK_RESULT_HEADER)
+        error: Optional[Exception] = None
+        window = None
+        try:
+            worksheet = source_book[sheet] if sheet else source_book.active
+
+            rows = worksheet.iter_rows(values_only=True)
+            header = [str(name).strip().lower() if name else "" for name in next(rows, ())]
+            formula_index = (
+                header.index(formula_column.lower()) if formula_column.lower() in header else 0
+            )
+            description_index = (
+                header.index(description_column.lower())
+                if description_column.lower() in header
+                else None
+            )
+
+            await self._open_calculator()
+            window = await self._find_window()
+
+            for row_number, values in enumerate(rows, start=2):
+                cell = values[formula_index] if formula_index < len(values) else None
+                description = (
+                    values[description_index]
+                    if description_index is not None and description_index < len(values)
+                    else None
+                )
+                try:
+                    formula = normalize_formula(cell)
+                except ValueError as e:
+                    result = {"error": str(e), "success": False}
+                else:
+                    if formula is None:
+                        counts["skipped"] += 1
+                        continue
+                    result = await self._calculate(window, description or cell, formula)
+
+                counts["rows"] += 1
+                counts["successful" if result.get("success") else "failed"] += 1
+                latency.record(result.get("execution_time", 0.0))
+                target.append(
+                    [
+                        row_number,
+                        description,
+                        cell,
+                        result.get("result"),
+                        bool(result.get("success")),
+                        result.get("error"),
+                        result.get("execution_time"),
+                    ]
+                )
+
+                if counts["rows"] % progress_every == 0:
+                    rate = counts["rows"] / (time.perf_counter() - start)
+                    logger.info(f"{counts['rows']} linhas processadas ({rate:.1f} linhas/s)")
+        except Exception as e:
+            error = e
+            logger.error(f"Erro ao processar planilha: {e}")
+            return {"success": False, "error": str(e), **counts, "output": str(output)}
+        finally:
+            # Calculadora fechada e linhas já calculadas preservadas mesmo em caso de erro
+            # (inclusive interrupção)
+            if window is not None:
+                await self._close_app(window)
+            source_book.close()
+            try:
+                output.parent.mkdir(parents=True, exist_ok=True)
+                target_book.save(output)
+            except Exception as save_error:
+                if error is None:
+                    raise
+                # Não mascarar o erro original
+                logger.warning(f"Resultados parciais não gravados: {save_error}")
+
+        wall_time = time.perf_counter() - start
+        rows_per_sec = round(counts["rows"] / wall_time, 3) if wall_time else 0.0
+        logger.success(
+            f"Planilha processada: {counts['rows']} linhas ({rows_per_sec} linhas/s)"
+        )
+        return {
+            "success": True,
+            **counts,
+            "output": str(output),
+            "wall_time": round(wall_time, 3),
+            "rows_per_sec": rows_per_sec,
+            "latency": latency.summary(),
+        }
+
     async def _open_calculator(self) -> None:
         """Abrir calculadora com fallback."""
         logger.info("Abrindo calculadora...")
 
-        commands = ["calc.exe", "calc"]
+        commands = (
+            [self.config.app_command] if self.config.app_command else [["calc.exe"], ["calc"]]
+        )
         for cmd in commands:
             try:
-                subprocess.Popen([cmd])
+                subprocess.Popen(cmd)
                 await asyncio.sleep(2)
 
                 if gw.getWindowsWithTitle(self.config.app_name):
@@ -8,8 +8,13 @@ no ambiente local (Windows/Linux com GUI) quanto no CI/CD (headless).
 import os
 import sys
 import pytest
+from pathlib import Path
 from unittest.mock import MagicMock
 
+# Adicionar path para import (módulos de exemplo usados pelas fixtures)
+examples_path = Path(__file__).parent.parent / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
 # Mock preventivo para PyAutoGUI em ambiente headless
 if os.getenv("CI") or os.getenv("GITHUB_ACTIONS") or not os.getenv("DISPLAY"):
     # Mock do mouseinfo que causa problemas no CI
@@ -73,6 +78,82 @@ def is_gui_available():
     return bool(os.getenv("DISPLAY"))
 
 
+def make_fake_driver() -> MagicMock:
+    """Criar WebDriver falso (aba única; health check do pool responde 1)."""
+    driver = MagicMock()
+    driver.execute_script.return_value = 1
+    driver.window_handles = ["main"]
+    return driver
+
+
+class FakeAutomation:
+    """
+    WebAutomation falsa para testar quem orquestra automações (sem navegador).
+
+    Cada subclasse registra as próprias instâncias em ``instances``;
+    ``cleanup_error`` simula falha no encerramento. Comportamento das etapas
+    (pesquisa, formulário, suite) fica nas subclasses de cada teste.
+    """
+
+    instances: list = []
+    cleanup_error = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.reset()
+
+    @classmethod
+    def reset(cls) -> None:
+        """Descartar instâncias e falhas simuladas de testes anteriores."""
+        cls.instances = []
+        cls.cleanup_error = None
+
+    def __init__(self, *args, **kwargs):
+        self.kwargs = kwargs
+        self.driver = None
+        self.pool = None
+        self.cleaned = False
+        # (driver ainda associado, save_caches) de cada cleanup
+        self.cleanups = []
+        type(self).instances.append(self)
+
+    def attach_driver(self, driver):
+        self.driver = driver
+
+    def detach_driver(self):
+        driver, self.driver = self.driver, None
+        return driver
+
+    def cleanup(self, save_caches=True):
+        self.cleanups.append((self.driver, save_caches))
+        self.cleaned = True
+        if type(self).cleanup_error:
+            raise type(self).cleanup_error
+
+
+@pytest.fixture
+def driver_factory():
+    """Fábrica de drivers falsos que registra os drivers criados (``created``)."""
+    created = []
+
+    def factory():
+        driver = make_fake_driver()
+        created.append(driver)
+        return driver
+
+    factory.created = created
+    return factory
+
+
+@pytest.fixture
+def fake_pool(driver_factory):
+    """Pool de três sessões com drivers falsos."""
+    driver_pool = pytest.importorskip("driver_pool")
+    pool = driver_pool.DriverPool(driver_factory, driver_pool.PoolConfig(size=3))
+    yield pool
+    pool.close()
+
+
 # Configurar marcadores para diferentes tipos de teste
 def pytest_configure(config):
     """Configurar marcadores customizados."""
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Testes para a fachada assíncrona (automações falsas, sem navegador real).
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+from tests.conftest import FakeAutomation
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from async_web import AsyncWebAutomation
+except ImportError as e:
+    pytest.skip(f"Módulo async_web não encontrado: {e}", allow_module_level=True)
+
+
+class BlockingAutomation(FakeAutomation):
+    """WebAutomation com métodos bloqueantes que registram a thread chamadora."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, delay=0.2):
+        super().__init__()
+        self.delay = delay
+        self.threads = set()
+
+    def setup_driver(self):
+        self.threads.add(threading.get_ident())
+        self.driver = object()
+
+    def _blocking(self, result):
+        self.threads.add(threading.get_ident())
+        with BlockingAutomation.lock:
+            BlockingAutomation.active += 1
+            BlockingAutomation.peak = max(BlockingAutomation.peak, BlockingAutomation.active)
+        try:
+            time.sleep(self.delay)  # chamada síncrona do Selenium
+        finally:
+            with BlockingAutomation.lock:
+                BlockingAutomation.active -= 1
+        return result
+
+    def search_google(self, query):
+        if query == "erro":
+            raise RuntimeError("invalid session id")
+        return self._blocking({"success": True, "query": query})
+
+    def automate_form_filling(self, form_data):
+        return self._blocking({"success": True, "data": form_data})
+
+    def cleanup(self, save_caches=True):
+        self.threads.add(threading.get_ident())
+        super().cleanup(save_caches)
+
+
+@pytest.fixture
+def automations():
+    BlockingAutomation.reset()
+    BlockingAutomation.active = BlockingAutomation.peak = 0
+    return []
+
+
+def factory(automations, delay=0.2):
+    def create():
+        automation = BlockingAutomation(delay)
+        automations.append(automation)
+        return automation
+
+    return create
+
+
+@pytest.mark.asyncio
+async def test_calls_do_not_block_event_loop(automations):
+    """Chamadas web rodam em threads; o loop segue atendendo outras corrotinas."""
+    ticks = []
+
+    async def ticker():
+        for _ in range(10):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    async with AsyncWebAutomation(drivers=2, automation_factory=factory(automations)) as web:
+        results = await asyncio.gather(
+            web.search("python"), web.fill_form({"customer_name": "Ana"}), ticker()
+        )
+        metrics = web.metrics()
+
+    assert results[0]["query"] == "python"
+    assert results[1]["data"] == {"customer_name": "Ana"}
+    assert len(ticks) == 10 and ticks[-1] - ticks[0] < 0.2 + 0.15
+    assert metrics["loop_lag"]["max"] < 0.1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_bounded_by_driver_count(automations):
+    """Seis pesquisas com dois drivers: no máximo duas simultâneas."""
+    async with AsyncWebAutomation(drivers=2, automation_factory=factory(automations)) as web:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(web.search(f"q{i}") for i in range(6)))
+        elapsed = time.perf_counter() - start
+        metrics = web.metrics()
+
+    assert [r["query"] for r in results] == [f"q{i}" for i in range(6)]
+    assert BlockingAutomation.peak == 2
+    assert 0.55 <= elapsed < 1.0
+    assert metrics["queue_wait"]["count"] == 6 and metrics["queue_wait"]["max"] >= 0.3
+
+
+@pytest.mark.asyncio
+async def test_driver_affinity_and_cleanup(automations):
+    """Cada automação é usada sempre pela mesma thread, inclusive no cleanup."""
+    async with AsyncWebAutomation(
+        drivers=2, automation_factory=factory(automations, 0.01)
+    ) as web:
+        await asyncio.gather(*(web.search(f"q{i}") for i in range(10)))
+
+    assert len(automations) == 2
+    for automation in automations:
+        assert len(automation.threads) == 1
+        assert automation.cleaned and automation.driver is None
+    assert automations[0].threads != automations[1].threads
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_and_release_driver(automations):
+    """Exceção chega ao chamador e o driver volta a ficar disponível."""
+    async with AsyncWebAutomation(
+        drivers=1, automation_factory=factory(automations, 0.01)
+    ) as web:
+        with pytest.raises(RuntimeError):
+            await web.search("erro")
+        result = await asyncio.wait_for(web.search("python"), timeout=1)
+
+    assert result["success"] is True
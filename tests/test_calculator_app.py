@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Testes para a calculadora stand-in usada nos benchmarks.
+"""
+
+import pytest
+from fractions import Fraction
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+from calculator_app import (  # noqa: E402
+    DIVISION_BY_ZERO_MESSAGE,
+    INVALID_INPUT_MESSAGE,
+    evaluate_expression,
+    format_result,
+)
+
+
+class TestEvaluateExpression:
+    """Testes da avaliação de expressões."""
+
+    @pytest.mark.parametrize(
+        "expression,expected",
+        [
+            ("123+456", "579"),
+            ("789*12", "9468"),
+            ("1000/25", "40"),
+            ("123+456=", "579"),
+            ("10/4", "2.5"),
+            ("1/3", "0.3333333333"),
+            ("2-5", "-3"),
+            ("0.1+0.2", "0.3"),
+        ],
+    )
+    def test_formulas(self, expression, expected):
+        """Testar fórmulas usadas pela automação."""
+        assert evaluate_expression(expression) == expected
+
+    def test_division_by_zero(self):
+        """Testar divisão por zero."""
+        assert evaluate_expression("1/0") == DIVISION_BY_ZERO_MESSAGE
+
+    @pytest.mark.parametrize("expression", ["", "2**8", "__import__('os')", "1+", "abc"])
+    def test_invalid_input(self, expression):
+        """Testar entradas rejeitadas (sem eval)."""
+        assert evaluate_expression(expression) == INVALID_INPUT_MESSAGE
+
+
+def test_format_result_integer():
+    """Testar formatação de inteiros."""
+    assert format_result(Fraction(42)) == "42"
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Testes para o pool de sessões WebDriver (sem navegador real).
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+from tests.conftest import make_fake_driver
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from driver_pool import DriverPool, PoolConfig
+except ImportError as e:
+    pytest.skip(f"Módulo driver_pool não encontrado: {e}", allow_module_level=True)
+
+
+class TestDriverPool:
+    """Testes do ciclo de vida do pool."""
+
+    def test_prewarm_and_reuse(self, driver_factory):
+        """Sessões aquecidas são reutilizadas entre jobs."""
+        pool = DriverPool(driver_factory, PoolConfig(size=2))
+        assert len(driver_factory.created) == 2
+
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        assert second in driver_factory.created
+        assert len(driver_factory.created) == 2
+        first.get.assert_called_with("about:blank")
+
+    def test_reset_clears_every_visited_origin(self):
+        """Storage limpo em todas as origens visitadas pelo job, em qualquer aba."""
+        driver = make_fake_driver()
+        driver.window_handles = ["main", "tab1"]
+        driver.current_url = "about:blank"
+        history = {
+            "main": ["https://a.example/login", "https://a.example/app"],
+            "tab1": ["http://b.example:8080/form"],
+        }
+        current = {"handle": "main"}
+        driver.switch_to.window.side_effect = lambda handle: current.update(handle=handle)
+
+        def cdp(cmd, params):
+            if cmd == "Page.getNavigationHistory":
+                return {"entries": [{"url": url} for url in history[current["handle"]]]}
+            return {}
+
+        driver.execute_cdp_cmd.side_effect = cdp
+        pool = DriverPool(lambda: driver, PoolConfig(size=1))
+
+        pool.release(pool.acquire())
+
+        cleared = [
+            call.args[1]
+            for call in driver.execute_cdp_cmd.call_args_list
+            if call.args[0] == "Storage.clearDataForOrigin"
+        ]
+        assert cleared == [
+            {"origin": "http://b.example:8080", "storageTypes": "all"},
+            {"origin": "https://a.example", "storageTypes": "all"},
+        ]
+        driver.execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+
+    def test_recycle_after_max_uses(self, driver_factory):
+        """Sessão é descartada após N usos."""
+        pool = DriverPool(
+            driver_factory, PoolConfig(size=1, max_uses=1, max_rss_growth_mb=None)
+        )
+
+        driver = pool.acquire()
+        pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert pool.acquire() is not driver
+        assert pool.metrics()["recycled"] == 1
+
+    def test_unhealthy_session_replaced(self, driver_factory):
+        """Sessão que falha no health check é substituída."""
+        pool = DriverPool(driver_factory, PoolConfig(size=1))
+        driver_factory.created[0].execute_script.return_value = None
+
+        driver = pool.acquire()
+
+        assert driver is driver_factory.created[1]
+        assert pool.metrics()["health_failures"] == 1
+
+    def test_acquire_timeout(self, driver_factory):
+        """Aquisição expira quando não há sessões livres."""
+        pool = DriverPool(driver_factory, PoolConfig(size=1))
+        pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.05)
+
+    def test_metrics(self, driver_factory):
+        """Métricas de ocupação e latência."""
+        pool = DriverPool(driver_factory, PoolConfig(size=2))
+
+        with pool.lease():
+            metrics = pool.metrics()
+            assert metrics["in_use"] == 1
+            assert metrics["occupancy"] == 0.5
+
+        metrics = pool.metrics()
+        assert metrics["in_use"] == 0
+        assert metrics["acquire_latency"]["count"] == 1
+        assert metrics["peak_in_use"] == 1
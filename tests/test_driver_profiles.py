@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Testes para os perfis de configuração do WebDriver (sem navegador real).
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from driver_profiles import (
+        DEFAULT_PROFILE,
+        THROUGHPUT_PROFILE,
+        DriverProfile,
+        apply_chrome_options,
+        install_url_blocking,
+        resolve_profile,
+    )
+except ImportError as e:
+    pytest.skip(f"Módulo driver_profiles não encontrado: {e}", allow_module_level=True)
+
+
+def test_default_profile_keeps_chrome_defaults():
+    """Perfil padrão não altera o comportamento anterior."""
+    options = ChromeOptions()
+    apply_chrome_options(options, DEFAULT_PROFILE)
+
+    assert options.page_load_strategy == "normal"
+    assert options.arguments == []
+    assert "prefs" not in options.experimental_options
+
+
+def test_throughput_profile_chrome_options():
+    """Perfil throughput: eager, imagens bloqueadas, sem extensões/rede de fundo."""
+    options = ChromeOptions()
+    apply_chrome_options(options, resolve_profile("throughput"))
+
+    assert options.page_load_strategy == "eager"
+    assert "--disable-extensions" in options.arguments
+    assert "--disable-background-networking" in options.arguments
+    prefs = options.experimental_options["prefs"]
+    assert prefs["profile.managed_default_content_settings.images"] == 2
+
+
+def test_url_blocking_via_cdp():
+    """Tipos de recurso e URLs viram padrões de Network.setBlockedURLs."""
+    driver = MagicMock()
+    profile = DriverProfile(block_resources=("font",), block_urls=("*ads.example*",))
+
+    assert install_url_blocking(driver, profile)
+
+    method, params = driver.execute_cdp_cmd.call_args.args
+    assert method == "Network.setBlockedURLs"
+    assert "*.woff2*" in params["urls"] and "*ads.example*" in params["urls"]
+    assert "*.css*" not in THROUGHPUT_PROFILE.blocked_patterns
+
+
+def test_url_blocking_unavailable():
+    """Sem CDP (ex.: Firefox) ou com erro, o driver segue sem bloqueio."""
+    assert not install_url_blocking(MagicMock(spec=[]), THROUGHPUT_PROFILE)
+
+    driver = MagicMock()
+    driver.execute_cdp_cmd.side_effect = WebDriverException("sem CDP")
+    assert not install_url_blocking(driver, THROUGHPUT_PROFILE)
+
+
+def test_invalid_profiles():
+    """Nome, estratégia ou tipo de recurso desconhecidos são rejeitados."""
+    with pytest.raises(ValueError):
+        resolve_profile("turbo")
+    with pytest.raises(ValueError):
+        DriverProfile(page_load_strategy="lazy")
+    with pytest.raises(ValueError):
+        DriverProfile(block_resources=("video",))
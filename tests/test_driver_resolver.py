@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Testes para o cache de resolução de binários do WebDriver (sem navegador real).
+"""
+
+import os
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    import driver_resolver
+    from driver_resolver import DriverResolver
+    from selenium.common.exceptions import NoSuchDriverException
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.chrome.service import Service
+except ImportError as e:
+    pytest.skip(f"Módulo driver_resolver não encontrado: {e}", allow_module_level=True)
+
+
+def executable(path: Path) -> str:
+    """Criar binário falso executável."""
+    path.write_text("#!/bin/sh\n", encoding="utf-8")
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def binaries(tmp_path):
+    """Driver e navegador falsos."""
+    return {
+        "driver_path": executable(tmp_path / "chromedriver"),
+        "browser_path": executable(tmp_path / "chrome"),
+    }
+
+
+@pytest.fixture
+def finder(monkeypatch, binaries):
+    """Selenium Manager falso que conta as resoluções."""
+    finder = MagicMock()
+    finder.return_value.get_driver_path.return_value = binaries["driver_path"]
+    finder.return_value.get_browser_path.return_value = binaries["browser_path"]
+    monkeypatch.setattr(driver_resolver, "DriverFinder", finder)
+    return finder
+
+
+def test_cold_then_warm_without_selenium_manager(tmp_path, finder, binaries):
+    """Primeira resolução fixa os caminhos; a seguinte (nova execução) não chama o SM."""
+    cache = tmp_path / "driver_cache.json"
+    service, options = Service(), ChromeOptions()
+
+    assert DriverResolver(cache).resolve(service, options) == "cold"
+    DriverResolver(cache).record_setup(options, MagicMock(capabilities={}), 2.0, "cold")
+
+    service, options = Service(), ChromeOptions()
+    assert DriverResolver(cache).resolve(service, options) == "warm"
+    assert finder.call_count == 1
+    assert service.path == binaries["driver_path"]
+    assert options.binary_location == binaries["browser_path"]
+
+
+def test_changed_binary_resolved_again(finder, binaries):
+    """Binário atualizado (tamanho/mtime diferentes) invalida o cache."""
+    resolver = DriverResolver(path=None)
+    resolver.resolve(Service(), ChromeOptions())
+
+    with open(binaries["driver_path"], "a", encoding="utf-8") as f:
+        f.write("# nova versão\n")
+
+    assert resolver.resolve(Service(), ChromeOptions()) == "cold"
+    assert finder.call_count == 2
+
+
+def test_explicit_service_path_untouched(finder, binaries):
+    """Caminho definido pelo chamador não passa pelo cache."""
+    service = Service(executable_path=binaries["driver_path"])
+
+    assert DriverResolver(path=None).resolve(service, ChromeOptions()) == "explicit"
+    finder.assert_not_called()
+
+
+def test_offline_fallback_to_path(monkeypatch, tmp_path, finder, binaries):
+    """Selenium Manager indisponível: usa o chromedriver do PATH."""
+    finder.return_value.get_driver_path.side_effect = NoSuchDriverException("offline")
+    monkeypatch.setenv("PATH", str(tmp_path) + os.pathsep + os.environ.get("PATH", ""))
+    service = Service()
+
+    assert DriverResolver(path=None).resolve(service, ChromeOptions()) == "cold"
+    assert service.path == binaries["driver_path"]
+
+
+def test_legacy_driver_finder_api(monkeypatch, binaries):
+    """Selenium < 4.20: ``DriverFinder.get_path`` estático, sem caminho do navegador."""
+
+    class LegacyDriverFinder:
+        calls = 0
+
+        @staticmethod
+        def get_path(service, options):
+            LegacyDriverFinder.calls += 1
+            return binaries["driver_path"]
+
+    monkeypatch.setattr(driver_resolver, "DriverFinder", LegacyDriverFinder)
+    resolver = DriverResolver(path=None)
+    service, options = Service(), ChromeOptions()
+
+    assert resolver.resolve(service, options) == "cold"
+    assert service.path == binaries["driver_path"]
+    assert not options.binary_location
+    assert resolver.resolve(Service(), ChromeOptions()) == "warm"
+    assert LegacyDriverFinder.calls == 1
+
+
+def test_setup_times_and_versions(finder):
+    """Tempos frio/quente e versões aparecem nas estatísticas."""
+    resolver = DriverResolver(path=None)
+    options = ChromeOptions()
+    driver = MagicMock(
+        capabilities={
+            "browserVersion": "120.0.6099.109",
+            "chrome": {"chromedriverVersion": "120.0.6099.109 (abc)"},
+        }
+    )
+
+    resolver.resolve(Service(), options)
+    resolver.record_setup(options, driver, 3.2, "cold")
+    resolver.record_setup(options, driver, 0.8, "warm")
+
+    stats = resolver.stats()["chrome@stable"]
+    assert stats["cold_setup_seconds"] == 3.2
+    assert stats["warm_setup_seconds"] == 0.8
+    assert stats["driver_version"] == "120.0.6099.109"
+    assert stats["last_resolution"] == "warm"
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Testes para o supervisor de sessões (drivers falsos, sem navegador real).
+"""
+
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    import driver_supervisor
+    from driver_supervisor import DriverSupervisor, SessionLost, SupervisorConfig
+except ImportError as e:
+    pytest.skip(f"Módulo driver_supervisor não encontrado: {e}", allow_module_level=True)
+
+
+class FakeDriver:
+    """Sessão que pode morrer ou travar."""
+
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+        self.hang = 0.0
+        self.killed = threading.Event()
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if self.hang:
+            self.killed.wait(self.hang)
+        if not self.alive or self.killed.is_set():
+            raise ConnectionError("chromedriver não responde")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Harness:
+    """Automação mínima: etapas usam o driver corrente."""
+
+    def __init__(self, config=None):
+        self.created = []
+        self.driver = FakeDriver("d0")
+        self.supervisor = DriverSupervisor(
+            self.driver,
+            factory=self.create,
+            on_replace=self.attach,
+            config=config or SupervisorConfig(heartbeat_timeout=0.2, step_timeout=None),
+        )
+
+    def create(self):
+        driver = FakeDriver(f"d{len(self.created) + 1}")
+        self.created.append(driver)
+        return driver
+
+    def attach(self, driver):
+        self.driver = driver
+
+
+@pytest.fixture(autouse=True)
+def fake_kill(monkeypatch):
+    """Matar a árvore de processos = sinalizar o driver falso."""
+    monkeypatch.setattr(
+        driver_supervisor, "kill_process_tree", lambda driver: driver.killed.set() or 1
+    )
+
+
+def test_healthy_step_runs_once():
+    """Sessão viva: etapa executada uma vez, sem reinícios."""
+    harness = Harness()
+
+    result = harness.supervisor.run("etapa", lambda: {"success": True, "driver": "ok"})
+
+    assert result["driver"] == "ok"
+    assert harness.created == []
+    assert harness.supervisor.metrics()["restarts"] == 0
+
+
+def test_crash_replaces_session_and_retries_idempotent_step():
+    """Queda no meio da etapa: nova sessão e nova tentativa com ela."""
+    harness = Harness()
+    dead = harness.driver
+
+    def step():
+        if harness.driver is dead:
+            dead.alive = False  # navegador morre durante a etapa
+            return {"success": False, "error": "invalid session id"}
+        return {"success": True, "driver": harness.driver.name}
+
+    result = harness.supervisor.run("pesquisa", step)
+
+    assert result == {"success": True, "driver": "d1"}
+    assert dead.killed.is_set() and dead.quit_called
+    metrics = harness.supervisor.metrics()
+    assert metrics["restarts"] == 1 and metrics["retries"] == 1
+
+
+def test_non_idempotent_step_not_repeated():
+    """Etapa com efeito colateral não é repetida; sessão substituta fica para as próximas."""
+    harness = Harness()
+    calls = []
+
+    def submit():
+        calls.append(harness.driver.name)
+        harness.driver.alive = False
+        return {"success": False, "error": "chrome not reachable"}
+
+    result = harness.supervisor.run("formulario", submit, idempotent=False)
+
+    assert calls == ["d0"]
+    assert result["session_lost"] is True
+    assert harness.driver.name == "d1"
+
+
+def test_step_failure_with_live_session_is_kept():
+    """Falha da própria etapa (sessão viva) não provoca reinício nem repetição."""
+    harness = Harness()
+
+    def broken():
+        raise ValueError("seletor inválido")
+
+    with pytest.raises(ValueError):
+        harness.supervisor.run("etapa", broken)
+    assert harness.supervisor.run("etapa", lambda: {"success": False})["success"] is False
+    assert harness.created == []
+
+
+def test_watchdog_caps_hung_step():
+    """Etapa travada é interrompida no prazo, a sessão substituída e a etapa repetida."""
+    harness = Harness(SupervisorConfig(heartbeat_timeout=0.2, step_timeout=0.3))
+    hung = harness.driver
+
+    def step():
+        if harness.driver is hung:
+            hung.hang = 30  # comando bloqueado até o processo ser morto
+            harness.driver.execute_script("return document.title;")
+        return {"success": True, "driver": harness.driver.name}
+
+    start = time.perf_counter()
+    result = harness.supervisor.run("pesquisa", step)
+
+    assert result["driver"] == "d1"
+    assert time.perf_counter() - start < 2
+    assert harness.supervisor.metrics()["hangs"] == 1
+
+
+def test_heartbeat_times_out_on_hung_session():
+    """Heartbeat não espera o timeout HTTP de uma sessão travada."""
+    harness = Harness()
+    harness.driver.hang = 5
+
+    start = time.perf_counter()
+    assert not harness.supervisor.heartbeat()
+    assert time.perf_counter() - start < 1
+
+
+def test_restart_limit():
+    """Sessões que morrem sempre esgotam o limite de reinícios."""
+    harness = Harness(
+        SupervisorConfig(heartbeat_timeout=0.2, step_timeout=None, max_restarts=1)
+    )
+
+    def crash():
+        harness.driver.alive = False
+        raise ConnectionError("chrome not reachable")
+
+    with pytest.raises(SessionLost):
+        harness.supervisor.run("etapa", crash)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Testes para o envio em massa de formulários (drivers falsos, sem navegador real).
+"""
+
+import csv
+import threading
+import pytest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+from tests.conftest import FakeAutomation
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from form_batch import FormBatchRunner, FormRowMapper, RowValidationError, read_rows
+except ImportError as e:
+    pytest.skip(f"Módulo form_batch não encontrado: {e}", allow_module_level=True)
+
+
+class FormAutomation(FakeAutomation):
+    """Formulário falso: registra envios; falha para clientes chamados 'erro'."""
+
+    submitted = []
+    lock = threading.Lock()
+
+    def automate_form_filling(self, form_data):
+        with FormAutomation.lock:
+            FormAutomation.submitted.append(form_data["customer_name"])
+        if form_data["customer_name"] == "erro":
+            return {"error": "formulário não respondeu", "success": False}
+        return {"form_data": form_data, "success": True}
+
+
+@pytest.fixture
+def runner(fake_pool):
+    """Runner com pool de drivers falsos."""
+    FormAutomation.reset()
+    FormAutomation.submitted = []
+    with patch("parallel_runner.WebAutomation", FormAutomation):
+        yield FormBatchRunner(workers=3, pool=fake_pool, checkpoint_every=5)
+
+
+def rows(count):
+    return [{"customer_name": f"cliente {i}", "email": f"c{i}@ex.com"} for i in range(count)]
+
+
+def read_outcomes(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class TestFormRowMapper:
+    """Mapeamento e validação das colunas."""
+
+    def test_maps_and_normalizes(self):
+        """Colunas renomeadas, tamanho normalizado e coberturas em lista."""
+        mapper = FormRowMapper(
+            columns={"Nome": "customer_name", "Tamanho": "pizza_size", "Extras": "toppings"}
+        )
+
+        form_data = mapper.map(
+            {"Nome": " Ana ", "Tamanho": "LARGE", "Extras": "bacon; Cheese"}
+        )
+
+        assert form_data == {
+            "customer_name": "Ana",
+            "pizza_size": "large",
+            "toppings": ["bacon", "cheese"],
+        }
+
+    @pytest.mark.parametrize(
+        "row",
+        [
+            {"customer_name": float("nan")},
+            {"customer_name": "Ana", "email": "sem-arroba"},
+            {"customer_name": "Ana", "pizza_size": "x'], *"},
+            {"customer_name": "Ana", "toppings": "bacon;abacaxi"},
+        ],
+    )
+    def test_invalid_rows(self, row):
+        """Obrigatório ausente (NaN) e valores fora do formulário são rejeitados."""
+        with pytest.raises(RowValidationError):
+            FormRowMapper().map(row)
+
+
+def test_rows_streamed_in_order(runner, tmp_path):
+    """Resultados por linha gravados na ordem da planilha; inválidas sem envio."""
+    source = rows(12)
+    source[3]["email"] = "inválido"
+    source[7]["customer_name"] = "erro"
+    output = tmp_path / "resultado.csv"
+
+    report = runner.run(source, output)
+
+    outcomes = read_outcomes(output)
+    assert [int(o["row"]) for o in outcomes] == list(range(12))
+    assert outcomes[3]["status"] == "invalid" and "E-mail" in outcomes[3]["error"]
+    assert outcomes[7]["status"] == "failed"
+    assert len(FormAutomation.submitted) == 11
+    assert (report["ok"], report["failed"], report["invalid"]) == (10, 1, 1)
+    assert report["rows_per_sec"] > 0
+
+
+def test_interrupted_run_resumes_after_checkpoint(runner, tmp_path):
+    """Execução interrompida retoma sem reenviar nem duplicar linhas gravadas."""
+    source = rows(30)
+    output = tmp_path / "resultado.csv"
+
+    def interrupted():
+        for i, row in enumerate(source):
+            if i == 17:
+                raise KeyboardInterrupt
+            yield row
+
+    with pytest.raises(KeyboardInterrupt):
+        runner.run(interrupted(), output)
+    first = list(FormAutomation.submitted)
+
+    # Linha gravada após o último checkpoint (queda antes do commit) é descartada
+    with open(output, "a", encoding="utf-8") as f:
+        f.write("999,ok,,0.1,órfã\n")
+
+    FormAutomation.submitted = []
+    report = runner.run(source, output)
+
+    # Envios já iniciados concluem e são gravados; os ainda na fila são cancelados
+    resumed = report["resumed_from"]
+    assert 0 < resumed == len(first) <= 17
+    assert FormAutomation.submitted == [f"cliente {i}" for i in range(resumed, 30)]
+    assert [int(o["row"]) for o in read_outcomes(output)] == list(range(30))
+    assert report["ok"] == 30
+
+
+def test_resume_disabled_starts_over(runner, tmp_path):
+    """``resume=False`` reprocessa a planilha desde o início."""
+    output = tmp_path / "resultado.csv"
+    runner.run(rows(4), output)
+
+    report = runner.run(rows(4), output, resume=False)
+
+    assert report["resumed_from"] == 0
+    assert len(read_outcomes(output)) == 4
+
+
+def test_cleanup_error_keeps_row_sent(runner, tmp_path):
+    """Erro ao encerrar a automação não marca como falha uma linha já enviada."""
+    FormAutomation.cleanup_error = OSError("disco cheio")
+    output = tmp_path / "resultado.csv"
+
+    with patch.object(runner.selector_cache, "save") as save:
+        report = runner.run(rows(6), output)
+
+    assert report["ok"] == 6
+    assert {o["status"] for o in read_outcomes(output)} == {"ok"}
+    # Driver já devolvido ao pool; caches salvos uma vez pelo runner
+    assert all(a.cleanups == [(None, False)] for a in FormAutomation.instances)
+    save.assert_called_once_with()
+
+
+def test_csv_read_in_chunks(tmp_path):
+    """CSV lido em blocos pelo pandas, a partir da linha de retomada."""
+    pytest.importorskip("pandas")
+    path = tmp_path / "clientes.csv"
+    path.write_text(
+        "customer_name,email\n" + "".join(f"c{i},c{i}@ex.com\n" for i in range(7)),
+        encoding="utf-8",
+    )
+
+    records = list(read_rows(path, chunksize=3, skip=4))
+
+    assert [index for index, _ in records] == [4, 5, 6]
+    assert records[0][1] == {"customer_name": "c4", "email": "c4@ex.com"}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Testes para o preenchimento de formulários em lote (sem navegador real).
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from form_fill import fill_form
+except ImportError as e:
+    pytest.skip(f"Módulo form_fill não encontrado: {e}", allow_module_level=True)
+
+
+def browser_reply(*items):
+    """Resposta do script de preenchimento: (seletor, encontrado, ok)."""
+    return json.dumps(
+        [{"selector": s, "found": found, "ok": ok, "actual": None} for s, found, ok in items]
+    )
+
+
+@pytest.fixture
+def driver():
+    """Driver falso."""
+    return MagicMock()
+
+
+def test_script_mode_single_round_trip(driver):
+    """Todos os campos aplicados e verificados em uma única chamada."""
+    driver.execute_script.return_value = browser_reply(
+        ("#nome", True, True), ("#aceito", True, True), ("#idade", False, False)
+    )
+
+    report = fill_form(driver, {"#nome": "João", "#aceito": True, "#idade": 25})
+
+    assert driver.execute_script.call_count == 1
+    driver.find_element.assert_not_called()
+    spec = driver.execute_script.call_args.args[1]
+    assert spec[0] == {"selector": "#nome", "value": "João", "checked": None, "apply": True}
+    assert spec[1]["checked"] is True and spec[1]["value"] is None
+    assert spec[2]["value"] == "25"
+    assert report == {"filled": ["#nome", "#aceito"], "missing": ["#idade"], "mismatched": []}
+
+
+def test_keys_fields_typed_then_verified(driver):
+    """Campos por tecla usam send_keys e são só verificados pelo script."""
+    element = driver.find_element.return_value
+    driver.execute_script.return_value = browser_reply(
+        ("#senha", True, False), ("#nome", True, True)
+    )
+
+    report = fill_form(driver, {"#senha": "x", "#nome": "João"}, keys_fields=["#senha"])
+
+    element.send_keys.assert_called_once_with("x")
+    spec = driver.execute_script.call_args.args[1]
+    assert [item["apply"] for item in spec] == [False, True]
+    assert report["mismatched"] == ["#senha"]
+
+
+def test_keys_mode_types_every_field(driver):
+    """Modo keys mantém o caminho por campo."""
+    driver.execute_script.return_value = browser_reply(("#a", True, True), ("#b", True, True))
+
+    fill_form(driver, {"#a": "1", "#b": "2"}, mode="keys")
+
+    assert driver.find_element.call_count == 2
+    assert not any(item["apply"] for item in driver.execute_script.call_args.args[1])
+
+
+def test_invalid_mode(driver):
+    """Modo desconhecido é rejeitado."""
+    with pytest.raises(ValueError):
+        fill_form(driver, {"#a": "1"}, mode="turbo")
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Testes para o envio de formulários via HTTP (servidor local, sem navegador).
+"""
+
+import pytest
+import requests
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from http_forms import BrowserRequired, HybridFormExecutor, SubmissionSent, parse_forms
+    from stand_in_server import StandInServer
+except ImportError as e:
+    pytest.skip(f"Módulo http_forms não encontrado: {e}", allow_module_level=True)
+
+
+STATIC_FORM = """
+<form method="post" action="/post">
+  <input name="custname" value="padrão">
+  <input type="radio" name="size" value="small" checked>
+  <input type="radio" name="size" value="large">
+  <input type="checkbox" name="topping" value="bacon">
+  <input type="checkbox" name="topping" value="cheese">
+  <select name="delivery">
+    <option>now</option><option value="later" selected>Later</option>
+  </select>
+  <textarea name="comments">sem</textarea>
+  <button>Submit order</button>
+</form>
+"""
+
+JS_FORM = """
+<form id="testForm"><input name="nome"><button type="submit">Enviar</button></form>
+<script>
+  document.getElementById('testForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+  });
+</script>
+"""
+
+
+@pytest.fixture
+def base_url():
+    """Servidor local com as páginas de teste."""
+    with StandInServer() as server:
+        server.add_page("/static", STATIC_FORM)
+        server.add_page("/js", JS_FORM)
+        yield server.base_url
+
+
+@pytest.fixture
+def executor():
+    """Executor HTTP encerrado ao final."""
+    executor = HybridFormExecutor(workers=4)
+    yield executor
+    executor.close()
+
+
+class TestParseForms:
+    """Testes da detecção de formulários estáticos."""
+
+    def test_static_form_fields_and_defaults(self):
+        """Ação resolvida, campos e valores padrão como o navegador enviaria."""
+        (form,) = parse_forms(STATIC_FORM, "http://exemplo/forms/post")
+
+        assert form.is_static
+        assert form.action == "http://exemplo/post"
+        assert form.method == "post"
+        assert form.fields["topping"] == ["bacon", "cheese"]
+        assert form.defaults == [
+            ("custname", "padrão"),
+            ("size", "small"),
+            ("delivery", "later"),
+            ("comments", "sem"),
+        ]
+
+    def test_js_submit_handler_detected(self):
+        """Script inline interceptando o envio exige navegador."""
+        (form,) = parse_forms(JS_FORM, "http://exemplo/")
+
+        assert not form.is_static
+        assert "preventDefault" in form.js_reasons[0]
+
+    def test_script_scoped_to_its_form(self):
+        """Script que intercepta outro formulário (ou só usa fetch) não afeta este."""
+        html = (
+            "<form id='busca'><input name='q'></form>"
+            + STATIC_FORM
+            + "<script>document.getElementById('busca')"
+            ".addEventListener('submit', e => e.preventDefault());"
+            "fetch('/analytics');</script>"
+        )
+
+        search, order = parse_forms(html, "http://exemplo/")
+
+        assert not search.is_static
+        assert order.is_static
+
+    def test_disabled_controls_not_in_defaults(self):
+        """Campos e opções desabilitados não são enviados pelo navegador."""
+        html = """
+        <form method="post" action="/post">
+          <input name="custname" value="Ana">
+          <input name="promo" value="X" disabled>
+          <textarea name="comments" disabled>sem</textarea>
+          <select name="delivery">
+            <option value="now" selected disabled>Now</option><option>later</option>
+          </select>
+        </form>
+        """
+
+        (form,) = parse_forms(html, "http://exemplo/")
+
+        assert form.defaults == [("custname", "Ana"), ("delivery", "later")]
+        assert "promo" not in form.fields
+
+    def test_onsubmit_detected(self):
+        """Handler onsubmit exige navegador."""
+        (form,) = parse_forms("<form onsubmit='go()'><input name='a'></form>", "http://x/")
+
+        assert form.js_reasons == ["onsubmit"]
+
+
+class TestHybridFormExecutor:
+    """Testes do envio HTTP com fallback."""
+
+    def test_submit_overrides_defaults(self, base_url, executor):
+        """Valores informados substituem os padrões; checkboxes aceitam listas."""
+        result = executor.submit(
+            f"{base_url}/static", {"custname": "Ana", "topping": ["bacon", "cheese"]}
+        )
+
+        assert result["transport"] == "http"
+        assert result["success"]
+        form = result["response"]["form"]
+        assert form["custname"] == "Ana"
+        assert form["topping"] == ["bacon", "cheese"]
+        assert form["size"] == "small"
+
+    def test_submit_many_keeps_order_and_discovers_once(self, base_url, executor):
+        """Envios paralelos mantêm a ordem e a página é analisada uma vez."""
+        results = executor.submit_many(
+            f"{base_url}/static", [{"custname": f"c{i}"} for i in range(12)]
+        )
+
+        assert [r["response"]["form"]["custname"] for r in results] == [
+            f"c{i}" for i in range(12)
+        ]
+        metrics = executor.metrics()
+        assert metrics["discovered"] == 1
+        assert metrics["http"] == 12
+
+    def test_js_form_uses_fallback(self, base_url):
+        """Formulário com JavaScript vai para o fallback (Selenium)."""
+        fallback = MagicMock(return_value={"success": True})
+        executor = HybridFormExecutor(fallback=fallback)
+
+        result = executor.submit(f"{base_url}/js", {"nome": "Ana"})
+
+        fallback.assert_called_once_with({"nome": "Ana"})
+        assert result["transport"] == "selenium"
+        executor.close()
+
+    def test_unknown_field_requires_browser(self, base_url, executor):
+        """Campo inexistente no HTML não é enviado às cegas."""
+        with pytest.raises(BrowserRequired):
+            executor.submit(f"{base_url}/static", {"inexistente": "x"})
+
+    def test_failure_after_send_not_retried(self, base_url, executor, monkeypatch):
+        """POST interrompido após a transmissão: sem fallback (evita envio duplicado)."""
+        fallback = MagicMock()
+        executor.fallback = fallback
+        executor.discover(f"{base_url}/static")
+
+        def timeout(*args, **kwargs):
+            raise requests.ReadTimeout("sem resposta")
+
+        monkeypatch.setattr(requests.Session, "post", timeout)
+
+        with pytest.raises(SubmissionSent):
+            executor.submit(f"{base_url}/static", {"custname": "Ana"})
+        fallback.assert_not_called()
+
+    def test_failure_before_send_propagates(self, base_url, executor, monkeypatch):
+        """Conexão não estabelecida: erro original (o chamador pode usar o navegador)."""
+        executor.discover(f"{base_url}/static")
+
+        def refused(*args, **kwargs):
+            raise requests.ConnectTimeout("sem conexão")
+
+        monkeypatch.setattr(requests.Session, "post", refused)
+
+        with pytest.raises(requests.ConnectTimeout):
+            executor.submit(f"{base_url}/static", {"custname": "Ana"})
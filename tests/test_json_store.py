@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Testes para a base de armazenamentos JSON.
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from json_store import JsonStore
+    from query_cache import QueryCache
+    from selector_cache import SelectorCache
+except ImportError as e:
+    pytest.skip(f"Módulo json_store não encontrado: {e}", allow_module_level=True)
+
+
+class Counter(JsonStore):
+    """Armazenamento mínimo: um contador."""
+
+    LABEL = "Contador"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.value = self._read("value", 0)
+
+    def increment(self):
+        with self._lock:
+            self.value += 1
+            self._dirty = True
+
+    def _payload(self):
+        return {"value": self.value}
+
+
+def test_shared_instance_per_class_and_path(tmp_path):
+    """Uma instância por (classe, arquivo); classes distintas não se misturam."""
+    path = tmp_path / "cache.json"
+
+    assert Counter.shared(path) is Counter.shared(str(path))
+    assert Counter.shared(path) is not Counter.shared(tmp_path / "outro.json")
+    assert SelectorCache.shared(path) is not Counter.shared(path)
+    assert QueryCache.shared().path is None  # padrão do cache de consultas: memória
+
+
+def test_save_only_when_dirty_and_no_leftovers(tmp_path):
+    """Grava apenas com alterações pendentes; nenhum temporário sobra no diretório."""
+    path = tmp_path / "contador.json"
+    counter = Counter(path)
+    counter.save()
+    assert not path.exists()
+
+    counter.increment()
+    counter.save()
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"value": 1}
+    assert Counter(path).value == 1
+    assert os.listdir(tmp_path) == ["contador.json"]
+
+
+def test_failed_write_removes_temporary(tmp_path, monkeypatch):
+    """Falha ao substituir o arquivo: temporário removido, alteração mantida pendente."""
+    counter = Counter(tmp_path / "contador.json")
+    counter.increment()
+
+    def disk_full(source, target):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(os, "replace", disk_full)
+    with pytest.raises(OSError):
+        counter.save()
+
+    assert os.listdir(tmp_path) == []
+    assert counter._dirty
+
+
+def test_corrupted_file_ignored(tmp_path):
+    """JSON inválido ou com outra estrutura: começa vazio."""
+    path = tmp_path / "contador.json"
+    path.write_text("[1, 2]", encoding="utf-8")
+
+    assert Counter(path).value == 0
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Testes para o monitor de rede (log de performance simulado, sem navegador real).
+"""
+
+import json
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+    from network_monitor import NetworkMonitor
+except ImportError as e:
+    pytest.skip(f"Módulo network_monitor não encontrado: {e}", allow_module_level=True)
+
+
+class FakeDriver:
+    """Driver cujo log de performance é alimentado pelo teste."""
+
+    def __init__(self):
+        self.entries = []
+        self.lock = threading.Lock()
+
+    def emit(self, method, **params):
+        message = json.dumps({"message": {"method": method, "params": params}})
+        with self.lock:
+            self.entries.append({"message": message, "level": "INFO"})
+
+    def get_log(self, kind):
+        assert kind == "performance"
+        with self.lock:
+            entries, self.entries = self.entries, []
+        return entries
+
+
+def emit_later(driver, delay, method, **params):
+    """Emitir evento após ``delay`` segundos (requisição terminando durante a espera)."""
+    timer = threading.Timer(delay, driver.emit, (method,), params)
+    timer.start()
+    return timer
+
+
+def test_counts_requests_bytes_and_failures_per_page():
+    """Requisições, bytes e falhas contados na página em que ocorreram."""
+    driver = FakeDriver()
+    monitor = NetworkMonitor(driver)
+
+    monitor.begin_page("home")
+    driver.emit("Network.requestWillBeSent", requestId="1")
+    driver.emit("Network.requestWillBeSent", requestId="2")
+    driver.emit("Network.loadingFinished", requestId="1", encodedDataLength=1500)
+    driver.emit("Network.loadingFailed", requestId="2", canceled=False)
+
+    monitor.begin_page("results")
+    driver.emit("Network.requestWillBeSent", requestId="3")
+    driver.emit("Network.loadingFailed", requestId="3", canceled=True)
+    driver.emit("Network.requestWillBeSent", requestId="4")
+    monitor.poll()
+
+    assert monitor.inflight == 1
+    assert monitor.pop_pages() == [
+        {"page": "home", "requests": 2, "bytes": 1500, "failed": 1},
+        {"page": "results", "requests": 2, "bytes": 0, "failed": 0},
+    ]
+    assert monitor.pages == []
+
+
+def test_idle_waits_for_traffic_to_settle():
+    """Rede ociosa só depois da última requisição terminar e do silêncio exigido."""
+    driver = FakeDriver()
+    monitor = NetworkMonitor(driver, poll_frequency=0.01)
+    monitor.begin_page("page")
+    driver.emit("Network.requestWillBeSent", requestId="1")
+    emit_later(driver, 0.2, "Network.loadingFinished", requestId="1", encodedDataLength=10)
+
+    start = time.perf_counter()
+    assert monitor.wait_for_network_idle(idle_ms=100, timeout=2)
+    elapsed = time.perf_counter() - start
+
+    assert 0.3 <= elapsed < 1.0
+
+
+def test_max_inflight_tolerates_long_polling():
+    """Conexão longa aberta não impede a página de ficar pronta com ``max_inflight``."""
+    driver = FakeDriver()
+    monitor = NetworkMonitor(driver, poll_frequency=0.01)
+    monitor.begin_page("page")
+    driver.emit("Network.requestWillBeSent", requestId="long-poll")
+
+    assert not monitor.wait_for_network_idle(idle_ms=50, timeout=0.3)
+    assert monitor.wait_for_network_idle(idle_ms=50, max_inflight=1, timeout=0.3)
+
+
+def test_unavailable_without_performance_log():
+    """Sem log de performance (ex.: Firefox) o monitor se desativa."""
+
+    class NoLogDriver:
+        def get_log(self, kind):
+            raise WebDriverException("log type 'performance' not found")
+
+    monitor = NetworkMonitor(NoLogDriver())
+    monitor.begin_page("page")
+
+    assert not monitor.available
+    assert not monitor.wait_for_network_idle(timeout=0.1)
+    assert monitor.pop_pages() == []
+
+
+def test_enable_requests_network_events_only():
+    """Capacidade de log habilitada apenas com eventos de rede."""
+    options = ChromeOptions()
+    NetworkMonitor.enable(options)
+
+    assert options.to_capabilities()["goog:loggingPrefs"] == {"performance": "ALL"}
+    assert options.experimental_options["perfLoggingPrefs"]["enablePage"] is False
+
+
+def test_document_status_tracked_per_page():
+    """Status do documento principal disponível para o limitador (ex.: 429)."""
+    driver = FakeDriver()
+    monitor = NetworkMonitor(driver)
+
+    monitor.begin_page("results")
+    driver.emit("Network.requestWillBeSent", requestId="L1", type="Document", frameId="top")
+    driver.emit(
+        "Network.responseReceived", type="Script", frameId="top", response={"status": 200}
+    )
+    driver.emit(
+        "Network.responseReceived", type="Document", frameId="top", response={"status": 429}
+    )
+    monitor.poll()
+    assert monitor.document_status == 429
+
+    monitor.begin_page("next")
+    assert monitor.document_status is None
+
+
+def test_iframe_document_ignored():
+    """Status de iframes (anúncios, widgets) não substitui o do documento principal."""
+    driver = FakeDriver()
+    monitor = NetworkMonitor(driver)
+
+    monitor.begin_page("results")
+    driver.emit("Network.requestWillBeSent", requestId="L1", type="Document", frameId="top")
+    driver.emit(
+        "Network.responseReceived", type="Document", frameId="top", response={"status": 200}
+    )
+    driver.emit("Network.requestWillBeSent", requestId="L2", type="Document", frameId="ad")
+    driver.emit(
+        "Network.responseReceived", type="Document", frameId="ad", response={"status": 503}
+    )
+    monitor.poll()
+
+    assert monitor.document_status == 200
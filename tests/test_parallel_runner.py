@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Testes para a execução paralela da suite Selenium (sem navegador real).
+"""
+
+import pytest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+from tests.conftest import FakeAutomation
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from parallel_runner import ParallelSuiteRunner, SuiteJob
+except ImportError as e:
+    pytest.skip(f"Módulo parallel_runner não encontrado: {e}", allow_module_level=True)
+
+
+class SearchAutomation(FakeAutomation):
+    """Pesquisa falsa: falha para consultas contendo 'erro'."""
+
+    def search_google(self, query):
+        if "erro" in query:
+            raise RuntimeError("bloqueado")
+        return {"query": query, "success": True}
+
+
+@pytest.fixture
+def runner(fake_pool):
+    """Runner com pool de drivers falsos."""
+    SearchAutomation.reset()
+    with patch("parallel_runner.WebAutomation", SearchAutomation):
+        yield ParallelSuiteRunner(workers=3, pool=fake_pool)
+
+
+def test_results_keep_input_order(runner):
+    """Resultados seguem a ordem das entradas."""
+    queries = [f"consulta {i}" for i in range(10)]
+
+    report = runner.run([SuiteJob("search_google", (q,)) for q in queries])
+
+    assert [r["query"] for r in report["results"]] == queries
+    assert [r["job_index"] for r in report["results"]] == list(range(10))
+    assert report["throughput"] > 0
+
+
+def test_failure_isolation(runner):
+    """Falha em um job não interrompe os demais."""
+    jobs = [SuiteJob("search_google", (q,)) for q in ["ok 1", "erro", "ok 2"]]
+
+    report = runner.run(jobs)
+
+    assert [r["success"] for r in report["results"]] == [True, False, True]
+    assert "bloqueado" in report["results"][1]["error"]
+    assert report["successful_jobs"] == 2
+    assert report["driver_pool"]["in_use"] == 0
+
+
+def test_job_automation_cleaned_up_without_driver(runner):
+    """Cada automação é encerrada (caches, screenshots) sem fechar o driver do pool."""
+    jobs = [SuiteJob("search_google", (q,)) for q in ["ok 1", "erro", "ok 2"]]
+
+    runner.run(jobs)
+
+    assert [a.cleanups for a in SearchAutomation.instances] == [[(None, False)]] * 3
+    assert runner.pool.metrics()["idle"] == 3
+
+
+def test_cleanup_error_does_not_fail_job(runner):
+    """Erro ao encerrar a automação não transforma um job concluído em falha."""
+    SearchAutomation.cleanup_error = OSError("disco cheio")
+
+    report = runner.run([SuiteJob("search_google", ("ok",))])
+
+    assert report["results"][0]["success"] is True
+    assert runner.pool.metrics()["idle"] == 3
+
+
+def test_selector_cache_saved_once_per_run(runner):
+    """Placar de seletores salvo uma vez ao final do lote, não a cada job."""
+    jobs = [SuiteJob("search_google", (f"ok {i}",)) for i in range(5)]
+
+    with patch.object(runner.selector_cache, "save") as save:
+        runner.run(jobs)
+
+    save.assert_called_once_with()
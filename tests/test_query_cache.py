@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Testes para o cache de resultados de pesquisa.
+"""
+
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from query_cache import QueryCache, run_deferred
+except ImportError as e:
+    pytest.skip(f"Módulo query_cache não encontrado: {e}", allow_module_level=True)
+
+
+class Fetcher:
+    """Busca falsa que conta as chamadas."""
+
+    def __init__(self, success=True):
+        self.calls = 0
+        self.success = success
+
+    def __call__(self):
+        self.calls += 1
+        return {"results": [f"r{self.calls}"], "success": self.success}
+
+
+def test_normalized_query_hits():
+    """Caixa e espaços não geram nova busca; fonte e escopo separam entradas."""
+    cache = QueryCache()
+    fetch = Fetcher()
+
+    first = cache.get_or_fetch("google", "Python  Selenium", fetch)
+    second = cache.get_or_fetch("google", " python selenium ", fetch)
+    cache.get_or_fetch("python_docs", "python selenium", fetch)
+    cache.get_or_fetch("google", "python selenium", fetch, scope="127.0.0.1:8000")
+
+    assert (first["cache"], second["cache"]) == ("miss", "hit")
+    assert second["results"] == first["results"]
+    assert fetch.calls == 3
+    assert cache.stats()["hit_rate"] == 0.25
+
+
+def test_failures_not_cached():
+    """Resultado sem sucesso é devolvido, mas buscado de novo na próxima vez."""
+    cache = QueryCache()
+    fetch = Fetcher(success=False)
+
+    cache.get_or_fetch("google", "x", fetch)
+    cache.get_or_fetch("google", "x", fetch)
+
+    assert fetch.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_stale_while_revalidate(monkeypatch):
+    """Vencido é servido na hora; a atualização roda quando a fila é executada."""
+    cache = QueryCache(ttls={"google": 10}, stale_ttl=100)
+    fetch = Fetcher()
+    deferred = []
+    now = time.time()
+
+    cache.get_or_fetch("google", "x", fetch, deferred=deferred)
+    monkeypatch.setattr(time, "time", lambda: now + 50)
+
+    stale = cache.get_or_fetch("google", "x", fetch, deferred=deferred)
+    cache.get_or_fetch("google", "x", fetch, deferred=deferred)
+
+    assert stale["cache"] == "stale" and stale["results"] == ["r1"]
+    assert fetch.calls == 1
+    assert len(deferred) == 1  # revalidação agendada uma única vez
+
+    assert run_deferred(deferred) == 1
+    fresh = cache.get_or_fetch("google", "x", fetch, deferred=deferred)
+    assert fresh["cache"] == "hit" and fresh["results"] == ["r2"]
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_hits_marked_without_original_timings():
+    """Acerto do cache não repete tempo, horário nem tráfego da busca original."""
+    cache = QueryCache()
+
+    def fetch():
+        return {"results": ["r1"], "execution_time": 2.5, "timestamp": "t", "success": True}
+
+    miss = cache.get_or_fetch("google", "x", fetch)
+    hit = cache.get_or_fetch("google", "x", fetch)
+
+    assert miss["cached"] is False and miss["execution_time"] == 2.5
+    assert hit["cached"] is True and hit["results"] == ["r1"]
+    assert "execution_time" not in hit and "timestamp" not in hit
+
+
+def test_cancelled_revalidation_can_be_scheduled_again(monkeypatch):
+    """Revalidação descartada (sem navegador) libera a consulta para nova tentativa."""
+    cache = QueryCache(ttls={"google": 10}, stale_ttl=100)
+    fetch = Fetcher()
+    deferred = []
+    now = time.time()
+    cache.get_or_fetch("google", "x", fetch)
+    monkeypatch.setattr(time, "time", lambda: now + 50)
+
+    cache.get_or_fetch("google", "x", fetch, deferred=deferred)
+    assert cache.cancel_deferred(deferred) == 1 and deferred == []
+    assert cache.stats()["pending_revalidations"] == 0
+
+    cache.get_or_fetch("google", "x", fetch, deferred=deferred)
+    assert len(deferred) == 1
+
+
+def test_expired_and_per_source_ttl(monkeypatch):
+    """Além da janela de vencido, nova busca; cada fonte tem seu TTL."""
+    cache = QueryCache(ttls={"google": 10, "python_docs": 1000}, stale_ttl=10)
+    fetch = Fetcher()
+    now = time.time()
+
+    cache.get_or_fetch("google", "x", fetch)
+    cache.get_or_fetch("python_docs", "x", fetch)
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+
+    assert cache.get_or_fetch("google", "x", fetch)["cache"] == "miss"
+    assert cache.get_or_fetch("python_docs", "x", fetch)["cache"] == "hit"
+
+
+def test_lru_eviction():
+    """Acima do limite, a entrada menos usada é despejada."""
+    cache = QueryCache(max_entries=2)
+    fetch = Fetcher()
+
+    cache.get_or_fetch("google", "a", fetch)
+    cache.get_or_fetch("google", "b", fetch)
+    cache.get_or_fetch("google", "a", fetch)
+    cache.get_or_fetch("google", "c", fetch)
+
+    assert cache.get("google", "a")[1] == "fresh"
+    assert cache.get("google", "b")[1] == "miss"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_persists_between_instances(tmp_path):
+    """Entradas salvas em disco atendem uma nova instância."""
+    path = tmp_path / "query_cache.json"
+    fetch = Fetcher()
+
+    cache = QueryCache(path=path)
+    cache.get_or_fetch("google", "x", fetch)
+    cache.save()
+
+    result = QueryCache(path=path).get_or_fetch("google", "X", fetch)
+    assert result["cache"] == "hit" and fetch.calls == 1
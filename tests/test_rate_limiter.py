@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Testes para o limitador de requisições por domínio.
+"""
+
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from selenium.common.exceptions import WebDriverException
+
+    import rate_limiter
+    from rate_limiter import DomainPolicy, DomainScheduler, TokenBucket, is_blocked
+except ImportError as e:
+    pytest.skip(f"Módulo rate_limiter não encontrado: {e}", allow_module_level=True)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_burst_then_queue():
+    """Rajada imediata; depois cada chamador espera a sua vez na fila."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+
+    clock.now += 10  # ociosidade repõe no máximo ``burst`` tokens
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+
+def test_throttle_paces_requests_and_reports_rate():
+    """Taxa configurada respeitada e refletida na taxa efetiva."""
+    scheduler = DomainScheduler(policies={}, default=DomainPolicy(rate=20, burst=1))
+
+    start = time.perf_counter()
+    for _ in range(5):
+        scheduler.throttle("https://example.com/page")
+    elapsed = time.perf_counter() - start
+
+    metrics = scheduler.metrics()["example.com"]
+    assert elapsed >= 0.19
+    assert metrics["requests"] == 5
+    assert 15 <= metrics["effective_rate"] <= 21
+    assert metrics["queue_wait"]["count"] == 5
+
+
+def test_unconfigured_domains_are_not_paced():
+    """Só domínios de ``DEFAULT_POLICIES`` têm ritmo; os demais passam direto."""
+    scheduler = DomainScheduler()
+
+    start = time.perf_counter()
+    for _ in range(20):
+        with scheduler.slot("https://intranet.test/page"):
+            pass
+
+    assert time.perf_counter() - start < 0.05
+    assert scheduler.metrics()["intranet.test"]["configured_rate"] is None
+    assert scheduler.policies["www.google.com"].rate == 0.2
+
+
+def test_concurrency_cap_across_workers():
+    """Vagas por domínio limitam navegações simultâneas de todos os workers."""
+    scheduler = DomainScheduler(
+        policies={"a.test": DomainPolicy(rate=1000, burst=100, max_concurrency=2)}
+    )
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def worker(host):
+        with scheduler.slot(f"https://{host}/x"):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=worker, args=("a.test",)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+    assert scheduler.metrics()["a.test"]["queue_wait"]["max"] >= 0.04
+
+
+def test_backoff_grows_with_jitter_and_resets(monkeypatch):
+    """429/captcha: backoff exponencial (com jitter) que zera após acesso normal."""
+    monkeypatch.setattr(rate_limiter.random, "uniform", lambda low, high: high)
+    scheduler = DomainScheduler(
+        policies={"b.test": DomainPolicy(backoff_base=0.1, backoff_max=0.3)}
+    )
+    url = "https://b.test/search"
+
+    assert scheduler.report(url, status=200) == 0.0
+    assert scheduler.report(url, status=429) == pytest.approx(0.1)
+    assert scheduler.report(url, blocked=True) == pytest.approx(0.2)
+    assert scheduler.report(url, blocked=True) == pytest.approx(0.3)  # teto
+
+    start = time.perf_counter()
+    scheduler.throttle(url)
+    assert time.perf_counter() - start >= 0.25
+
+    scheduler.report(url, status=200)
+    assert scheduler.report(url, status=503) == pytest.approx(0.1)
+    assert scheduler.report(url, status=503, retry_after=2.0) == 2.0
+    assert scheduler.metrics()["b.test"]["throttled"] == 5
+
+
+def test_jitter_spreads_backoff():
+    """Workers bloqueados juntos não voltam no mesmo instante."""
+    scheduler = DomainScheduler(policies={}, default=DomainPolicy(backoff_base=10))
+
+    delays = {scheduler.report(f"https://h{i}.test/", status=429) for i in range(10)}
+
+    assert len(delays) > 1
+    assert all(5 <= delay <= 10 for delay in delays)
+
+
+def test_domains_are_independent():
+    """Backoff de um domínio não atrasa os demais."""
+    scheduler = DomainScheduler(policies={})
+    scheduler.report("https://blocked.test/", status=429)
+
+    start = time.perf_counter()
+    scheduler.throttle("https://other.test/")
+
+    assert time.perf_counter() - start < 0.05
+
+
+def test_is_blocked_detection():
+    """Página de captcha detectada; driver sem resposta não conta como bloqueio."""
+
+    class Driver:
+        def __init__(self, value):
+            self.value = value
+
+        def execute_script(self, script):
+            if isinstance(self.value, Exception):
+                raise self.value
+            return self.value
+
+    assert is_blocked(Driver(True))
+    assert not is_blocked(Driver(False))
+    assert not is_blocked(Driver(WebDriverException("no such window")))
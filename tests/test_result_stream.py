@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Testes para o streaming de resultados paginados (driver falso, sem navegador real).
+"""
+
+import time
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    import result_stream
+    from result_stream import BoundedDedup, stream_results
+    from tab_scheduler import FRESH_SCRIPT, NAVIGATE_SCRIPT
+except ImportError as e:
+    pytest.skip(f"Módulo result_stream não encontrado: {e}", allow_module_level=True)
+
+
+class FakeDriver:
+    """Driver com abas simuladas: cada página leva ``load`` segundos para carregar."""
+
+    def __init__(self, load: float = 0.0):
+        self.load = load
+        self.current_window_handle = "main"
+        self.urls = {}
+        self.ready_at = {}
+        self.closed = []
+        self.gets = 0
+        self.switch_to = MagicMock()
+        self.switch_to.new_window.side_effect = self._new_window
+        self.switch_to.window.side_effect = self._switch
+
+    def _new_window(self, kind):
+        self.current_window_handle = "prefetch"
+
+    def _switch(self, handle):
+        self.current_window_handle = handle
+
+    def get(self, url):
+        self.gets += 1
+        time.sleep(self.load)
+        self.urls[self.current_window_handle] = url
+        self.ready_at[self.current_window_handle] = 0
+
+    def execute_script(self, script, *args):
+        handle = self.current_window_handle
+        if script == NAVIGATE_SCRIPT:
+            self.urls[handle] = args[0]
+            self.ready_at[handle] = time.perf_counter() + self.load
+        elif script == FRESH_SCRIPT:
+            return time.perf_counter() >= self.ready_at[handle]
+
+    def close(self):
+        self.closed.append(self.current_window_handle)
+
+    @property
+    def current_url(self):
+        return self.urls.get(self.current_window_handle, "about:blank")
+
+    @property
+    def page(self):
+        return int(self.urls[self.current_window_handle].rsplit("=", 1)[1])
+
+
+@pytest.fixture(autouse=True)
+def ready_immediately(monkeypatch):
+    """Seletores de prontidão sempre presentes no documento atual."""
+    monkeypatch.setattr(result_stream, "wait_for_any", MagicMock())
+
+
+def pages_of(driver, per_page=3, total=9, overlap=0):
+    """Extrator: ``per_page`` links por página, com ``overlap`` repetidos da anterior."""
+
+    def extract():
+        first = driver.page * (per_page - overlap)
+        return [
+            {"link": f"https://example.com/{i}"}
+            for i in range(first, min(first + per_page, total))
+        ]
+
+    return extract
+
+
+def page_url(page):
+    return f"http://local/search?start={page}"
+
+
+def test_streams_across_pages_until_exhausted():
+    """Páginas atravessadas em ordem; fim quando uma página vem vazia."""
+    driver = FakeDriver()
+    stats = {}
+
+    items = list(
+        stream_results(driver, page_url, pages_of(driver), [], max_results=None, stats=stats)
+    )
+
+    assert [item["link"] for item in items] == [f"https://example.com/{i}" for i in range(9)]
+    assert [item["position"] for item in items] == list(range(1, 10))
+    assert [item["page"] for item in items[::3]] == [1, 2, 3]
+    assert stats["pages"] == 4 and stats["stopped_by"] == "no_new_results"
+    # Aba de pré-carregamento fechada e driver de volta à aba original
+    assert driver.closed == ["prefetch"]
+    assert driver.current_window_handle == "main"
+
+
+def test_duplicates_dropped_across_pages():
+    """Links repetidos entre páginas não são gerados novamente."""
+    driver = FakeDriver()
+    stats = {}
+
+    items = list(
+        stream_results(
+            driver, page_url, pages_of(driver, overlap=1), [], max_results=None, stats=stats
+        )
+    )
+
+    links = [item["link"] for item in items]
+    assert len(links) == len(set(links)) == 9
+    assert stats["duplicates"] > 0
+
+
+def test_limits_stop_early():
+    """Limites de resultados e páginas interrompem sem carregar páginas extras."""
+    driver = FakeDriver()
+    stats = {}
+
+    items = list(
+        stream_results(driver, page_url, pages_of(driver), [], max_results=4, stats=stats)
+    )
+    assert len(items) == 4 and stats["stopped_by"] == "max_results"
+    # A segunda página já bastava para o limite: a terceira não é pré-carregada
+    assert stats["pages"] == 2 and stats["prefetched"] == 1
+
+    items = list(
+        stream_results(driver, page_url, pages_of(driver), [], max_pages=1, stats=stats)
+    )
+    assert len(items) == 3 and stats["stopped_by"] == "max_pages"
+    assert stats["prefetched"] == 0
+
+
+def test_prefetch_overlaps_consumer_work():
+    """Com pré-carregamento, o carregamento da próxima página corre junto do consumo."""
+
+    def consume(prefetch):
+        driver = FakeDriver(load=0.15)
+        start = time.perf_counter()
+        for item in stream_results(
+            driver, page_url, pages_of(driver, per_page=1, total=4), [], prefetch=prefetch
+        ):
+            time.sleep(0.15)
+        return time.perf_counter() - start
+
+    sequential, prefetched = consume(False), consume(True)
+
+    # 5 cargas + 4 consumos em série (~1.35s) vs. cargas sobrepostas (~0.8s)
+    assert prefetched < sequential - 0.3
+
+
+def test_bounded_dedup_evicts_oldest():
+    """Memória limitada: chaves mais antigas saem da janela."""
+    seen = BoundedDedup(max_items=2)
+
+    assert seen.add("a") and seen.add("b")
+    assert not seen.add("a")
+    assert seen.add("c")  # "b" é a menos recente
+    assert len(seen) == 2
+    assert seen.add("b")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Testes para o pipeline de screenshots (drivers falsos, sem navegador real).
+"""
+
+import base64
+import threading
+import pytest
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from screenshot_pipeline import ScreenshotPipeline
+except ImportError as e:
+    pytest.skip(f"Módulo screenshot_pipeline não encontrado: {e}", allow_module_level=True)
+
+
+def encode(raw):
+    return base64.b64encode(raw).decode()
+
+
+class CdpDriver:
+    """Driver Chromium: registra os parâmetros de Page.captureScreenshot."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.calls = []
+        self.threads = set()
+
+    def execute_cdp_cmd(self, cmd, params):
+        assert cmd == "Page.captureScreenshot"
+        self.threads.add(threading.get_ident())
+        self.calls.append(params)
+        return {"data": encode(self.frames.pop(0))}
+
+    def execute_script(self, script, element):
+        return {"x": 10, "y": 400, "width": 200, "height": 50}
+
+
+class PlainDriver:
+    """Driver sem CDP (ex.: Firefox)."""
+
+    def get_screenshot_as_base64(self):
+        return encode(b"png-frame")
+
+
+def test_capture_writes_in_background(tmp_path):
+    """Captura na thread chamadora; gravação pelo pool; conteúdo decodificado."""
+    driver = CdpDriver([b"frame-1"])
+    pipeline = ScreenshotPipeline(tmp_path)
+
+    path = pipeline.capture(driver, "final.png")
+    pipeline.close()
+
+    assert driver.threads == {threading.get_ident()}
+    assert Path(path) == tmp_path / "final.png"
+    assert Path(path).read_bytes() == b"frame-1"
+    assert driver.calls[0] == {"format": "png", "captureBeyondViewport": False}
+    assert pipeline.metrics()["written"] == 1
+
+
+def test_format_quality_and_element_clip(tmp_path):
+    """JPEG com qualidade e recorte pelo retângulo do elemento."""
+    driver = CdpDriver([b"jpeg-frame"])
+    pipeline = ScreenshotPipeline(tmp_path, image_format="jpeg", quality=60)
+
+    path = pipeline.capture(driver, "erro.png", element=object())
+    pipeline.flush()
+
+    assert Path(path).name == "erro.jpg"
+    assert driver.calls[0] == {
+        "format": "jpeg",
+        "quality": 60,
+        "captureBeyondViewport": True,
+        "clip": {"scale": 1, "x": 10, "y": 400, "width": 200, "height": 50},
+    }
+
+
+def test_identical_frames_written_once(tmp_path):
+    """Quadros idênticos: um arquivo gravado, os demais apontam para ele."""
+    driver = CdpDriver([b"same", b"same", b"other"])
+    pipeline = ScreenshotPipeline(tmp_path)
+
+    paths = [pipeline.capture(driver, f"shot_{i}.png") for i in range(3)]
+    pipeline.close()
+
+    metrics = pipeline.metrics()
+    assert metrics["written"] == 2 and metrics["duplicates"] == 1
+    assert metrics["bytes"] == len(b"same") + len(b"other")
+    assert [Path(p).read_bytes() for p in paths] == [b"same", b"same", b"other"]
+
+
+def test_fallback_without_cdp_is_png(tmp_path):
+    """Sem CDP: PNG de get_screenshot_as_base64, mesmo pedindo WebP."""
+    pipeline = ScreenshotPipeline(tmp_path)
+
+    path = pipeline.capture(PlainDriver(), "shot.png", image_format="webp")
+    pipeline.close()
+
+    assert Path(path).suffix == ".png"
+    assert Path(path).read_bytes() == b"png-frame"
+
+
+def test_rejects_unknown_format(tmp_path):
+    """Formato inválido falha antes de tocar o navegador."""
+    with pytest.raises(ValueError):
+        ScreenshotPipeline(tmp_path, image_format="gif")
+
+
+def test_dedup_memory_is_bounded(tmp_path):
+    """Processos longos lembram apenas os quadros mais recentes."""
+    driver = CdpDriver([f"frame-{i}".encode() for i in range(10)] + [b"frame-0"])
+    pipeline = ScreenshotPipeline(tmp_path, workers=1, max_hashes=3)
+
+    for i in range(11):
+        pipeline.capture(driver, f"shot_{i}.png")
+    pipeline.close()
+
+    assert len(pipeline._by_hash) == 3
+    assert pipeline.metrics()["written"] == 11  # frame-0 já esquecido
+
+
+def test_overwritten_file_not_used_as_dedup_source(tmp_path):
+    """Arquivo sobrescrito com outro quadro deixa de servir de original para o hash antigo."""
+    driver = CdpDriver([b"AAA", b"BBB", b"AAA"])
+    pipeline = ScreenshotPipeline(tmp_path, workers=1)
+
+    pipeline.capture(driver, "final.png")
+    pipeline.capture(driver, "final.png")
+    debug = pipeline.capture(driver, "debug.png")
+    pipeline.close()
+
+    assert (tmp_path / "final.png").read_bytes() == b"BBB"
+    assert Path(debug).read_bytes() == b"AAA"
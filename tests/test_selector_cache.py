@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Testes para o cache persistente de seletores.
+"""
+
+import json
+import os
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from selector_cache import SelectorCache
+except ImportError as e:
+    pytest.skip(f"Módulo selector_cache não encontrado: {e}", allow_module_level=True)
+
+
+CANDIDATES = [("css selector", "input[name='q']"), ("css selector", "textarea[name='q']")]
+
+
+def test_orders_by_success():
+    """Seletor bem-sucedido passa para o início; demais mantêm a ordem."""
+    cache = SelectorCache(path=None)
+    assert cache.order("site", "search_box", CANDIDATES) == CANDIDATES
+
+    cache.record("site", "search_box", CANDIDATES[1])
+
+    assert cache.order("site", "search_box", CANDIDATES) == CANDIDATES[::-1]
+    assert cache.order("outro", "search_box", CANDIDATES) == CANDIDATES
+
+
+def test_recent_success_outweighs_old_history(monkeypatch):
+    """Placar antigo decai: sucesso recente vence muitos sucessos antigos."""
+    cache = SelectorCache(path=None, half_life_days=1)
+    now = time.time()
+
+    monkeypatch.setattr(time, "time", lambda: now - 30 * 86400)
+    for _ in range(10):
+        cache.record("site", "submit", CANDIDATES[0])
+
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache.record("site", "submit", CANDIDATES[1])
+
+    assert cache.order("site", "submit", CANDIDATES)[0] == CANDIDATES[1]
+
+
+def test_drift_stats():
+    """Troca do seletor vencedor é contabilizada como deriva."""
+    cache = SelectorCache(path=None)
+    cache.record("site", "results", "div.g")
+    cache.record("site", "results", "div.g")
+    cache.record("site", "results", ".tF2Cxc")
+
+    stats = cache.stats()["site|results"]
+    assert stats["winner"] == ".tF2Cxc"
+    assert stats["drift"] == 1
+    assert stats["successes"] == {"div.g": 2, ".tF2Cxc": 1}
+
+
+def test_persists_between_runs(tmp_path):
+    """Placar salvo em disco é recarregado por uma nova instância."""
+    path = tmp_path / "selector_cache.json"
+    cache = SelectorCache(path=path)
+    cache.record("site", "search_box", CANDIDATES[1])
+    cache.save()
+
+    assert "site|search_box" in json.loads(path.read_text(encoding="utf-8"))["entries"]
+    assert SelectorCache(path=path).order("site", "search_box", CANDIDATES)[0] == CANDIDATES[1]
+
+
+def test_corrupted_file_ignored(tmp_path):
+    """Arquivo corrompido não impede a execução."""
+    path = tmp_path / "selector_cache.json"
+    path.write_text("{inválido", encoding="utf-8")
+
+    assert SelectorCache(path=path).order("site", "x", CANDIDATES) == CANDIDATES
+
+
+def test_concurrent_saves(tmp_path):
+    """Workers salvando a mesma instância não disputam o arquivo temporário."""
+    path = tmp_path / "cache.json"
+    cache = SelectorCache(path)
+    errors = []
+
+    def worker(index):
+        try:
+            for i in range(50):
+                cache.record("site", f"finalidade_{index}_{i}", CANDIDATES[0])
+                cache.save()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(json.loads(path.read_text(encoding="utf-8"))["entries"]) == 200
+
+
+def test_failed_save_keeps_changes(tmp_path, monkeypatch):
+    """Escrita que falha não descarta as alterações: o próximo save grava."""
+    path = tmp_path / "cache.json"
+    cache = SelectorCache(path)
+    cache.record("site", "search_box", CANDIDATES[1])
+
+    def disk_full(source, target):
+        raise OSError("disco cheio")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(os, "replace", disk_full)
+        with pytest.raises(OSError):
+            cache.save()
+
+    cache.save()
+    assert SelectorCache(path).order("site", "search_box", CANDIDATES) == CANDIDATES[::-1]
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Testes para a sondagem de seletores alternativos (sem navegador real).
+"""
+
+import time
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from selenium.common.exceptions import InvalidSelectorException, TimeoutException
+    from selector_probe import probe, wait_for_any
+except ImportError as e:
+    pytest.skip(f"Módulo selector_probe não encontrado: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def driver():
+    """Driver falso com implicit wait de 15s."""
+    driver = MagicMock()
+    driver.timeouts.implicit_wait = 15
+    return driver
+
+
+def test_returns_first_present_and_restores_implicit_wait(driver):
+    """Primeira alternativa presente vence; implicit wait é restaurado."""
+    element = MagicMock()
+    driver.find_elements.side_effect = lambda by, value: [element] if value == "b" else []
+
+    result = probe(driver, [("css selector", "a"), ("css selector", "b")])
+
+    assert result.locator == ("css selector", "b")
+    assert result.element is element
+    assert result.index == 1
+    assert [c.args[0] for c in driver.implicitly_wait.call_args_list] == [0, 15]
+
+
+def test_invalid_selector_skipped(driver):
+    """Seletor inválido não interrompe a sondagem."""
+    element = MagicMock()
+
+    def find_elements(by, value):
+        if value == "button:contains('x')":
+            raise InvalidSelectorException("inválido")
+        return [element]
+
+    driver.find_elements.side_effect = find_elements
+
+    result = probe(driver, [("css selector", "button:contains('x')"), ("css selector", "ok")])
+
+    assert result.locator[1] == "ok"
+
+
+def test_shared_deadline(driver):
+    """Nenhuma alternativa presente: retorna None após o prazo único."""
+    driver.find_elements.return_value = []
+
+    start = time.perf_counter()
+    result = probe(driver, [("css selector", s) for s in "abcde"], timeout=0.2)
+
+    assert result is None
+    assert time.perf_counter() - start < 1.0
+
+
+class TestWaitForAny:
+    """Testes da espera composta (OR) entre seletores."""
+
+    def test_reports_winning_selector(self, driver):
+        """Retorna o seletor que apareceu primeiro, mesmo que não seja o primeiro da lista."""
+        element = MagicMock()
+        calls = {"n": 0}
+
+        def find_elements(by, value):
+            calls["n"] += 1
+            return [element] if value == "c" and calls["n"] > 6 else []
+
+        driver.find_elements.side_effect = find_elements
+
+        result = wait_for_any(driver, [("css selector", s) for s in "abc"], timeout=2)
+
+        assert result.locator == ("css selector", "c")
+        assert result.element is element
+
+    def test_single_timeout_for_all_selectors(self, driver):
+        """Pior caso limitado a um timeout, não à soma por seletor."""
+        driver.find_elements.return_value = []
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutException):
+            wait_for_any(driver, [("css selector", s) for s in "abcde"], timeout=0.3)
+
+        assert time.perf_counter() - start < 1.0
+        assert driver.implicitly_wait.call_args_list[-1].args[0] == 15
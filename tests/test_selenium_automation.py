@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Testes para selenium_automation.WebAutomation (sem navegador real).
+"""
+
+import json
+import time
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from http_forms import SubmissionSent
+    from query_cache import QueryCache
+    from selector_cache import SelectorCache
+    import selenium_automation
+    from selenium_automation import WebAutomation
+except ImportError as e:
+    pytest.skip(f"Módulo selenium_automation não encontrado: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def automation():
+    """WebAutomation com driver falso."""
+    automation = WebAutomation(headless=True, selector_cache=SelectorCache(path=None))
+    automation.driver = MagicMock()
+    return automation
+
+
+class TestExtractSearchResults:
+    """Testes da extração de resultados em uma única chamada."""
+
+    def test_single_round_trip(self, automation):
+        """Extração usa um único execute_script e filtra resultados inválidos."""
+        automation.driver.execute_script.return_value = json.dumps(
+            {
+                "container": "div.g",
+                "total": 3,
+                "items": [
+                    {
+                        "index": 0,
+                        "title": "Python",
+                        "link": "https://python.org",
+                        "snippet": "",
+                    },
+                    {"index": 1, "title": "", "link": "https://x.org", "snippet": "s"},
+                    {"index": 2, "title": "Busca", "link": "/search?q=x", "snippet": "s"},
+                ],
+            }
+        )
+
+        results = automation._extract_search_results()
+
+        assert automation.driver.execute_script.call_count == 1
+        assert results == [
+            {
+                "position": 1,
+                "title": "Python",
+                "link": "https://python.org",
+                "snippet": "Sem descrição",
+            }
+        ]
+
+    def test_no_results(self, automation):
+        """Página sem containers retorna lista vazia."""
+        automation.driver.execute_script.return_value = json.dumps(
+            {"container": None, "total": 0, "items": []}
+        )
+
+        assert automation._extract_search_results() == []
+
+    def test_records_winning_selectors(self, automation):
+        """Seletores vencedores passam a ser tentados primeiro na próxima extração."""
+        automation.driver.execute_script.return_value = json.dumps(
+            {
+                "container": ".tF2Cxc",
+                "total": 1,
+                "items": [{"index": 0, "title": "T", "link": "https://a.org", "snippet": "s"}],
+                "field_selectors": {"title": "h3"},
+            }
+        )
+
+        automation._extract_search_results()
+        automation._extract_search_results()
+
+        spec = automation.driver.execute_script.call_args.args[1]
+        assert spec["containers"][0] == ".tF2Cxc"
+        assert spec["fields"]["title"]["selectors"][0] == "h3"
+
+
+class TestHttpFirstForms:
+    """Testes do envio de formulário via HTTP antes do navegador."""
+
+    def test_static_form_skips_browser(self, automation):
+        """Com executor HTTP, o formulário é enviado sem usar o driver."""
+        automation.form_executor = MagicMock()
+        automation.form_executor.submit.return_value = {
+            "transport": "http",
+            "execution_time": 0.01,
+            "success": True,
+        }
+
+        result = automation.automate_form_filling(
+            {"customer_name": "Ana", "toppings": ["bacon"], "extra": "x"}
+        )
+
+        automation.form_executor.submit.assert_called_once_with(
+            automation.FORM_URL, {"custname": "Ana", "topping": ["bacon"]}
+        )
+        automation.driver.get.assert_not_called()
+        assert result["transport"] == "http"
+        assert result["form_data"]["customer_name"] == "Ana"
+
+    def test_sent_submission_not_repeated_in_browser(self, automation):
+        """Falha após transmitir o POST: resultado de erro, sem reenviar pelo navegador."""
+        automation.form_executor = MagicMock()
+        automation.form_executor.submit.side_effect = SubmissionSent("POST /post: timeout")
+
+        result = automation.automate_form_filling({"customer_name": "Ana"})
+
+        automation.driver.get.assert_not_called()
+        assert result["success"] is False and "timeout" in result["error"]
+
+
+class TestQueryCache:
+    """Cache de pesquisas opcional."""
+
+    def test_searches_uncached_by_default(self, automation, monkeypatch):
+        """Sem cache configurado, toda pesquisa navega (medições reais)."""
+        calls = []
+        monkeypatch.setattr(
+            automation,
+            "_search_google",
+            lambda query: calls.append(query) or {"success": True},
+        )
+
+        automation.search_google("python")
+        automation.search_google("python")
+
+        assert automation.query_cache is None
+        assert calls == ["python", "python"]
+
+    def test_cleanup_without_driver_releases_stale_queries(self, automation):
+        """Driver já devolvido ao pool: revalidações pendentes descartadas, não presas."""
+        automation.query_cache = QueryCache()
+        automation.query_cache._revalidating.add("google@|python")
+
+        def revalidate():
+            raise AssertionError("sem navegador")
+
+        revalidate.key = "google@|python"
+        automation._stale_queries.append(revalidate)
+        automation.driver = None
+
+        automation.cleanup()
+
+        assert automation._stale_queries == []
+        assert automation.query_cache.stats()["pending_revalidations"] == 0
+
+
+class TestPooledCleanup:
+    """Encerramento com driver emprestado de um pool."""
+
+    def test_pool_cleanup_removes_restore_scripts_and_profiles(self, automation, tmp_path):
+        """Driver devolvido sem os scripts de restauração; cópias de perfil removidas."""
+        driver = automation.driver
+        automation.pool = MagicMock()
+        automation._restore_scripts.append("3")
+        profile = tmp_path / "worker-1"
+        profile.mkdir()
+        automation._profile_dirs.append(profile)
+
+        automation.cleanup()
+
+        driver.execute_cdp_cmd.assert_called_once_with(
+            "Page.removeScriptToEvaluateOnNewDocument", {"identifier": "3"}
+        )
+        automation.pool.release.assert_called_once_with(driver)
+        assert automation.driver is None
+        assert not profile.exists() and automation._profile_dirs == []
+
+
+class TestConfigurableUrls:
+    """Testes dos endereços configuráveis das etapas."""
+
+    def test_configure_urls_from_stand_in_server(self, automation):
+        """Endereços do servidor local substituem google.com e httpbin.org."""
+        automation.configure_urls(
+            google="http://127.0.0.1:1/",
+            form="http://127.0.0.1:1/forms/post",
+            test_form="http://127.0.0.1:1/test_form.html",
+        )
+
+        automation.test_simple_form()
+
+        automation.driver.get.assert_called_once_with("http://127.0.0.1:1/test_form.html")
+        assert automation.FORM_URL == "http://127.0.0.1:1/forms/post"
+        assert WebAutomation.FORM_URL == "https://httpbin.org/forms/post"
+
+    def test_test_form_file_written_once(self, tmp_path, monkeypatch):
+        """Sem servidor, a página de teste é gravada uma vez e reutilizada."""
+        monkeypatch.chdir(tmp_path)
+
+        url = WebAutomation._test_form_file_url()
+        page = tmp_path / "output" / "test_form.html"
+        mtime = page.stat().st_mtime_ns
+        time.sleep(0.01)
+
+        assert WebAutomation._test_form_file_url() == url
+        assert page.stat().st_mtime_ns == mtime
+
+
+class TestDebugScreenshots:
+    """Screenshots de erro das etapas."""
+
+    @pytest.fixture
+    def failing_suite(self, automation, monkeypatch):
+        """Suite cujas etapas falham, registrando os screenshots pedidos."""
+        taken = []
+        monkeypatch.setattr(automation, "take_screenshot", lambda name: taken.append(name))
+        monkeypatch.setattr(automation, "setup_driver", lambda: None)
+        monkeypatch.setattr(automation, "cleanup", lambda: None)
+        monkeypatch.setattr(automation, "_save_results", lambda: None)
+        supervisor = MagicMock()
+        supervisor.return_value.run.side_effect = lambda name, step, **kwargs: step()
+        monkeypatch.setattr(selenium_automation, "DriverSupervisor", supervisor)
+
+        def failing_step(*args):
+            automation._debug_screenshot("debug_step_error")
+            return {"success": False}
+
+        for step in ("test_simple_form", "search_google", "automate_form_filling"):
+            monkeypatch.setattr(automation, step, failing_step)
+        return automation, taken
+
+    def test_suite_without_persistence_skips_error_screenshots(self, failing_suite):
+        """Modo contínuo (``persist=False``) não acumula screenshots de erro."""
+        automation, taken = failing_suite
+
+        automation.run_automation_suite(persist=False)
+
+        assert taken == []
+        assert automation.debug_screenshots is True
+
+    def test_persisted_suite_keeps_error_screenshots(self, failing_suite):
+        """Execução normal mantém um screenshot por erro (mais o final)."""
+        automation, taken = failing_suite
+
+        automation.run_automation_suite()
+
+        assert len([n for n in taken if n.startswith("debug_step_error_")]) == 3
+        assert taken[-1] == "automation_final.png"
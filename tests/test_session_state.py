@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Testes para os snapshots de estado de sessão (driver falso, sem navegador real).
+"""
+
+import json
+import time
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from session_state import (
+        SessionState,
+        prepare_profile,
+        release_profiles,
+        remove_restore_scripts,
+    )
+except ImportError as e:
+    pytest.skip(f"Módulo session_state não encontrado: {e}", allow_module_level=True)
+
+
+URL = "https://www.google.com/search?q=x"
+COOKIES = [
+    {"name": "SOCS", "value": "ok", "domain": ".google.com", "path": "/", "expiry": 4e9},
+    {"name": "OLD", "value": "x", "domain": ".google.com", "path": "/", "expiry": 1},
+]
+
+
+def browser_driver():
+    """Driver posicionado em uma página da origem, com cookies e localStorage."""
+    driver = MagicMock(spec=["get_cookies", "execute_script", "execute_cdp_cmd"])
+    driver.get_cookies.return_value = COOKIES
+    driver.execute_script.return_value = {"consent": "1"}
+    return driver
+
+
+def test_capture_and_restore_via_cdp(tmp_path):
+    """Cookies válidos e localStorage reaplicados sem navegação; fluxos retornados."""
+    path = tmp_path / "state.json"
+    SessionState(path).capture(
+        browser_driver(), URL, flags=["consent"], step_seconds={"consent": 20.0}
+    )
+
+    # Nova instância lê do disco (outra execução)
+    state = SessionState(path)
+    driver = browser_driver()
+    flags = state.restore(driver, "https://www.google.com/")
+
+    assert flags == {"consent"}
+    assert state.step_seconds(URL, "consent") == 20.0
+    commands = {call.args[0]: call.args[1] for call in driver.execute_cdp_cmd.call_args_list}
+    cookies = commands["Network.setCookies"]["cookies"]
+    assert [c["name"] for c in cookies] == ["SOCS"]  # expirado descartado
+    assert cookies[0]["expires"] == 4e9
+    script = commands["Page.addScriptToEvaluateOnNewDocument"]["source"]
+    assert '"https://www.google.com"' in script and '"consent": "1"' in script
+
+
+def test_restore_scripts_removed_on_release():
+    """Script de localStorage registrado por restauração é removido ao devolver o driver."""
+    state = SessionState(path=None)
+    state.capture(browser_driver(), URL, flags=["consent"])
+    driver = browser_driver()
+    driver.execute_cdp_cmd.side_effect = lambda command, params: (
+        {"identifier": "7"} if command == "Page.addScriptToEvaluateOnNewDocument" else {}
+    )
+    scripts = []
+
+    state.restore(driver, URL, scripts)
+    assert scripts == ["7"]
+
+    remove_restore_scripts(driver, scripts)
+    assert scripts == []
+    driver.execute_cdp_cmd.assert_called_with(
+        "Page.removeScriptToEvaluateOnNewDocument", {"identifier": "7"}
+    )
+
+
+def test_restore_without_cdp_navigates_to_origin():
+    """Sem CDP: navega até a origem e aplica cookies pelo WebDriver."""
+    state = SessionState(path=None)
+    state.capture(browser_driver(), URL, flags=["consent"])
+
+    driver = MagicMock(spec=["get", "add_cookie", "execute_script"])
+    assert state.restore(driver, URL) == {"consent"}
+
+    driver.get.assert_called_once_with("https://www.google.com")
+    assert driver.add_cookie.call_count == 1
+
+
+def test_flags_dropped_when_every_cookie_expired():
+    """Sem nenhum cookie válido, o fluxo (ex.: consentimento) é refeito."""
+    state = SessionState(path=None)
+    driver = browser_driver()
+    driver.get_cookies.return_value = COOKIES[1:]
+    state.capture(driver, URL, flags=["consent"])
+
+    assert state.restore(browser_driver(), URL) == set()
+
+
+def test_unknown_origin_restores_nothing():
+    """Origem sem snapshot: nada aplicado, nenhum fluxo pulado."""
+    state = SessionState(path=None)
+    driver = browser_driver()
+
+    assert state.restore(driver, "https://example.com") == set()
+    driver.execute_cdp_cmd.assert_not_called()
+
+
+def test_non_http_pages_not_captured():
+    """Páginas locais (file://) não têm origem: nada é salvo."""
+    state = SessionState(path=None)
+
+    assert state.capture(browser_driver(), "file:///tmp/test_form.html") == {}
+    assert state.stats() == {}
+
+
+def test_flags_accumulate_and_stats():
+    """Capturas sucessivas somam fluxos; estatísticas por origem."""
+    state = SessionState(path=None)
+    state.capture(browser_driver(), URL, flags=["consent"])
+    state.capture(browser_driver(), URL, flags=["login"])
+
+    stats = state.stats()["https://www.google.com"]
+    assert stats["flags"] == ["consent", "login"]
+    assert stats["cookies"] == 2 and stats["local_storage_keys"] == 1
+
+    state.forget(URL)
+    assert state.stats() == {}
+
+
+def test_profile_template_copied_per_worker(tmp_path):
+    """Cada worker recebe cópia própria do perfil, sem travas nem caches."""
+    template = tmp_path / "template"
+    (template / "Default" / "Code Cache").mkdir(parents=True)
+    (template / "Default" / "Cookies").write_text("cookies")
+    (template / "SingletonLock").write_text("lock")
+    (template / "Local State").write_text(json.dumps({"ok": True}))
+
+    dirs = [prepare_profile(template, tmp_path / "profiles") for _ in range(2)]
+
+    assert dirs[0] != dirs[1]
+    for path in dirs:
+        assert (path / "Default" / "Cookies").read_text() == "cookies"
+        assert (path / "Local State").exists()
+        assert not (path / "SingletonLock").exists()
+        assert not (path / "Default" / "Code Cache").exists()
+
+    release_profiles(dirs)
+    assert dirs == [] and not list((tmp_path / "profiles").iterdir())
+
+
+def test_saved_at_age(monkeypatch):
+    """Idade do snapshot reportada nas estatísticas."""
+    state = SessionState(path=None)
+    now = time.time()
+    state.capture(browser_driver(), URL)
+
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+    assert state.stats()["https://www.google.com"]["age_seconds"] >= 59
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Testes para o modo contínuo da suite (automação falsa, sem navegador real).
+"""
+
+import json
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+from tests.conftest import FakeAutomation
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from soak_monitor import RollingStats, SoakRunner
+except ImportError as e:
+    pytest.skip(f"Módulo soak_monitor não encontrado: {e}", allow_module_level=True)
+
+
+class SuiteAutomation(FakeAutomation):
+    """Suite falsa: a pesquisa falha a cada terceira execução."""
+
+    def __init__(self):
+        super().__init__()
+        self.pool = object()
+        self.results = []
+        self.calls = []
+
+    def run_automation_suite(self, persist=True):
+        self.calls.append(persist)
+        search_ok = len(self.calls) % 3 != 0
+        self.results = [
+            {"test_type": "simple_form", "execution_time": 0.2, "success": True},
+            {
+                "query": "python",
+                "execution_time": 1.5 if search_ok else None,
+                "success": search_ok,
+                **({} if search_ok else {"error": "captcha"}),
+            },
+        ]
+        successful = 1 + search_ok
+        return {
+            "success": True,
+            "results": self.results,
+            "total_tests": 2,
+            "successful_tests": successful,
+        }
+
+
+def test_rolling_stats_histogram_and_bounded_failures():
+    """Histograma por faixa de latência e só as falhas mais recentes."""
+    stats = RollingStats(max_failures=3)
+    for seconds in (0.1, 0.7, 0.9, 4.0, 120.0):
+        stats.record("etapa", True, seconds)
+    for i in range(10):
+        stats.record("etapa", False, None, f"erro {i}")
+
+    snapshot = stats.snapshot()
+    step = snapshot["steps"]["etapa"]
+    assert step["runs"] == 15 and step["success_rate"] == pytest.approx(33.3)
+    assert step["histogram"]["<=0.5s"] == 1
+    assert step["histogram"]["<=1s"] == 2
+    assert step["histogram"]["<=5s"] == 1
+    assert step["histogram"][">60s"] == 1
+    assert [f["error"] for f in snapshot["recent_failures"]] == ["erro 7", "erro 8", "erro 9"]
+
+
+def test_cache_hits_excluded_from_latency():
+    """Pesquisa servida do cache conta como execução, mas não entra na latência."""
+    stats = RollingStats()
+    results = [
+        {"query": "python", "execution_time": 1.5, "success": True, "cache": "miss"},
+        {"query": "python", "execution_time": 1.5, "success": True, "cache": "hit"},
+    ]
+
+    stats.record_suite({"success": True, "results": results}, 2.0)
+
+    step = stats.snapshot()["steps"]["search_google"]
+    assert step["runs"] == 2 and step["successes"] == 2
+    assert sum(step["histogram"].values()) == 1
+
+
+def test_loop_keeps_only_aggregates(tmp_path):
+    """Execuções sem persistência; resultados descartados; um único snapshot sobrescrito."""
+    automation = SuiteAutomation()
+    runner = SoakRunner(
+        automation,
+        interval=0,
+        snapshot_path=tmp_path / "soak.json",
+        snapshot_every=0,
+        max_failures=2,
+    )
+
+    snapshot = runner.run(iterations=9)
+
+    assert automation.calls == [False] * 9
+    assert list(tmp_path.iterdir()) == [tmp_path / "soak.json"]
+    assert json.loads((tmp_path / "soak.json").read_text(encoding="utf-8")) == snapshot
+
+    steps = snapshot["steps"]
+    assert snapshot["iterations"] == 9
+    assert steps["simple_form"]["success_rate"] == 100.0
+    assert steps["search_google"]["successes"] == 6
+    assert steps["suite"]["runs"] == 9 and steps["suite"]["successes"] == 6
+    assert len(snapshot["recent_failures"]) == 2
+
+
+def test_interval_paces_runs_and_stop_interrupts(tmp_path):
+    """Execuções espaçadas pelo intervalo; ``stop`` encerra sem esperar o próximo ciclo."""
+    automation = SuiteAutomation()
+    runner = SoakRunner(automation, interval=0.1, snapshot_path=tmp_path / "soak.json")
+
+    start = time.perf_counter()
+    runner.run(iterations=3)
+    assert time.perf_counter() - start >= 0.2
+
+    runner = SoakRunner(automation, interval=30, snapshot_path=tmp_path / "soak.json")
+    threading.Timer(0.1, runner.stop).start()
+    start = time.perf_counter()
+    snapshot = runner.run()
+
+    assert time.perf_counter() - start < 2
+    assert snapshot["iterations"] == 1
+
+
+def test_suite_exception_counted_as_failure(tmp_path):
+    """Erro inesperado da suite não interrompe o loop."""
+    automation = SuiteAutomation()
+    automation.run_automation_suite = lambda persist=True: 1 / 0
+    runner = SoakRunner(automation, interval=0, snapshot_path=tmp_path / "soak.json")
+
+    snapshot = runner.run(iterations=2)
+
+    assert snapshot["steps"]["suite"]["runs"] == 2
+    assert snapshot["steps"]["suite"]["successes"] == 0
+    assert "division by zero" in snapshot["recent_failures"][-1]["error"]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Testes para o servidor local de páginas de teste.
+"""
+
+import json
+import time
+import pytest
+from urllib.parse import urlencode
+from urllib.request import urlopen
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from stand_in_server import StandInServer
+except ImportError as e:
+    pytest.skip(f"Módulo stand_in_server não encontrado: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def server():
+    """Servidor local em porta livre."""
+    with StandInServer(results_per_page=3) as server:
+        yield server
+
+
+def fetch(url: str, data: bytes = None) -> str:
+    """GET (ou POST com ``data``) e corpo decodificado."""
+    with urlopen(url, data=data, timeout=5) as response:
+        return response.read().decode("utf-8")
+
+
+def test_serves_pages_from_memory(server):
+    """Páginas da suite servidas sem rede externa."""
+    urls = server.site_urls()
+
+    assert 'id="testForm"' in fetch(urls["test_form"])
+    assert 'name="custname"' in fetch(urls["form"])
+    assert 'name="q"' in fetch(urls["google"])
+
+
+def test_fake_search_results(server):
+    """Busca falsa no formato esperado pela extração de resultados."""
+    page = fetch(server.url("/search?" + urlencode({"q": "selenium <b>"})))
+
+    assert page.count('class="g"') == 3
+    assert "selenium &lt;b&gt; - resultado 0" in page
+
+
+def test_search_pagination(server):
+    """Parâmetro ``start`` desloca os resultados até o total disponível."""
+    server.total_results = 7
+
+    second = fetch(server.url("/search?" + urlencode({"q": "x", "start": 3})))
+    last = fetch(server.url("/search?" + urlencode({"q": "x", "start": 6})))
+    beyond = fetch(server.url("/search?" + urlencode({"q": "x", "start": 9})))
+
+    assert "x - resultado 3" in second and "x - resultado 2" not in second
+    assert last.count('class="g"') == 1
+    assert 'class="g"' not in beyond
+
+
+@pytest.mark.parametrize("start", ["abc", "-3"])
+def test_invalid_start_serves_first_page(server, start):
+    """``start`` inválido ou negativo: primeira página em vez de erro 500."""
+    page = fetch(server.url("/search?" + urlencode({"q": "x", "start": start})))
+
+    assert "x - resultado 0" in page
+
+
+def test_post_echo_like_httpbin(server):
+    """POST ecoado como JSON: valor único como string, repetidos como lista."""
+    body = urlencode([("custname", "Ana"), ("topping", "bacon"), ("topping", "cheese")])
+
+    echo = json.loads(fetch(server.url("/post"), body.encode()))
+
+    assert echo["form"] == {"custname": "Ana", "topping": ["bacon", "cheese"]}
+
+
+def test_latency_injection():
+    """Latência por caminho aplicada somente ao caminho configurado."""
+    with StandInServer(path_latency={"/search": 0.3}) as server:
+        start = time.perf_counter()
+        fetch(server.url("/"))
+        fast = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fetch(server.url("/search?q=x"))
+        slow = time.perf_counter() - start
+
+    assert slow >= 0.3 > fast
+    assert server.requests == 2
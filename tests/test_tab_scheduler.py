@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Testes para o escalonador de abas (driver falso, sem navegador real).
+"""
+
+import time
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from tab_scheduler import TabScheduler, navigate, page_at
+except ImportError as e:
+    pytest.skip(f"Módulo tab_scheduler não encontrado: {e}", allow_module_level=True)
+
+
+class FakeDriver:
+    """Driver com abas simuladas: cada aba tem o instante em que fica pronta."""
+
+    def __init__(self):
+        self.handles = ["main"]
+        self.current_window_handle = "main"
+        self.ready_at = {}
+        self.closed = []
+        self.timeouts = MagicMock(implicit_wait=0)
+        self.implicitly_wait = MagicMock()
+        self.switch_to = MagicMock()
+        self.switch_to.new_window.side_effect = self._new_window
+        self.switch_to.window.side_effect = self._switch
+
+    def _new_window(self, kind):
+        handle = f"tab{len(self.handles)}"
+        self.handles.append(handle)
+        self.current_window_handle = handle
+
+    def _switch(self, handle):
+        self.current_window_handle = handle
+
+    def close(self):
+        self.closed.append(self.current_window_handle)
+
+    def start_load(self, seconds):
+        """Simular navegação que termina em ``seconds``."""
+        self.ready_at[self.current_window_handle] = time.perf_counter() + seconds
+
+
+def loaded(driver):
+    """Condição: aba atual terminou de carregar."""
+    return time.perf_counter() >= driver.ready_at[driver.current_window_handle] and "ok"
+
+
+def task(load_seconds, pages=1):
+    """Tarefa que navega ``pages`` vezes e retorna as abas em que rodou."""
+
+    def steps(driver):
+        handles = []
+        for _ in range(pages):
+            driver.start_load(load_seconds)
+            yield loaded
+            handles.append(driver.current_window_handle)
+        return {"handles": handles, "success": True}
+
+    return steps
+
+
+def test_network_waits_overlap():
+    """Três abas de 0.3s terminam em ~0.3s, não ~0.9s; cada passo roda na sua aba."""
+    driver = FakeDriver()
+    start = time.perf_counter()
+
+    results = TabScheduler(driver, poll_interval=0.01).run(
+        {"a": task(0.3), "b": task(0.3), "c": task(0.3)}
+    )
+
+    assert time.perf_counter() - start < 0.6
+    assert [r["handles"] for r in results.values()] == [["main"], ["tab1"], ["tab2"]]
+    assert results["b"]["tab"]["wait_time"] >= 0.25
+    assert driver.closed == ["tab1", "tab2"]
+    assert driver.current_window_handle == "main"
+
+
+def test_ready_tab_served_first():
+    """Aba rápida conclui vários passos enquanto a lenta ainda carrega."""
+    driver = FakeDriver()
+
+    results = TabScheduler(driver, poll_interval=0.01).run(
+        {"lenta": task(0.4), "rapida": task(0.05, pages=3)}
+    )
+
+    assert results["rapida"]["tab"]["wall_time"] < results["lenta"]["tab"]["wall_time"]
+    assert results["rapida"]["tab"]["steps"] == 4
+
+
+def test_timeout_and_failure_isolated():
+    """Prazo esgotado ou erro em uma aba não afeta as demais."""
+
+    def broken(driver):
+        driver.start_load(0)
+        yield loaded
+        raise RuntimeError("seletor mudou")
+
+    driver = FakeDriver()
+    results = TabScheduler(driver, timeout=0.2, poll_interval=0.01).run(
+        {"lenta": task(5), "quebrada": broken, "ok": task(0.05)}
+    )
+
+    assert not results["lenta"]["success"]
+    assert results["quebrada"]["error"] == "seletor mudou"
+    assert results["ok"]["success"]
+
+
+class PageDriver:
+    """Aba única: a navegação só troca o documento quando ``load`` é chamado."""
+
+    def __init__(self, url):
+        self.current_url = url
+        self.window = {}
+        self.pending = None
+
+    def execute_script(self, script, *args):
+        if "window.location.href" in script:
+            self.window["__staleTabPage"] = True
+            self.pending = args[0]
+            return None
+        return not self.window.get("__staleTabPage")
+
+    def load(self):
+        self.current_url, self.window = self.pending, {}
+
+
+def test_page_at_ignores_document_being_replaced():
+    """Recarregar o mesmo endereço: o documento antigo não conta como pronto."""
+    url = "https://docs.python.org/3/"
+    driver = PageDriver(url)
+    ready = page_at(url)
+
+    navigate(driver, url)
+    assert not ready(driver)
+
+    driver.load()
+    assert ready(driver)
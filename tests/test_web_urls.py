@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Testes para as chaves derivadas de URLs.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from web_urls import host_of, origin_of
+except ImportError as e:
+    pytest.skip(f"Módulo web_urls não encontrado: {e}", allow_module_level=True)
+
+
+@pytest.mark.parametrize(
+    "url,origin",
+    [
+        ("https://www.google.com/search?q=x", "https://www.google.com"),
+        ("http://127.0.0.1:8000/forms/post", "http://127.0.0.1:8000"),
+        ("file:///tmp/output/test_form.html", None),
+        ("about:blank", None),
+        ("", None),
+    ],
+)
+def test_origin_of_http_pages_only(url, origin):
+    """Origem com porta para http(s); None para as demais páginas."""
+    assert origin_of(url) == origin
+
+
+def test_host_of_drops_port():
+    """Chave do limitador é o host, sem esquema nem porta."""
+    assert host_of("http://127.0.0.1:8000/x") == "127.0.0.1"
+    assert host_of("https://www.google.com/search") == "www.google.com"
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Testes para as esperas baseadas em condições (sem navegador real).
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+# Adicionar path para import
+project_root = Path(__file__).parent.parent
+examples_path = project_root / "examples" / "python_migrations"
+sys.path.insert(0, str(examples_path))
+
+try:
+    from web_waits import PageWaiter, element_stable
+except ImportError as e:
+    pytest.skip(f"Módulo web_waits não encontrado: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def waiter():
+    """PageWaiter com driver falso."""
+    return PageWaiter(MagicMock(), poll_frequency=0.01)
+
+
+def test_settle_returns_early_and_records_savings(waiter):
+    """Condição atendida encerra a espera antes do sleep nominal."""
+    waited = waiter.settle("etapa", 1.0, lambda driver: True)
+
+    assert waited < 0.5
+    assert waiter.pop_savings() > 0.5
+    assert waiter.pop_savings() == 0.0
+
+
+def test_settle_never_exceeds_nominal(waiter):
+    """Condição nunca atendida respeita o limite do sleep original."""
+    waited = waiter.settle("etapa", 0.1, lambda driver: False)
+
+    assert 0.1 <= waited < 0.5
+    assert waiter.savings["etapa"] < 0.05
+
+
+def test_skipped_step_counts_as_savings(waiter):
+    """Etapa pulada soma sua duração conhecida à economia da etapa."""
+    waiter.skip("cookies_consent", 20.0)
+    waiter.skip("cookies_consent", 20.0)
+
+    assert waiter.savings["cookies_consent"] == 40.0
+    assert waiter.pop_savings() == 40.0
+
+
+def test_element_stable_requires_two_equal_samples():
+    """Elemento só é estável quando o retângulo se repete."""
+    driver = MagicMock()
+    driver.execute_script.side_effect = [[0, 0, 10, 10], [0, 5, 10, 10], [0, 5, 10, 10]]
+    condition = element_stable(MagicMock())
+
+    assert [condition(driver) for _ in range(3)] == [False, False, True]
@@ -23,7 +23,12 @@ sys.path.insert(0, str(examples_path))
 
 # Imports do código testado
 try:
-    from window_automation import WindowAutomation, AutomationConfig
+    from window_automation import (
+        WORKBOOK_RESULT_HEADER,
+        AutomationConfig,
+        WindowAutomation,
+        normalize_formula,
+    )
 except ImportError as e:
     pytest.skip(f"Módulo window_automation não encontrado: {e}", allow_module_level=True)
 
@@ -286,6 +291,121 @@ class TestWindowAutomation:
             assert result["error"] == "Test error"
 
 
+class TestWorkbookMode:
+    """Fórmulas lidas de planilhas em streaming."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("=123+456", "123+456="),
+            (" 789 * 12 ", "789*12="),
+            (1000, "1000="),
+            (None, None),
+            ("", None),
+        ],
+    )
+    def test_normalize_formula(self, value, expected):
+        """Células viram teclas da calculadora; vazias são ignoradas."""
+        assert normalize_formula(value) == expected
+
+    @pytest.mark.parametrize("value", ["=SUM(A1:A3)", "abc", "1+1; rm", "(1+2)*3", "1,5+2"])
+    def test_rejects_non_arithmetic(self, value):
+        """Funções, referências e texto não são digitados na calculadora."""
+        with pytest.raises(ValueError):
+            normalize_formula(value)
+
+    @pytest.mark.asyncio
+    async def test_run_workbook_streams_rows(self, tmp_path):
+        """Planilha lida e escrita linha a linha, sem acumular em ``results``."""
+        openpyxl = pytest.importorskip("openpyxl")
+        source = tmp_path / "formulas.xlsx"
+        book = openpyxl.Workbook()
+        sheet = book.active
+        sheet.append(["Description", "Formula"])
+        sheet.append(["soma", "=1+2"])
+        sheet.append(["vazia", None])
+        sheet.append(["função", "=SUM(A1:A3)"])
+        sheet.append(["produto", "6*7"])
+        book.save(source)
+
+        with patch("window_automation.logger"):
+            automation = WindowAutomation(AutomationConfig(output_dir=tmp_path))
+
+        async def calculate(window, desc, formula):
+            return {"result": str(eval(formula[:-1])), "execution_time": 0.01, "success": True}
+
+        output = tmp_path / "resultados.xlsx"
+        with (
+            patch.object(automation, "_open_calculator"),
+            patch.object(automation, "_find_window", return_value=MagicMock()),
+            patch.object(automation, "_calculate", side_effect=calculate),
+            patch.object(automation, "_close_app"),
+        ):
+            report = await automation.run_workbook(source, output)
+
+        assert (report["rows"], report["successful"], report["failed"]) == (3, 2, 1)
+        assert report["skipped"] == 1 and report["rows_per_sec"] > 0
+        assert automation.results == []
+
+        rows = list(openpyxl.load_workbook(output, read_only=True).active.values)
+        assert rows[0][:4] == ("row", "description", "formula", "result")
+        assert [(r[0], r[3], r[4]) for r in rows[1:]] == [
+            (2, "3", True),
+            (4, None, False),
+            (5, "42", True),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_run_workbook_unknown_sheet_reports_error(self, tmp_path):
+        """Aba inexistente: erro original no relatório e planilha de saída só com cabeçalho."""
+        openpyxl = pytest.importorskip("openpyxl")
+        source = tmp_path / "formulas.xlsx"
+        openpyxl.Workbook().save(source)
+
+        with patch("window_automation.logger"):
+            automation = WindowAutomation(AutomationConfig(output_dir=tmp_path))
+            output = tmp_path / "resultados.xlsx"
+            report = await automation.run_workbook(source, output, sheet="Inexistente")
+
+        assert report["success"] is False and "Inexistente" in report["error"]
+        rows = list(openpyxl.load_workbook(output, read_only=True).active.values)
+        assert rows == [tuple(WORKBOOK_RESULT_HEADER)]
+
+    @pytest.mark.asyncio
+    async def test_run_workbook_interrupted_closes_app_and_saves(self, tmp_path):
+        """Interrupção no meio do laço: calculadora fechada e linhas calculadas gravadas."""
+        openpyxl = pytest.importorskip("openpyxl")
+        source = tmp_path / "formulas.xlsx"
+        book = openpyxl.Workbook()
+        book.active.append(["Formula"])
+        for formula in ("1+1", "2+2", "3+3"):
+            book.active.append([formula])
+        book.save(source)
+
+        with patch("window_automation.logger"):
+            automation = WindowAutomation(AutomationConfig(output_dir=tmp_path))
+
+        async def calculate(window, desc, formula):
+            if formula == "3+3=":
+                raise KeyboardInterrupt
+            return {"result": "ok", "execution_time": 0.01, "success": True}
+
+        window = MagicMock()
+        output = tmp_path / "resultados.xlsx"
+        with (
+            patch.object(automation, "_open_calculator"),
+            patch.object(automation, "_find_window", return_value=window),
+            patch.object(automation, "_calculate", side_effect=calculate),
+            patch.object(automation, "_close_app") as close_app,
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                await automation.run_workbook(source, output)
+
+        close_app.assert_awaited_once_with(window)
+        rows = list(openpyxl.load_workbook(output, read_only=True).active.values)
+        assert [r[0] for r in rows[1:]] == [2, 3]
+
+
 class TestIntegration:
     """Testes de integração mais realistas."""
 